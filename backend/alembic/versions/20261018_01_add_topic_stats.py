@@ -0,0 +1,147 @@
+"""Add denormalized topic stats
+
+Revision ID: 20261018_01_add_topic_stats
+Revises: 20260727_01_add_reports
+Create Date: 2026-10-18
+"""
+
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_01_add_topic_stats"
+down_revision = "20260727_01_add_reports"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _grouped_counts(bind, sql: str, topic_ids: list[int]) -> list:
+    statement = sa.text(sql).bindparams(sa.bindparam("topic_ids", expanding=True))
+    return bind.execute(statement, {"topic_ids": topic_ids}).all()
+
+
+def _backfill_topic_stats() -> None:
+    bind = op.get_bind()
+    topic_stats = sa.table(
+        "topic_stats",
+        sa.column("topic_id", sa.Integer()),
+        sa.column("vote_counts", sa.JSON()),
+        sa.column("like_count", sa.Integer()),
+        sa.column("comment_count", sa.Integer()),
+        sa.column("reply_count", sa.Integer()),
+    )
+    after_topic_id = 0
+
+    while True:
+        topics = bind.execute(
+            sa.text(
+                """
+                SELECT topic_id, vote_options FROM topics
+                WHERE topic_id > :after_topic_id
+                ORDER BY topic_id
+                LIMIT :limit
+                """
+            ),
+            {"after_topic_id": after_topic_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not topics:
+            break
+
+        topic_ids = [topic_id for topic_id, _ in topics]
+        vote_rows = _grouped_counts(
+            bind,
+            """
+            SELECT topic_id, vote_index, COUNT(vote_id) FROM votes
+            WHERE topic_id IN :topic_ids
+            GROUP BY topic_id, vote_index
+            """,
+            topic_ids,
+        )
+        like_counts = dict(
+            _grouped_counts(
+                bind,
+                """
+                SELECT topic_id, COUNT(like_id) FROM topic_likes
+                WHERE topic_id IN :topic_ids
+                GROUP BY topic_id
+                """,
+                topic_ids,
+            )
+        )
+        comment_counts = dict(
+            _grouped_counts(
+                bind,
+                """
+                SELECT topic_id, COUNT(*) FROM comments
+                WHERE topic_id IN :topic_ids AND is_deleted = 0 AND is_hidden = 0
+                GROUP BY topic_id
+                """,
+                topic_ids,
+            )
+        )
+        reply_counts = dict(
+            _grouped_counts(
+                bind,
+                """
+                SELECT comments.topic_id, COUNT(replies.reply_id) FROM replies
+                JOIN comments ON replies.comment_id = comments.comment_id
+                WHERE comments.topic_id IN :topic_ids
+                GROUP BY comments.topic_id
+                """,
+                topic_ids,
+            )
+        )
+
+        vote_counts_by_topic: dict[int, dict[int, int]] = {}
+        for topic_id, vote_index, count in vote_rows:
+            vote_counts_by_topic.setdefault(topic_id, {})[vote_index] = count
+
+        rows = []
+        for topic_id, vote_options in topics:
+            if isinstance(vote_options, str):
+                vote_options = json.loads(vote_options)
+            vote_counts = [0] * len(vote_options)
+            for vote_index, count in vote_counts_by_topic.get(topic_id, {}).items():
+                if vote_index >= len(vote_counts):
+                    vote_counts.extend([0] * (vote_index + 1 - len(vote_counts)))
+                vote_counts[vote_index] = count
+            rows.append(
+                {
+                    "topic_id": topic_id,
+                    "vote_counts": vote_counts,
+                    "like_count": like_counts.get(topic_id, 0),
+                    "comment_count": comment_counts.get(topic_id, 0),
+                    "reply_count": reply_counts.get(topic_id, 0),
+                }
+            )
+
+        op.bulk_insert(topic_stats, rows)
+        after_topic_id = topic_ids[-1]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "topic_stats",
+        sa.Column("topic_id", sa.Integer(), nullable=False),
+        sa.Column("vote_counts", sa.JSON(), nullable=False),
+        sa.Column("like_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("reply_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["topic_id"], ["topics.topic_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("topic_id"),
+    )
+    _backfill_topic_stats()
+
+
+def downgrade() -> None:
+    op.drop_table("topic_stats")
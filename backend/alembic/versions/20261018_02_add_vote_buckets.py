@@ -0,0 +1,47 @@
+"""Add per-minute vote buckets
+
+Revision ID: 20261018_02_add_vote_buckets
+Revises: 20261018_01_add_topic_stats
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_02_add_vote_buckets"
+down_revision = "20261018_01_add_topic_stats"
+branch_labels = None
+depends_on = None
+
+
+def _minute_expression(dialect: str) -> str:
+    if dialect == "mysql":
+        return "DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:00')"
+    return "strftime('%Y-%m-%d %H:%M:00', created_at)"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vote_buckets",
+        sa.Column("topic_id", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("vote_index", sa.Integer(), nullable=False),
+        sa.Column("vote_count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["topic_id"], ["topics.topic_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("topic_id", "bucket_start", "vote_index"),
+    )
+
+    minute = _minute_expression(op.get_bind().dialect.name)
+    op.execute(
+        f"""
+        INSERT INTO vote_buckets (topic_id, bucket_start, vote_index, vote_count)
+        SELECT topic_id, {minute}, vote_index, COUNT(*)
+        FROM votes
+        GROUP BY topic_id, {minute}, vote_index
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("vote_buckets")
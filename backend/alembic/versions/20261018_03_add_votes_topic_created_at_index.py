@@ -0,0 +1,26 @@
+"""Add votes (topic_id, created_at) index
+
+Revision ID: 20261018_03_add_votes_topic_created_at_index
+Revises: 20261018_02_add_vote_buckets
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "20261018_03_add_votes_topic_created_at_index"
+down_revision = "20261018_02_add_vote_buckets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_votes_topic_created_at",
+        "votes",
+        ["topic_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_votes_topic_created_at", table_name="votes")
@@ -0,0 +1,28 @@
+"""Add ngram FULLTEXT index for topic search
+
+Revision ID: 20261018_04_add_topics_fulltext_index
+Revises: 20261018_03_add_votes_topic_created_at_index
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "20261018_04_add_topics_fulltext_index"
+down_revision = "20261018_03_add_votes_topic_created_at_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ft_topics_title_description",
+        "topics",
+        ["title", "description"],
+        mysql_prefix="FULLTEXT",
+        mysql_with_parser="ngram",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ft_topics_title_description", table_name="topics")
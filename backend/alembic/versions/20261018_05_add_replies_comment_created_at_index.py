@@ -0,0 +1,29 @@
+"""Replace replies comment_id index with (comment_id, created_at)
+
+Revision ID: 20261018_05_add_replies_comment_created_at_index
+Revises: 20261018_04_add_topics_fulltext_index
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "20261018_05_add_replies_comment_created_at_index"
+down_revision = "20261018_04_add_topics_fulltext_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves per-comment reply previews and the keyset-paginated reply thread.
+    op.create_index(
+        "ix_replies_comment_created_at",
+        "replies",
+        ["comment_id", "created_at"],
+    )
+    op.drop_index("ix_replies_comment_id", table_name="replies")
+
+
+def downgrade() -> None:
+    op.create_index("ix_replies_comment_id", "replies", ["comment_id"])
+    op.drop_index("ix_replies_comment_created_at", table_name="replies")
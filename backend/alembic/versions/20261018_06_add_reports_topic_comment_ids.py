@@ -0,0 +1,52 @@
+"""Add denormalized topic_id/comment_id to reports
+
+Revision ID: 20261018_06_add_reports_topic_comment_ids
+Revises: 20261018_05_add_replies_comment_created_at_index
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_06_add_reports_topic_comment_ids"
+down_revision = "20261018_05_add_replies_comment_created_at_index"
+branch_labels = None
+depends_on = None
+
+
+def _snapshot_id(dialect: str, key: str) -> str:
+    if dialect == "mysql":
+        return f"CAST(JSON_UNQUOTE(JSON_EXTRACT(target_snapshot, '$.{key}')) AS UNSIGNED)"
+    return f"json_extract(target_snapshot, '$.{key}')"
+
+
+def upgrade() -> None:
+    op.add_column("reports", sa.Column("topic_id", sa.Integer(), nullable=True))
+    op.add_column("reports", sa.Column("comment_id", sa.Integer(), nullable=True))
+
+    dialect = op.get_bind().dialect.name
+    op.execute(
+        f"""
+        UPDATE reports
+        SET topic_id = CASE
+                WHEN target_type = 'topic' THEN target_id
+                ELSE {_snapshot_id(dialect, "topic_id")}
+            END,
+            comment_id = CASE
+                WHEN target_type = 'comment' THEN target_id
+                WHEN target_type = 'reply' THEN {_snapshot_id(dialect, "comment_id")}
+            END
+        """
+    )
+
+    # Serve related pending report lookups when a topic or comment is moderated.
+    op.create_index("ix_reports_status_topic_id", "reports", ["status", "topic_id"])
+    op.create_index("ix_reports_status_comment_id", "reports", ["status", "comment_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_status_comment_id", table_name="reports")
+    op.drop_index("ix_reports_status_topic_id", table_name="reports")
+    op.drop_column("reports", "comment_id")
+    op.drop_column("reports", "topic_id")
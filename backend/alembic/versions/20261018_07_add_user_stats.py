@@ -0,0 +1,60 @@
+"""Add user stats rollup
+
+Revision ID: 20261018_07_add_user_stats
+Revises: 20261018_06_add_reports_topic_comment_ids
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_07_add_user_stats"
+down_revision = "20261018_06_add_reports_topic_comment_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("topic_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("vote_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("likes_received", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO user_stats (user_id, topic_count, vote_count, likes_received)
+        SELECT
+            users.user_id,
+            (SELECT COUNT(*) FROM topics WHERE topics.user_id = users.user_id),
+            (SELECT COUNT(*) FROM votes WHERE votes.user_id = users.user_id),
+            (
+                SELECT COUNT(*) FROM topic_likes
+                JOIN topics ON topics.topic_id = topic_likes.topic_id
+                WHERE topics.user_id = users.user_id
+            ) + (
+                SELECT COUNT(*) FROM comment_likes
+                JOIN comments ON comments.comment_id = comment_likes.comment_id
+                WHERE comments.user_id = users.user_id
+            ) + (
+                SELECT COUNT(*) FROM reply_likes
+                JOIN replies ON replies.reply_id = reply_likes.reply_id
+                WHERE replies.user_id = users.user_id
+            )
+        FROM users
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_stats")
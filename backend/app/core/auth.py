@@ -1,6 +1,7 @@
 # backend/app/core/auth.py
 
 import secrets
+from dataclasses import dataclass
 from fastapi import Depends, Request, Response, HTTPException
 from jwt import ExpiredSignatureError, InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +13,33 @@ from typing import Optional
 
 ACCESS_TOKEN_EXPIRED_DETAIL = "access_token_expired"
 
+
+@dataclass(frozen=True)
+class AccessIdentity:
+    has_token: bool = False
+    user_id: int | None = None
+    error: InvalidTokenError | None = None
+
+
+def resolve_access_identity(request: Request) -> AccessIdentity:
+    """Verify the access cookie once per request and share the result on request.state."""
+    identity = getattr(request.state, "access_identity", None)
+    if identity is not None:
+        return identity
+
+    access_token = request.cookies.get("access_token")
+    if not access_token:
+        identity = AccessIdentity()
+    else:
+        try:
+            identity = AccessIdentity(has_token=True, user_id=verify_token(access_token))
+        except InvalidTokenError as exc:
+            identity = AccessIdentity(has_token=True, error=exc)
+
+    request.state.access_identity = identity
+    return identity
+
+
 def _cookie_policy() -> dict:
     if settings.prod:
         if not settings.cookie_domain:
@@ -89,30 +117,21 @@ def clear_cookie_with_policy(response: Response, *, key: str, httponly: bool) ->
     )
 
 async def get_user_id(request: Request) -> int:
-    access_token = request.cookies.get("access_token")
-    if not access_token:
+    identity = resolve_access_identity(request)
+    if not identity.has_token:
         raise HTTPException(status_code=401, detail="Access token missing")
 
-    try:
-        user_id = verify_token(access_token)
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Malformed token: no UID")
-        return user_id
-    except ExpiredSignatureError:
+    if isinstance(identity.error, ExpiredSignatureError):
         raise HTTPException(status_code=401, detail=ACCESS_TOKEN_EXPIRED_DETAIL)
-    except InvalidTokenError:
+    if identity.error is not None:
         raise HTTPException(status_code=401, detail="Invalid access token")
+    if identity.user_id is None:
+        raise HTTPException(status_code=401, detail="Malformed token: no UID")
+    return identity.user_id
     
 
 async def get_user_id_optional(request: Request) -> Optional[int]:
-    access_token = request.cookies.get("access_token")
-    if not access_token:
-        return None
-
-    try:
-        return verify_token(access_token)
-    except (ExpiredSignatureError, InvalidTokenError):
-        return None
+    return resolve_access_identity(request).user_id
 
 
 async def require_admin_user_id(
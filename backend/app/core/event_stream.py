@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Queued in place of dropped events when a connection falls behind.
+RESET_EVENT = {"event": "reset", "data": {}}
+
+SSE_RETRY = "retry: 5000\n\n"
+SSE_PING = ": ping\n\n"
+
+
+class EventSubscription:
+    """A bounded per-connection event queue for a Server-Sent Events stream."""
+
+    def __init__(self, key: int, max_queue_size: int):
+        self.key = key
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue_size)
+
+    def deliver(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Bound per-connection memory: drop the backlog and tell the client to refetch.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESET_EVENT)
+
+
+async def listen_channel(
+    redis_client: Any, channel: str, handle: Callable[[Any], None]
+) -> None:
+    """Pass every JSON message published on ``channel`` to ``handle``, reconnecting on errors."""
+    while True:
+        try:
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(channel)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    handle(json.loads(message["data"]))
+            finally:
+                await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("%s subscriber failed; reconnecting", channel)
+            await asyncio.sleep(1)
+
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def iter_events(
+    subscription: EventSubscription, heartbeat_seconds: float
+) -> AsyncIterator[dict | None]:
+    """Yield queued events, or None after ``heartbeat_seconds`` without one."""
+    while True:
+        try:
+            yield await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat_seconds)
+        except asyncio.TimeoutError:
+            yield None
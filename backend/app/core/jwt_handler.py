@@ -1,4 +1,9 @@
+import hashlib
+import threading
+import time
 import uuid
+from collections import OrderedDict
+
 import jwt
 from datetime import datetime, timedelta, timezone
 from passlib.context import CryptContext
@@ -30,12 +35,70 @@ def create_refresh_token(uid: int) -> str:
         uid=uid, jti=str(uuid.uuid4()), expires_delta=settings.refresh_token_expire
     )
 
+class TokenClaimsCache:
+    """Bounded LRU of verified token claims, keyed by token digest.
+
+    Only successfully verified tokens are stored, and an entry is dropped once its
+    ``exp`` passes so expiry is still reported by ``jwt.decode``.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(claims)
+
+    def set(self, token: str, claims: dict) -> None:
+        expires_at = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+token_claims_cache = TokenClaimsCache(settings.jwt_cache_max_size)
+
+
 def decode_token(token: str) -> dict:
-    return jwt.decode(
+    claims = token_claims_cache.get(token)
+    if claims is not None:
+        return claims
+
+    claims = jwt.decode(
         token,
         settings.secret_key,
         algorithms=[settings.jwt_algorithm],
     )
+    token_claims_cache.set(token, claims)
+    return claims
 
 def verify_token(token: str) -> int:
     payload = decode_token(token)
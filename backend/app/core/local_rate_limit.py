@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+
+from app.core.settings import settings
+from app.metrics import rate_limit_circuit_open
+
+
+class LocalTokenBucketLimiter:
+    """Per-process token buckets used while Redis is unavailable.
+
+    Each bucket holds ``limit`` tokens and refills at ``limit / window_seconds``
+    per second. Least recently used identities are evicted past ``max_keys``.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, int]:
+        now = time.monotonic()
+        refill_per_second = limit / window_seconds
+        tokens, updated_at = self._buckets.pop(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - updated_at) * refill_per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        if allowed:
+            return True, 0
+        return False, max(1, math.ceil((1 - tokens) / refill_per_second))
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class CircuitBreaker:
+    """Stops calling Redis after repeated failures and probes it again after a cooldown."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.reset()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_seconds:
+            return False
+        # Half-open: restart the cooldown so only this request probes Redis.
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> bool:
+        """Close the circuit; returns True when it was open (Redis just recovered)."""
+        recovered = self.is_open
+        self.reset()
+        return recovered
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.is_open or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            rate_limit_circuit_open.set(1)
+
+    def reset(self) -> None:
+        self._failures = 0
+        self._opened_at: float | None = None
+        rate_limit_circuit_open.set(0)
+
+
+local_rate_limiter = LocalTokenBucketLimiter(max_keys=settings.rate_limit_local_max_keys)
+redis_circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.rate_limit_breaker_failure_threshold,
+    reset_seconds=settings.rate_limit_breaker_reset_seconds,
+)
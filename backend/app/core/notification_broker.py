@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from app.core.event_stream import EventSubscription, listen_channel
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "notifications:events"
+
+
+class NotificationSubscription(EventSubscription):
+    @property
+    def user_id(self) -> int:
+        return self.key
+
+
+class NotificationBroker:
+    """Fans notification events out to this process's stream subscribers.
+
+    With Redis, events are published to ``EVENTS_CHANNEL`` and every replica
+    delivers them to its own subscribers; without Redis delivery is in-process.
+    """
+
+    def __init__(self):
+        self.redis_client: Any | None = None
+        self._subscriptions: dict[int, set[NotificationSubscription]] = {}
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.redis_client is not None or bool(self._subscriptions)
+
+    def subscribe(self, user_id: int) -> NotificationSubscription | None:
+        """Return None when the user already has the maximum number of streams open."""
+        subscriptions = self._subscriptions.setdefault(user_id, set())
+        if len(subscriptions) >= settings.notification_stream_max_connections_per_user:
+            if not subscriptions:
+                del self._subscriptions[user_id]
+            return None
+        subscription = NotificationSubscription(
+            user_id, settings.notification_stream_queue_size
+        )
+        subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: NotificationSubscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    async def publish(self, user_ids: list[int], event: dict) -> None:
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.publish(
+                    EVENTS_CHANNEL, json.dumps({"user_ids": user_ids, "event": event})
+                )
+                return
+            except Exception:
+                logger.exception("notification publish failed; delivering locally only")
+        self.deliver(user_ids, event)
+
+    def deliver(self, user_ids: list[int], event: dict) -> None:
+        if not self._subscriptions:
+            return
+        for user_id in user_ids:
+            for subscription in self._subscriptions.get(user_id, ()):
+                subscription.deliver(event)
+
+    def start(self, redis_client: Any | None) -> None:
+        self.redis_client = redis_client
+        if redis_client is not None and self._listener is None:
+            self._listener = asyncio.create_task(
+                listen_channel(redis_client, EVENTS_CHANNEL, self._deliver_payload),
+                name="notification-broker",
+            )
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.redis_client = None
+
+    def _deliver_payload(self, payload: dict) -> None:
+        self.deliver(payload["user_ids"], payload["event"])
+
+
+notification_broker = NotificationBroker()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from app.core.redis import run_script
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+INCREMENT_CHUNK_SIZE = 1000
+
+# Counters that are not cached stay absent; the next read recounts from the database.
+INCREMENT_EXISTING_SCRIPT = """
+for index, key in ipairs(KEYS) do
+    if redis.call("EXISTS", key) == 1 then
+        if redis.call("INCRBY", key, ARGV[index]) < 0 then
+            redis.call("DEL", key)
+        end
+    end
+end
+return #KEYS
+"""
+
+
+class UnreadNotificationCounter:
+    """Per-user unread notification counts cached in Redis.
+
+    Each counter expires after ``NOTIFICATION_UNREAD_COUNTER_TTL_SECONDS`` and is
+    then recounted from the database, which reconciles any drift.
+    """
+
+    def __init__(self):
+        self.redis_client: Any | None = None
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        return f"notification_unread:{user_id}"
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis_client is not None and settings.notification_unread_counter_enabled
+
+    async def get(self, user_id: int) -> int | None:
+        if not self.enabled:
+            return None
+        try:
+            raw = await self.redis_client.get(self.key(user_id))
+        except Exception:
+            logger.exception("unread notification counter lookup failed")
+            return None
+        return int(raw) if raw is not None else None
+
+    async def prime(self, user_id: int, count: int) -> None:
+        if not self.enabled:
+            return
+        try:
+            # NX: an increment applied since the recount started must not be overwritten.
+            await self.redis_client.set(
+                self.key(user_id),
+                count,
+                nx=True,
+                ex=settings.notification_unread_counter_ttl_seconds,
+            )
+        except Exception:
+            logger.exception("unread notification counter store failed")
+
+    async def reset(self, user_ids: set[int]) -> None:
+        for user_id in user_ids:
+            await self.redis_client.set(
+                self.key(user_id), 0, ex=settings.notification_unread_counter_ttl_seconds
+            )
+
+    async def increment(self, deltas: list[tuple[int, int]]) -> None:
+        for start in range(0, len(deltas), INCREMENT_CHUNK_SIZE):
+            chunk = [item for item in deltas[start : start + INCREMENT_CHUNK_SIZE] if item[1]]
+            if chunk:
+                await run_script(
+                    self.redis_client,
+                    INCREMENT_EXISTING_SCRIPT,
+                    [self.key(user_id) for user_id, _ in chunk],
+                    [delta for _, delta in chunk],
+                )
+
+
+unread_notification_counter = UnreadNotificationCounter()
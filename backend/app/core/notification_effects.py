@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import Select, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.notification_broker import notification_broker
+from app.core.notification_counter import unread_notification_counter
+
+logger = logging.getLogger(__name__)
+
+PENDING_INFO_KEY = "notification_effects"
+RECIPIENT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class _PendingEffects:
+    deltas: dict[int, int] = field(default_factory=dict)
+    resets: set[int] = field(default_factory=set)
+    events: list[tuple[int, dict]] = field(default_factory=list)
+    recipients: list[tuple[Select, dict]] = field(default_factory=list)
+
+
+class NotificationEffects:
+    """Applies unread counter changes and stream events once a session commits.
+
+    Changes are recorded on ``session.info`` while the transaction is open and
+    discarded on rollback, so uncommitted notifications are never counted or pushed.
+    """
+
+    def __init__(self):
+        self._tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def _enabled() -> bool:
+        return unread_notification_counter.enabled or notification_broker.active
+
+    def _pending(self, db: AsyncSession | Session) -> _PendingEffects | None:
+        if not self._enabled():
+            return None
+        return db.info.setdefault(PENDING_INFO_KEY, _PendingEffects())
+
+    def created(self, db: AsyncSession | Session, user_id: int, payload: dict) -> None:
+        pending = self._pending(db)
+        if pending is not None:
+            pending.deltas[user_id] = pending.deltas.get(user_id, 0) + 1
+            pending.events.append((user_id, {"event": "notification", "data": payload}))
+
+    def bulk_created(self, db: AsyncSession | Session, user_ids: Select, payload: dict) -> None:
+        """Count and push ``payload`` for every user_id returned by ``user_ids``."""
+        pending = self._pending(db)
+        if pending is not None:
+            pending.recipients.append((user_ids, {"event": "notification", "data": payload}))
+
+    def read(self, db: AsyncSession | Session, user_id: int) -> None:
+        pending = self._pending(db)
+        if pending is not None:
+            pending.deltas[user_id] = pending.deltas.get(user_id, 0) - 1
+
+    def read_all(self, db: AsyncSession | Session, user_id: int) -> None:
+        pending = self._pending(db)
+        if pending is not None:
+            pending.deltas.pop(user_id, None)
+            pending.resets.add(user_id)
+
+    async def wait_pending(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(PENDING_INFO_KEY, None)
+        if pending is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._apply(pending, session.get_bind()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(PENDING_INFO_KEY, None)
+
+    async def _apply(self, pending: _PendingEffects, bind) -> None:
+        counter_enabled = unread_notification_counter.enabled
+        try:
+            if counter_enabled:
+                await unread_notification_counter.reset(pending.resets)
+                await unread_notification_counter.increment(list(pending.deltas.items()))
+            # Counters first, so a client reacting to an event reads the new count.
+            for user_id, stream_event in pending.events:
+                await notification_broker.publish([user_id], stream_event)
+
+            if pending.recipients:
+                # Stream recipients on a separate connection; the committing session
+                # may already be running its next transaction.
+                async with AsyncEngine(bind).connect() as conn:
+                    for query, stream_event in pending.recipients:
+                        result = await conn.stream(query)
+                        async for rows in result.partitions(RECIPIENT_CHUNK_SIZE):
+                            user_ids = [user_id for (user_id,) in rows]
+                            if counter_enabled:
+                                await unread_notification_counter.increment(
+                                    [(user_id, 1) for user_id in user_ids]
+                                )
+                            await notification_broker.publish(user_ids, stream_event)
+        except Exception:
+            logger.exception("applying notification side effects failed")
+
+
+notification_effects = NotificationEffects()
+
+event.listen(Session, "after_commit", notification_effects._after_commit)
+event.listen(Session, "after_rollback", notification_effects._after_rollback)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
+
+
+def decode_keyset_cursor(cursor: str, *, expected: dict[str, Any], leading: int) -> list:
+    """Decode a keyset cursor whose ``values`` are ``[*leading ints, created_at, id]``.
+
+    Every ``expected`` field (sort, status, ...) must match the current request; the
+    decoded values come back with ``created_at`` parsed for ``keyset_filter``.
+    """
+    payload = decode_cursor(cursor)
+    values = payload.get("values")
+    if (
+        any(payload.get(field) != value for field, value in expected.items())
+        or not isinstance(values, list)
+        or len(values) != leading + 2
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    *leading_values, created_at, row_id = values
+    try:
+        created_at = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not all(
+        isinstance(value, int) and not isinstance(value, bool)
+        for value in [*leading_values, row_id]
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return [*leading_values, created_at, row_id]
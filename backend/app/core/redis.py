@@ -1,29 +1,45 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
 import logging
+from functools import lru_cache
 from typing import Any
 
 from app.core.settings import settings
 
+try:
+    from redis.exceptions import NoScriptError
+except ImportError:  # pragma: no cover - redis is optional; without it no client exists.
+    class NoScriptError(Exception):
+        pass
+
 logger = logging.getLogger(__name__)
 
 
 async def create_redis_client() -> Any | None:
-    if not settings.rate_limit_enabled:
+    if not (
+        settings.rate_limit_enabled
+        or settings.topic_cache_enabled
+        or settings.notification_unread_counter_enabled
+    ):
         return None
 
     try:
         from redis.asyncio import Redis
     except ImportError:
-        logger.warning("redis package is not installed; rate limiting is disabled")
+        logger.warning(
+            "redis package is not installed; redis-backed rate limiting and caches are disabled"
+        )
         return None
 
     try:
         client = Redis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
         await client.ping()
     except Exception:
-        logger.exception("failed to connect to redis; rate limiting is disabled")
+        logger.exception(
+            "failed to connect to redis; redis-backed rate limiting and caches are disabled"
+        )
         return None
 
     return client
@@ -39,4 +55,20 @@ async def close_redis_client(client: Any | None) -> None:
 
     result = close()
     if inspect.isawaitable(result):
-        await result
\ No newline at end of file
+        await result
+
+
+@lru_cache(maxsize=None)
+def script_sha(source: str) -> str:
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+async def run_script(redis_client: Any, source: str, keys: list[str], args: list) -> Any:
+    """Run a Lua script by SHA, loading it only when Redis answers NOSCRIPT."""
+    sha = script_sha(source)
+    try:
+        return await redis_client.evalsha(sha, len(keys), *keys, *args)
+    except NoScriptError:
+        # Script cache is empty after a Redis restart or failover; load once and retry.
+        await redis_client.script_load(source)
+        return await redis_client.evalsha(sha, len(keys), *keys, *args)
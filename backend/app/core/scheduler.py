@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.redis import run_script
+from app.core.settings import settings
+from app.db.crud import TopicCrud
+from app.db.schemas.notifications import ClosedTopicNotificationDispatchResponse
+from app.metrics import (
+    closed_topic_notification_backlog,
+    closed_topic_notification_dispatch_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_LOCK_NAME = "waggle:closed_topic_notification_dispatch"
+
+# Dispatches notifications for up to ``limit`` closed topics as of ``now``.
+DispatchClosedTopics = Callable[..., Awaitable[ClosedTopicNotificationDispatchResponse]]
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class ClosedTopicNotificationScheduler:
+    """Polls for closed topics and dispatches their notifications in the background.
+
+    Only one replica dispatches at a time: the lock is a Redis key when Redis is
+    available, a MySQL ``GET_LOCK`` advisory lock otherwise.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        engine: AsyncEngine,
+        dispatch: DispatchClosedTopics,
+        redis_client: Any | None = None,
+        *,
+        interval_seconds: float | None = None,
+        topics_per_run: int | None = None,
+        lock_ttl_seconds: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.engine = engine
+        self.dispatch = dispatch
+        self.redis_client = redis_client
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else settings.closed_topic_scheduler_interval_seconds
+        )
+        self.topics_per_run = topics_per_run or settings.closed_topic_scheduler_topics_per_run
+        self.lock_ttl_seconds = (
+            lock_ttl_seconds or settings.closed_topic_scheduler_lock_ttl_seconds
+        )
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="closed-topic-notifications")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def run_once(self) -> ClosedTopicNotificationDispatchResponse | None:
+        """Dispatch one bounded run; returns None when another replica holds the lock."""
+        async with self._dispatch_lock() as acquired:
+            if not acquired:
+                return None
+
+            now = datetime.now(timezone.utc)
+            started_at = time.perf_counter()
+            async with self.session_factory() as db:
+                backlog = await TopicCrud.count_closed_without_notifications(db, now=now)
+                closed_topic_notification_backlog.set(backlog)
+                result = await self.dispatch(db, now=now, limit=self.topics_per_run)
+            closed_topic_notification_dispatch_seconds.set(time.perf_counter() - started_at)
+            closed_topic_notification_backlog.set(max(backlog - result.processed_topics, 0))
+            return result
+
+    def next_delay(
+        self, result: ClosedTopicNotificationDispatchResponse | None, duration: float
+    ) -> float:
+        # A full run means backlog remains: continue sooner, but rest at least as long
+        # as the run took so large backlogs never keep the database busy back to back.
+        if result is not None and result.processed_topics >= self.topics_per_run:
+            return min(self.interval_seconds, max(duration, 1.0))
+        return self.interval_seconds
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            started_at = time.perf_counter()
+            result = None
+            try:
+                result = await self.run_once()
+            except Exception:
+                logger.exception("closed topic notification dispatch failed")
+
+            delay = self.next_delay(result, time.perf_counter() - started_at)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    @asynccontextmanager
+    async def _dispatch_lock(self) -> AsyncIterator[bool]:
+        if self.redis_client is not None:
+            token = uuid.uuid4().hex
+            acquired = await self.redis_client.set(
+                DISPATCH_LOCK_NAME, token, nx=True, ex=self.lock_ttl_seconds
+            )
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired:
+                    await run_script(
+                        self.redis_client, RELEASE_LOCK_SCRIPT, [DISPATCH_LOCK_NAME], [token]
+                    )
+            return
+
+        if self.engine.dialect.name != "mysql":
+            yield True
+            return
+
+        # GET_LOCK is bound to the connection, so hold a dedicated one for the whole run.
+        async with self.engine.connect() as conn:
+            acquired = (
+                await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": DISPATCH_LOCK_NAME})
+            ).scalar() == 1
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    await conn.execute(
+                        text("SELECT RELEASE_LOCK(:name)"), {"name": DISPATCH_LOCK_NAME}
+                    )
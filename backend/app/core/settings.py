@@ -8,6 +8,18 @@ class Settings(BaseSettings):
     db_host: str = Field("localhost", alias="DB_HOST")
     db_port: str = Field("3306", alias="DB_PORT")
     db_name: str = Field(..., alias="DB_NAME")
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(30, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(1800, alias="DB_POOL_RECYCLE_SECONDS")
+    replica_database_urls: str = Field("", alias="REPLICA_DATABASE_URLS")
+    replica_health_check_interval_seconds: float = Field(
+        5, alias="REPLICA_HEALTH_CHECK_INTERVAL_SECONDS"
+    )
+    replica_health_check_timeout_seconds: float = Field(
+        1, alias="REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS"
+    )
+    read_your_writes_seconds: int = Field(5, alias="READ_YOUR_WRITES_SECONDS")
     prod: bool = Field(False, alias="PROD")
     cookie_domain: str | None = Field(None, alias="COOKIE_DOMAIN")
 
@@ -15,6 +27,7 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     access_token_expire_seconds: int = Field(900, alias="ACCESS_TOKEN_EXPIRE")
     refresh_token_expire_seconds: int = Field(604800, alias="REFRESH_TOKEN_EXPIRE")
+    jwt_cache_max_size: int = Field(4096, alias="JWT_CACHE_MAX_SIZE")
 
     admin_username: str | None = Field(None, alias="ADMIN_USERNAME")
     admin_password: str | None = Field(None, alias="ADMIN_PASSWORD")
@@ -36,7 +49,60 @@ class Settings(BaseSettings):
     redis_url: str = Field("redis://localhost:6379/0", alias="REDIS_URL")
     rate_limit_enabled: bool = Field(True, alias="RATE_LIMIT_ENABLED")
     rate_limit_fail_open: bool = Field(True, alias="RATE_LIMIT_FAIL_OPEN")
+    rate_limit_local_fallback_enabled: bool = Field(
+        True, alias="RATE_LIMIT_LOCAL_FALLBACK_ENABLED"
+    )
+    rate_limit_local_max_keys: int = Field(10000, alias="RATE_LIMIT_LOCAL_MAX_KEYS")
+    rate_limit_redis_timeout_seconds: float = Field(
+        0.2, alias="RATE_LIMIT_REDIS_TIMEOUT_SECONDS"
+    )
+    rate_limit_breaker_failure_threshold: int = Field(
+        3, alias="RATE_LIMIT_BREAKER_FAILURE_THRESHOLD"
+    )
+    rate_limit_breaker_reset_seconds: float = Field(
+        30, alias="RATE_LIMIT_BREAKER_RESET_SECONDS"
+    )
+    topic_cache_enabled: bool = Field(True, alias="TOPIC_CACHE_ENABLED")
+    topic_cache_ttl_seconds: int = Field(30, alias="TOPIC_CACHE_TTL_SECONDS")
+    notification_unread_counter_enabled: bool = Field(
+        True, alias="NOTIFICATION_UNREAD_COUNTER_ENABLED"
+    )
+    notification_unread_counter_ttl_seconds: int = Field(
+        600, alias="NOTIFICATION_UNREAD_COUNTER_TTL_SECONDS"
+    )
+    notification_stream_heartbeat_seconds: float = Field(
+        15, alias="NOTIFICATION_STREAM_HEARTBEAT_SECONDS"
+    )
+    notification_stream_queue_size: int = Field(100, alias="NOTIFICATION_STREAM_QUEUE_SIZE")
+    notification_stream_max_connections_per_user: int = Field(
+        3, alias="NOTIFICATION_STREAM_MAX_CONNECTIONS_PER_USER"
+    )
+    vote_stream_flush_interval_seconds: float = Field(
+        0.5, alias="VOTE_STREAM_FLUSH_INTERVAL_SECONDS"
+    )
+    vote_stream_heartbeat_seconds: float = Field(15, alias="VOTE_STREAM_HEARTBEAT_SECONDS")
+    vote_stream_queue_size: int = Field(100, alias="VOTE_STREAM_QUEUE_SIZE")
+    vote_stream_max_subscribers: int = Field(10000, alias="VOTE_STREAM_MAX_SUBSCRIBERS")
+    closed_topic_scheduler_enabled: bool = Field(
+        True, alias="CLOSED_TOPIC_SCHEDULER_ENABLED"
+    )
+    closed_topic_scheduler_interval_seconds: float = Field(
+        60, alias="CLOSED_TOPIC_SCHEDULER_INTERVAL_SECONDS"
+    )
+    closed_topic_scheduler_topics_per_run: int = Field(
+        100, alias="CLOSED_TOPIC_SCHEDULER_TOPICS_PER_RUN"
+    )
+    closed_topic_scheduler_lock_ttl_seconds: int = Field(
+        300, alias="CLOSED_TOPIC_SCHEDULER_LOCK_TTL_SECONDS"
+    )
     performance_debug_enabled: bool = Field(False, alias="PERFORMANCE_DEBUG_ENABLED")
+    query_profile_enabled: bool = Field(True, alias="QUERY_PROFILE_ENABLED")
+    query_profile_sample_rate: float = Field(0.1, alias="QUERY_PROFILE_SAMPLE_RATE")
+    slow_query_threshold_ms: float = Field(200, alias="SLOW_QUERY_THRESHOLD_MS")
+    slow_query_explain_enabled: bool = Field(True, alias="SLOW_QUERY_EXPLAIN_ENABLED")
+    slow_query_explain_interval_seconds: float = Field(
+        300, alias="SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -56,6 +122,10 @@ class Settings(BaseSettings):
     @property
     def sync_database_url(self) -> str:
         return f"mysql+pymysql://{self.tmp_db}"
+
+    @property
+    def replica_database_url_list(self) -> list[str]:
+        return [url.strip() for url in self.replica_database_urls.split(",") if url.strip()]
     
     @property
     def access_token_expire(self) -> timedelta:
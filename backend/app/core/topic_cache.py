@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+from fastapi import Request
+
+from app.core.settings import settings
+from app.metrics import topic_cache_hits_total, topic_cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "topic_cache"
+
+# Topic membership changes (create/delete/hide) affect both lists and counts, while
+# vote/like writes only change the totals rendered inside list pages.
+TOPICS_NAMESPACE = "topics"
+STATS_NAMESPACE = "stats"
+
+CACHE_NAMESPACES = {
+    "list": (TOPICS_NAMESPACE, STATS_NAMESPACE),
+    "count": (TOPICS_NAMESPACE,),
+}
+
+
+def get_redis_client(request: Request) -> Any | None:
+    return getattr(request.app.state, "redis_client", None)
+
+
+class TopicListCache:
+    @staticmethod
+    async def get(
+        redis_client: Any | None, cache: str, params: dict[str, Any]
+    ) -> tuple[Any | None, str | None]:
+        """Return ``(value, key)``; on a miss, store the page under ``key`` via ``set``.
+
+        The key carries the versions read before the database query, so a write that
+        lands while the page is being built orphans the page instead of adopting it.
+        """
+        if redis_client is None or not settings.topic_cache_enabled:
+            return None, None
+
+        try:
+            key = await TopicListCache._build_key(redis_client, cache, params)
+            raw = await redis_client.get(key)
+        except Exception:
+            logger.exception("topic cache lookup failed; reading from database")
+            return None, None
+
+        if raw is None:
+            topic_cache_misses_total.labels(cache=cache).inc()
+            return None, key
+
+        topic_cache_hits_total.labels(cache=cache).inc()
+        return json.loads(raw), key
+
+    @staticmethod
+    async def set(redis_client: Any | None, key: str | None, value: Any) -> None:
+        if redis_client is None or key is None or not settings.topic_cache_enabled:
+            return
+
+        try:
+            await redis_client.set(
+                key,
+                json.dumps(value, separators=(",", ":"), default=str),
+                ex=settings.topic_cache_ttl_seconds,
+            )
+        except Exception:
+            logger.exception("topic cache store failed")
+
+    @staticmethod
+    async def invalidate(
+        redis_client: Any | None, *, topics: bool = False, stats: bool = False
+    ) -> None:
+        if redis_client is None:
+            return
+
+        namespaces = []
+        if topics:
+            namespaces.append(TOPICS_NAMESPACE)
+        if stats:
+            namespaces.append(STATS_NAMESPACE)
+
+        # Bumping a version orphans every key stamped with the old one; the orphans
+        # simply age out through their TTL.
+        for namespace in namespaces:
+            try:
+                await redis_client.incr(TopicListCache._version_key(namespace))
+            except Exception:
+                logger.exception("topic cache invalidation failed for %s", namespace)
+
+    @staticmethod
+    async def _build_key(redis_client: Any, cache: str, params: dict[str, Any]) -> str:
+        namespaces = CACHE_NAMESPACES[cache]
+        versions = await redis_client.mget(
+            [TopicListCache._version_key(namespace) for namespace in namespaces]
+        )
+        stamp = ":".join(f"{namespace}{version or 0}" for namespace, version in zip(namespaces, versions))
+        normalized = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{cache}:{stamp}:{digest}"
+
+    @staticmethod
+    def _version_key(namespace: str) -> str:
+        return f"{KEY_PREFIX}:version:{namespace}"
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import Counter
+from typing import Any
+
+from app.core.event_stream import EventSubscription, listen_channel
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+DELTAS_CHANNEL = "votes:deltas"
+
+
+class VoteStreamHub:
+    """Coalesces vote count deltas per topic and fans them out to live result streams.
+
+    Votes recorded within one flush interval are merged into a single
+    ``vote_delta`` event per topic. With Redis, each flush is one PUBLISH on
+    ``DELTAS_CHANNEL`` and every replica delivers it to its own subscribers.
+    """
+
+    def __init__(self):
+        self.redis_client: Any | None = None
+        self._subscriptions: dict[int, set[EventSubscription]] = {}
+        self._subscriber_count = 0
+        self._pending: dict[int, Counter[int]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._subscriber_count
+
+    def subscribe(self, topic_id: int) -> EventSubscription | None:
+        """Return None when this replica already serves the maximum number of streams."""
+        if self._subscriber_count >= settings.vote_stream_max_subscribers:
+            return None
+        subscription = EventSubscription(topic_id, settings.vote_stream_queue_size)
+        self._subscriptions.setdefault(topic_id, set()).add(subscription)
+        self._subscriber_count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.key)
+        if subscriptions is None or subscription not in subscriptions:
+            return
+        subscriptions.discard(subscription)
+        self._subscriber_count -= 1
+        if not subscriptions:
+            del self._subscriptions[subscription.key]
+
+    def record(self, topic_id: int, vote_index: int) -> None:
+        """Queue a committed vote for the next flush."""
+        # Other replicas may have viewers, so only skip when nothing can listen.
+        if self.redis_client is None and topic_id not in self._subscriptions:
+            return
+        self._pending.setdefault(topic_id, Counter())[vote_index] += 1
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later(), name="vote-stream-flush")
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        events = [
+            {
+                "topic_id": topic_id,
+                "deltas": {str(vote_index): count for vote_index, count in sorted(deltas.items())},
+            }
+            for topic_id, deltas in pending.items()
+        ]
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.publish(DELTAS_CHANNEL, json.dumps(events))
+                return
+            except Exception:
+                logger.exception("vote delta publish failed; delivering locally only")
+        self.deliver(events)
+
+    def deliver(self, events: list[dict]) -> None:
+        for data in events:
+            event = {"event": "vote_delta", "data": data}
+            for subscription in self._subscriptions.get(data["topic_id"], ()):
+                subscription.deliver(event)
+
+    def start(self, redis_client: Any | None) -> None:
+        self.redis_client = redis_client
+        if redis_client is not None and self._listener is None:
+            self._listener = asyncio.create_task(
+                listen_channel(redis_client, DELTAS_CHANNEL, self.deliver), name="vote-stream"
+            )
+
+    async def stop(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.redis_client = None
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(settings.vote_stream_flush_interval_seconds)
+        finally:
+            self._flush_task = None
+        await self.flush()
+
+
+vote_stream_hub = VoteStreamHub()
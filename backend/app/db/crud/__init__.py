@@ -1,6 +1,9 @@
 from .user import UserCrud
+from .user_stats import UserStatsCrud
 from .topic import TopicCrud
+from .topic_stats import TopicStatsCrud
 from .vote import VoteCrud
+from .vote_bucket import VoteBucketCrud
 from .comment import CommentCrud
 from .reply import ReplyCrud
 from .like import LikeCrud
@@ -9,3 +12,4 @@ from .inquiry import InquiryCrud
 from .admin_action_log import AdminActionLogCrud
 from .notification import NotificationCrud
 from .report import ReportCrud
+from .bulk_keys import select_by_keys
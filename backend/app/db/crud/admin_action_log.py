@@ -3,6 +3,7 @@ from datetime import datetime
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.crud.bulk_keys import select_by_keys
 from app.db.models import AdminActionLog
 
 
@@ -68,21 +69,21 @@ class AdminActionLogCrud:
         target_type: str,
         target_ids: list[int],
     ) -> dict[int, str]:
-        if not target_ids:
-            return {}
-
-        result = await db.execute(
-            select(AdminActionLog)
+        rows = await select_by_keys(
+            db,
+            select(AdminActionLog.target_id, AdminActionLog.reason)
             .where(
                 AdminActionLog.action == action,
                 AdminActionLog.target_type == target_type,
-                AdminActionLog.target_id.in_(target_ids),
             )
-            .order_by(desc(AdminActionLog.created_at), desc(AdminActionLog.log_id))
+            .order_by(desc(AdminActionLog.created_at), desc(AdminActionLog.log_id)),
+            [AdminActionLog.target_id],
+            target_ids,
         )
 
+        # Each target's logs share a chunk, so the first row per target is its latest.
         latest_reasons: dict[int, str] = {}
-        for log in result.scalars().all():
-            if log.target_id not in latest_reasons:
-                latest_reasons[log.target_id] = log.reason
+        for target_id, reason in rows:
+            if target_id not in latest_reasons:
+                latest_reasons[target_id] = reason
         return latest_reasons
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import Row, Select, and_, literal, select, tuple_, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Upper bound on keys bound into one statement; larger key sets run in chunks.
+BULK_KEY_CHUNK_SIZE = 1000
+# Composite key sets up to this size use a row-value IN; larger ones join a derived table.
+ROW_VALUE_IN_MAX_KEYS = 64
+# Each derived-table key is one term of a compound SELECT; SQLite allows at most 500,
+# so composite chunks stay at a power of two below that even after padding.
+DERIVED_TABLE_CHUNK_SIZE = 256
+
+_ROW_VALUE_IN_DIALECTS = {"mysql", "postgresql", "sqlite"}
+
+
+async def select_by_keys(
+    db: AsyncSession,
+    query: Select,
+    columns: Sequence,
+    keys: Iterable,
+) -> list[Row]:
+    """Run ``query`` restricted to rows whose ``columns`` equal one of ``keys``.
+
+    ``keys`` are scalars for a single column and tuples for composite keys.
+
+    Single-column keys use ``IN``. Composite keys use a row-value
+    ``(a, b) IN ((?, ?), ...)`` for small sets, and an inner join on a derived
+    table of key rows for large sets or dialects without row-value ``IN``.
+    Key sets over ``BULK_KEY_CHUNK_SIZE`` (``DERIVED_TABLE_CHUNK_SIZE`` for
+    composite keys) run as one statement per chunk, so ``query`` must not
+    aggregate across keys. Chunks are padded to a power of
+    two so that only a few statement shapes get compiled and cached.
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return []
+
+    dialect = db.get_bind().dialect.name
+    chunk_size = BULK_KEY_CHUNK_SIZE
+    if len(columns) > 1:
+        chunk_size = min(chunk_size, DERIVED_TABLE_CHUNK_SIZE)
+    rows: list[Row] = []
+    for offset in range(0, len(unique_keys), chunk_size):
+        chunk = _padded(unique_keys[offset : offset + chunk_size])
+        result = await db.execute(_restrict(query, columns, chunk, dialect))
+        rows.extend(result.all())
+    return rows
+
+
+def _restrict(query: Select, columns: Sequence, keys: list, dialect: str) -> Select:
+    if len(columns) == 1:
+        return query.where(columns[0].in_(keys))
+    if len(keys) <= ROW_VALUE_IN_MAX_KEYS and dialect in _ROW_VALUE_IN_DIALECTS:
+        return query.where(tuple_(*columns).in_(keys))
+
+    # UNION (not UNION ALL) drops the padding duplicates so the join cannot repeat rows.
+    key_rows = union(
+        *(
+            select(*(literal(value).label(f"k{idx}") for idx, value in enumerate(key)))
+            for key in keys
+        )
+    ).subquery("bulk_keys")
+    return query.join(
+        key_rows,
+        and_(*(column == key_rows.c[f"k{idx}"] for idx, column in enumerate(columns))),
+    )
+
+
+def _padded(keys: list) -> list:
+    size = 1
+    while size < len(keys):
+        size *= 2
+    return keys + [keys[-1]] * (size - len(keys))
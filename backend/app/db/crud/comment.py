@@ -1,8 +1,9 @@
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc, func, select
-from app.db.models import Comment, Topic
+from sqlalchemy import asc, desc, func, select
+from app.db.keyset import keyset_filter
+from app.db.models import Comment, CommentLike, Topic
 from app.db.schemas.comments import CommentCreate, CommentUpdate
 
 
@@ -30,12 +31,45 @@ class CommentCrud:
         return comment
 
     @staticmethod
-    async def get_all_by_topic_id(db: AsyncSession, topic_id: int):
-        result = await db.execute(
-            select(Comment)
-            .where(Comment.topic_id == topic_id, Comment.is_hidden.is_(False))
-            .order_by(Comment.created_at.asc(), Comment.comment_id.asc())
+    async def get_page_by_topic_id(
+        db: AsyncSession,
+        topic_id: int,
+        *,
+        sort: str = "oldest",
+        limit: int | None = 20,
+        cursor_values: list | None = None,
+    ):
+        query = select(Comment).where(
+            Comment.topic_id == topic_id, Comment.is_hidden.is_(False)
         )
+        sort_columns = [Comment.created_at, Comment.comment_id]
+        if sort == "like_count":
+            # Aggregated per page rather than denormalized; bounded by the topic's likes.
+            like_counts = (
+                select(
+                    CommentLike.comment_id,
+                    func.count(CommentLike.like_id).label("like_count"),
+                )
+                .join(Comment, Comment.comment_id == CommentLike.comment_id)
+                .where(Comment.topic_id == topic_id)
+                .group_by(CommentLike.comment_id)
+                .subquery()
+            )
+            query = query.outerjoin(
+                like_counts, like_counts.c.comment_id == Comment.comment_id
+            )
+            sort_columns.insert(0, func.coalesce(like_counts.c.like_count, 0))
+
+        descending = sort != "oldest"
+        if cursor_values is not None:
+            query = query.where(
+                keyset_filter(sort_columns, cursor_values, descending=descending)
+            )
+        order = [desc(column) if descending else asc(column) for column in sort_columns]
+        query = query.order_by(*order)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db.execute(query)
         return result.scalars().all()
 
     @staticmethod
@@ -137,6 +171,13 @@ class CommentCrud:
         await db.flush()
         return comment
 
+    @staticmethod
+    async def get_user_ids_by_topic_id(db: AsyncSession, topic_id: int) -> set[int]:
+        result = await db.execute(
+            select(Comment.user_id).where(Comment.topic_id == topic_id).distinct()
+        )
+        return set(result.scalars().all())
+
     @staticmethod
     async def delete_by_id(db: AsyncSession, comment_id: int):
         comment = await db.get(Comment, comment_id)
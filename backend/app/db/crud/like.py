@@ -1,4 +1,4 @@
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models import TopicLike, CommentLike, ReplyLike, Topic, Comment, Reply
 
@@ -124,6 +124,20 @@ class LikeCrud:
         )
         return {topic_id: count for topic_id, count in result.all()}
 
+    @staticmethod
+    async def get_liked_topic_ids_by_user(
+        db: AsyncSession, user_id: int, topic_ids: list[int]
+    ) -> set[int]:
+        if not topic_ids:
+            return set()
+
+        result = await db.execute(
+            select(TopicLike.topic_id).where(
+                (TopicLike.user_id == user_id) & (TopicLike.topic_id.in_(topic_ids))
+            )
+        )
+        return set(result.scalars().all())
+
     @staticmethod
     async def count_comment_likes(db: AsyncSession, comment_id: int) -> int:
         result = await db.execute(
@@ -134,18 +148,25 @@ class LikeCrud:
         return result.scalar()
 
     @staticmethod
-    async def count_comment_likes_by_comment_ids(
-        db: AsyncSession, comment_ids: list[int]
-    ) -> dict[int, int]:
+    async def get_comment_like_summaries(
+        db: AsyncSession, comment_ids: list[int], user_id: int | None
+    ) -> dict[int, tuple[int, bool]]:
+        """Return ``{comment_id: (like_count, liked_by_user)}`` for comments with likes."""
         if not comment_ids:
             return {}
 
         result = await db.execute(
-            select(CommentLike.comment_id, func.count(CommentLike.like_id))
+            select(
+                CommentLike.comment_id,
+                func.count(CommentLike.like_id),
+                func.max(case((CommentLike.user_id == user_id, 1), else_=0)),
+            )
             .where(CommentLike.comment_id.in_(comment_ids))
             .group_by(CommentLike.comment_id)
         )
-        return {comment_id: count for comment_id, count in result.all()}
+        return {
+            comment_id: (count, bool(liked)) for comment_id, count, liked in result.all()
+        }
 
     @staticmethod
     async def count_reply_likes(db: AsyncSession, reply_id: int) -> int:
@@ -155,18 +176,23 @@ class LikeCrud:
         return result.scalar()
 
     @staticmethod
-    async def count_reply_likes_by_reply_ids(
-        db: AsyncSession, reply_ids: list[int]
-    ) -> dict[int, int]:
+    async def get_reply_like_summaries(
+        db: AsyncSession, reply_ids: list[int], user_id: int | None
+    ) -> dict[int, tuple[int, bool]]:
+        """Return ``{reply_id: (like_count, liked_by_user)}`` for replies with likes."""
         if not reply_ids:
             return {}
 
         result = await db.execute(
-            select(ReplyLike.reply_id, func.count(ReplyLike.like_id))
+            select(
+                ReplyLike.reply_id,
+                func.count(ReplyLike.like_id),
+                func.max(case((ReplyLike.user_id == user_id, 1), else_=0)),
+            )
             .where(ReplyLike.reply_id.in_(reply_ids))
             .group_by(ReplyLike.reply_id)
         )
-        return {reply_id: count for reply_id, count in result.all()}
+        return {reply_id: (count, bool(liked)) for reply_id, count, liked in result.all()}
 
     @staticmethod
     async def has_user_liked_topic(
@@ -196,24 +222,29 @@ class LikeCrud:
         )
 
     @staticmethod
-    async def count_likes_received(db: AsyncSession, user_id: int) -> int:
-        topic_likes = (
-            select(func.count(TopicLike.like_id))
+    async def count_likes_received_by_user_ids(
+        db: AsyncSession, user_ids: list[int]
+    ) -> dict[int, int]:
+        """Likes on the topics, comments and replies each user wrote."""
+        if not user_ids:
+            return {}
+
+        queries = [
+            select(Topic.user_id, func.count(TopicLike.like_id))
             .join(Topic, Topic.topic_id == TopicLike.topic_id)
-            .where(Topic.user_id == user_id)
-        )
-        comment_likes = (
-            select(func.count(CommentLike.like_id))
+            .where(Topic.user_id.in_(user_ids))
+            .group_by(Topic.user_id),
+            select(Comment.user_id, func.count(CommentLike.like_id))
             .join(Comment, Comment.comment_id == CommentLike.comment_id)
-            .where(Comment.user_id == user_id)
-        )
-        reply_likes = (
-            select(func.count(ReplyLike.like_id))
+            .where(Comment.user_id.in_(user_ids))
+            .group_by(Comment.user_id),
+            select(Reply.user_id, func.count(ReplyLike.like_id))
             .join(Reply, Reply.reply_id == ReplyLike.reply_id)
-            .where(Reply.user_id == user_id)
-        )
-
-        topic_count = (await db.execute(topic_likes)).scalar() or 0
-        comment_count = (await db.execute(comment_likes)).scalar() or 0
-        reply_count = (await db.execute(reply_likes)).scalar() or 0
-        return topic_count + comment_count + reply_count
+            .where(Reply.user_id.in_(user_ids))
+            .group_by(Reply.user_id),
+        ]
+        counts: dict[int, int] = {}
+        for query in queries:
+            for user_id, count in (await db.execute(query)).all():
+                counts[user_id] = counts.get(user_id, 0) + count
+        return counts
@@ -1,8 +1,9 @@
-from sqlalchemy import desc, func, select, update
+from sqlalchemy import Select, desc, func, insert, literal, null, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.notification_effects import notification_effects
 from app.db.models import Notification
-from app.db.schemas.notifications import NotificationCreate
+from app.db.schemas.notifications import NotificationCreate, NotificationEvent
 
 
 class NotificationCrud:
@@ -11,8 +12,66 @@ class NotificationCrud:
         notification = Notification(**data.model_dump())
         db.add(notification)
         await db.flush()
+        notification_effects.created(
+            db,
+            notification.user_id,
+            NotificationEvent.model_validate(notification).model_dump(mode="json"),
+        )
         return notification
 
+    @staticmethod
+    async def create_for_user_ids(
+        db: AsyncSession,
+        user_ids: Select,
+        *,
+        type: str,
+        target_type: str,
+        target_id: int,
+        topic_id: int | None,
+        message: str,
+        link: str,
+    ) -> int:
+        """INSERT ... SELECT one notification per user_id row of ``user_ids``."""
+        recipients = user_ids.subquery()
+        source = select(
+            recipients.c.user_id,
+            literal(type),
+            null(),
+            literal(target_type),
+            literal(target_id),
+            literal(topic_id),
+            literal(message),
+            literal(link),
+        ).order_by(recipients.c.user_id)
+        notification_effects.bulk_created(
+            db,
+            user_ids,
+            NotificationEvent(
+                type=type,
+                target_type=target_type,
+                target_id=target_id,
+                topic_id=topic_id,
+                message=message,
+                link=link,
+            ).model_dump(mode="json"),
+        )
+        result = await db.execute(
+            insert(Notification).from_select(
+                [
+                    Notification.user_id,
+                    Notification.type,
+                    Notification.actor_user_id,
+                    Notification.target_type,
+                    Notification.target_id,
+                    Notification.topic_id,
+                    Notification.message,
+                    Notification.link,
+                ],
+                source,
+            )
+        )
+        return result.rowcount or 0
+
     @staticmethod
     async def get_by_id(db: AsyncSession, notification_id: int) -> Notification | None:
         return await db.get(Notification, notification_id)
@@ -42,6 +101,8 @@ class NotificationCrud:
 
     @staticmethod
     async def mark_as_read(db: AsyncSession, notification: Notification) -> Notification:
+        if not notification.is_read:
+            notification_effects.read(db, notification.user_id)
         notification.is_read = True
         await db.flush()
         return notification
@@ -54,4 +115,5 @@ class NotificationCrud:
             .values(is_read=True)
         )
         await db.flush()
+        notification_effects.read_all(db, user_id)
         return result.rowcount or 0
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, delete
+from sqlalchemy import Select, select, desc, delete
 from app.db.models import PinnedTopic
 
 
@@ -38,22 +38,18 @@ class PinnedTopicCrud:
         return result.scalars().all()
 
     @staticmethod
-    async def get_user_ids_by_topic_ids(
-        db: AsyncSession, topic_ids: list[int]
-    ) -> dict[int, set[int]]:
-        if not topic_ids:
-            return {}
-
-        result = await db.execute(
-            select(PinnedTopic.topic_id, PinnedTopic.user_id).where(
-                PinnedTopic.topic_id.in_(topic_ids)
-            )
-        )
-
-        user_ids_by_topic: dict[int, set[int]] = {}
-        for topic_id, user_id in result.all():
-            user_ids_by_topic.setdefault(topic_id, set()).add(user_id)
-        return user_ids_by_topic
+    def user_ids_by_topic_query(
+        topic_id: int,
+        *,
+        exclude_user_id: int | None = None,
+        exclude_user_ids: Select | None = None,
+    ) -> Select:
+        query = select(PinnedTopic.user_id).where(PinnedTopic.topic_id == topic_id)
+        if exclude_user_id is not None:
+            query = query.where(PinnedTopic.user_id != exclude_user_id)
+        if exclude_user_ids is not None:
+            query = query.where(PinnedTopic.user_id.not_in(exclude_user_ids))
+        return query
 
     @staticmethod
     async def is_pinned(db: AsyncSession, user_id: int, topic_id: int) -> bool:
@@ -1,6 +1,7 @@
 from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.keyset import keyset_filter
 from app.db.models import Reply, Comment
 from app.db.schemas.replys import ReplyCreate, ReplyUpdate
 
@@ -36,19 +37,73 @@ class ReplyCrud:
         return result.scalars().all()
 
     @staticmethod
-    async def get_all_by_comment_ids(db: AsyncSession, comment_ids: list[int]):
+    async def get_user_ids_by_comment_id(db: AsyncSession, comment_id: int) -> set[int]:
+        result = await db.execute(
+            select(Reply.user_id).where(Reply.comment_id == comment_id).distinct()
+        )
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def get_user_ids_by_topic_id(db: AsyncSession, topic_id: int) -> set[int]:
+        result = await db.execute(
+            select(Reply.user_id)
+            .join(Comment, Reply.comment_id == Comment.comment_id)
+            .where(Comment.topic_id == topic_id)
+            .distinct()
+        )
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def get_previews_by_comment_ids(
+        db: AsyncSession, comment_ids: list[int], per_comment: int | None
+    ) -> tuple[list[Reply], dict[int, int]]:
+        """Return the oldest ``per_comment`` replies of each comment and reply counts.
+
+        ``per_comment=None`` returns every reply.
+        """
         if not comment_ids:
-            return []
+            return [], {}
 
+        partition = {"partition_by": Reply.comment_id}
+        ranked = (
+            select(
+                Reply.reply_id,
+                func.row_number()
+                .over(**partition, order_by=(Reply.created_at, Reply.reply_id))
+                .label("position"),
+                func.count().over(**partition).label("reply_count"),
+            )
+            .where(Reply.comment_id.in_(comment_ids))
+            .subquery()
+        )
+        query = select(Reply, ranked.c.reply_count).join(
+            ranked, ranked.c.reply_id == Reply.reply_id
+        )
+        if per_comment is not None:
+            query = query.where(ranked.c.position <= per_comment)
         result = await db.execute(
-            select(Reply)
-                .filter(Reply.comment_id.in_(comment_ids))
-                .order_by(
-                    Reply.comment_id.asc(),
-                    Reply.created_at.asc(),
-                    Reply.reply_id.asc(),
-                )
+            query.order_by(Reply.comment_id, Reply.created_at, Reply.reply_id)
         )
+        replies = []
+        reply_counts: dict[int, int] = {}
+        for reply, reply_count in result.all():
+            replies.append(reply)
+            reply_counts[reply.comment_id] = reply_count
+        return replies, reply_counts
+
+    @staticmethod
+    async def get_page_by_comment_id(
+        db: AsyncSession,
+        comment_id: int,
+        *,
+        limit: int = 20,
+        cursor_values: list | None = None,
+    ):
+        sort_columns = [Reply.created_at, Reply.reply_id]
+        query = select(Reply).where(Reply.comment_id == comment_id)
+        if cursor_values is not None:
+            query = query.where(keyset_filter(sort_columns, cursor_values, descending=False))
+        result = await db.execute(query.order_by(*sort_columns).limit(limit))
         return result.scalars().all()
 
     @staticmethod
@@ -3,6 +3,7 @@ from datetime import datetime
 from sqlalchemy import desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.crud.bulk_keys import select_by_keys
 from app.db.models import Report, User
 from app.db.schemas.reports import ReportCreate
 
@@ -15,10 +16,17 @@ class ReportCrud:
         reporter_user_id: int,
         target_snapshot: dict,
     ) -> Report:
+        comment_id = (
+            report_data.target_id
+            if report_data.target_type == "comment"
+            else target_snapshot.get("comment_id")
+        )
         report = Report(
             **report_data.model_dump(),
             reporter_user_id=reporter_user_id,
             target_snapshot=target_snapshot,
+            topic_id=target_snapshot["topic_id"],
+            comment_id=comment_id,
         )
         db.add(report)
         await db.flush()
@@ -111,19 +119,75 @@ class ReportCrud:
     async def count_by_targets(
         db: AsyncSession, targets: list[tuple[str, int]]
     ) -> dict[tuple[str, int], int]:
-        if not targets:
-            return {}
-        conditions = [
-            (Report.target_type == target_type) & (Report.target_id == target_id)
-            for target_type, target_id in targets
-        ]
-        query = (
-            select(Report.target_type, Report.target_id, func.count(Report.report_id))
-            .where(or_(*conditions))
-            .group_by(Report.target_type, Report.target_id)
+        rows = await select_by_keys(
+            db,
+            select(Report.target_type, Report.target_id, func.count(Report.report_id)).group_by(
+                Report.target_type, Report.target_id
+            ),
+            [Report.target_type, Report.target_id],
+            targets,
+        )
+        return {(target_type, target_id): count for target_type, target_id, count in rows}
+
+    @staticmethod
+    async def get_pending_by_topic_id(db: AsyncSession, topic_id: int) -> list[Report]:
+        """Pending reports on a topic and on every comment and reply under it."""
+        result = await db.execute(
+            select(Report)
+            .where(Report.status == "pending", Report.topic_id == topic_id)
+            .order_by(Report.report_id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_pending_by_comment_id(db: AsyncSession, comment_id: int) -> list[Report]:
+        """Pending reports on a comment and on every reply under it."""
+        result = await db.execute(
+            select(Report)
+            .where(Report.status == "pending", Report.comment_id == comment_id)
+            .order_by(Report.report_id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_pending_by_targets(
+        db: AsyncSession, target_type: str, target_ids: list[int]
+    ) -> list[Report]:
+        if not target_ids:
+            return []
+        result = await db.execute(
+            select(Report)
+            .where(
+                Report.target_type == target_type,
+                Report.target_id.in_(target_ids),
+                Report.status == "pending",
+            )
+            .order_by(Report.report_id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def resolve_by_ids(
+        db: AsyncSession,
+        report_ids: list[int],
+        *,
+        status: str,
+        handled_by: int,
+        handled_at: datetime,
+        resolution: str,
+    ) -> None:
+        if not report_ids:
+            return
+        await db.execute(
+            update(Report)
+            .where(Report.report_id.in_(report_ids), Report.status == "pending")
+            .values(
+                status=status,
+                handled_by=handled_by,
+                handled_at=handled_at,
+                resolution=resolution,
+            )
         )
-        result = await db.execute(query)
-        return {(target_type, target_id): count for target_type, target_id, count in result.all()}
 
     @staticmethod
     async def resolve_target_reports(
@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import case, desc, false, func, or_, select
+from sqlalchemy import and_, case, desc, false, func, or_, select, update
 from sqlalchemy.orm import selectinload
-from app.db.models import Topic, TopicLike, Vote
+from app.db.models import Topic, TopicLike, TopicStats, Vote
 from app.db.schemas.topics import TopicCreate
+from app.db.keyset import keyset_filter
+from app.db.search import topic_search_filter
 
 class TopicCrud:
     @staticmethod
@@ -15,6 +17,15 @@ class TopicCrud:
     def _closed_topic_filter(now: datetime):
         return Topic.expires_at <= now
 
+    @staticmethod
+    def _closed_without_notifications_filter(now: datetime):
+        return and_(
+            Topic.is_hidden.is_(False),
+            Topic.expires_at.is_not(None),
+            Topic.expires_at <= now,
+            Topic.closed_notified_at.is_(None),
+        )
+
     @staticmethod
     def _active_rank_expression(now: datetime):
         return case((TopicCrud._active_topic_filter(now), 1), else_=0)
@@ -23,6 +34,26 @@ class TopicCrud:
     def _user_voted_topic_filter(user_id: int):
         return Topic.topic_id.in_(select(Vote.topic_id).where(Vote.user_id == user_id))
 
+    @staticmethod
+    def _like_count_expression():
+        # Topics without a topic_stats row fall back to counting likes directly.
+        like_count_subq = (
+            select(func.count(TopicLike.like_id))
+            .where(TopicLike.topic_id == Topic.topic_id)
+            .scalar_subquery()
+        )
+        return func.coalesce(TopicStats.like_count, like_count_subq)
+
+    @staticmethod
+    def _sort_columns(sort: str, status: str, now: datetime) -> list:
+        columns = []
+        if status == "all":
+            columns.append(TopicCrud._active_rank_expression(now))
+        if sort == "like_count":
+            columns.append(TopicCrud._like_count_expression())
+        columns.extend([Topic.created_at, Topic.topic_id])
+        return columns
+
     @staticmethod
     async def create(db: AsyncSession, topic_data: TopicCreate, user_id:int) -> Topic:
         topic_dict = topic_data.model_dump()
@@ -55,9 +86,16 @@ class TopicCrud:
         return False
     
     @staticmethod
-    async def count_by_user_id(db:AsyncSession, user_id:int) -> int:
-        result = await db.execute(select(func.count()).where(Topic.user_id == user_id))
-        return result.scalar() or 0
+    async def count_by_user_ids(db: AsyncSession, user_ids: list[int]) -> dict[int, int]:
+        if not user_ids:
+            return {}
+
+        result = await db.execute(
+            select(Topic.user_id, func.count(Topic.topic_id))
+            .where(Topic.user_id.in_(user_ids))
+            .group_by(Topic.user_id)
+        )
+        return {user_id: count for user_id, count in result.all()}
 
     @staticmethod
     async def get_recent_by_user_id(db: AsyncSession, user_id: int, limit: int = 5):
@@ -88,27 +126,23 @@ class TopicCrud:
         limit: int = 10,
         offset: int = 0,
         user_id: int | None = None,
+        cursor_values: list | None = None,
     ):
         now = datetime.now(timezone.utc)
-        like_count_subq = (
-            select(func.count(TopicLike.like_id))
-            .where(TopicLike.topic_id == Topic.topic_id)
-            .scalar_subquery()
-        )
+        sort_columns = TopicCrud._sort_columns(sort, status, now)
 
         base_query = (
             select(Topic)
             .options(selectinload(Topic.user))
             .where(Topic.is_hidden.is_(False))
         )
+        if sort == "like_count":
+            base_query = base_query.outerjoin(
+                TopicStats, TopicStats.topic_id == Topic.topic_id
+            )
 
         if search:
-            base_query = base_query.where(
-                or_(
-                    Topic.title.ilike(f"%{search}%"),
-                    Topic.description.ilike(f"%{search}%"),
-                )
-            )
+            base_query = base_query.where(topic_search_filter(db, search))
 
         if category:
             base_query = base_query.where(Topic.category == category)
@@ -124,17 +158,16 @@ class TopicCrud:
                 TopicCrud._user_voted_topic_filter(user_id) if user_id is not None else false()
             )
 
-        if status == "all":
-            base_query = base_query.order_by(
-                desc(TopicCrud._active_rank_expression(now))
+        if cursor_values is not None:
+            base_query = base_query.where(
+                keyset_filter(sort_columns, cursor_values)
             )
-
-        if sort == "like_count":
-            base_query = base_query.order_by(desc(like_count_subq), desc(Topic.created_at))
         else:
-            base_query = base_query.order_by(desc(Topic.created_at))
+            base_query = base_query.offset(offset)
 
-        base_query = base_query.limit(limit).offset(offset)
+        base_query = base_query.order_by(
+            *(desc(column) for column in sort_columns)
+        ).limit(limit)
         result = await db.execute(base_query)
         return result.scalars().all()
     
@@ -155,10 +188,7 @@ class TopicCrud:
             base_query = base_query.where(Topic.category == category)
 
         if search:
-            base_query = base_query.where(
-                (Topic.title.ilike(f"%{search}%"))
-                | (Topic.description.ilike(f"%{search}%"))
-            )
+            base_query = base_query.where(topic_search_filter(db, search))
 
         if status == "active":
             base_query = base_query.where(TopicCrud._active_topic_filter(now))
@@ -196,8 +226,7 @@ class TopicCrud:
         if end_at:
             filters.append(Topic.created_at < end_at)
         if search:
-            pattern = f"%{search.strip()}%"
-            filters.append(or_(Topic.title.ilike(pattern), Topic.description.ilike(pattern)))
+            filters.append(topic_search_filter(db, search))
 
         total_result = await db.execute(
             select(func.count()).select_from(Topic).where(*filters)
@@ -213,6 +242,18 @@ class TopicCrud:
         result = await db.execute(query)
         return list(result.scalars().all()), total_result.scalar() or 0
 
+    @staticmethod
+    async def get_batch_after_id(
+        db: AsyncSession, *, after_topic_id: int = 0, limit: int = 500
+    ) -> list[Topic]:
+        result = await db.execute(
+            select(Topic)
+            .where(Topic.topic_id > after_topic_id)
+            .order_by(Topic.topic_id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     @staticmethod
     async def get_closed_without_notifications(
         db: AsyncSession,
@@ -223,27 +264,39 @@ class TopicCrud:
         current_time = now or datetime.now(timezone.utc)
         result = await db.execute(
             select(Topic)
-            .where(
-                Topic.is_hidden.is_(False),
-                Topic.expires_at.is_not(None),
-                Topic.expires_at <= current_time,
-                Topic.closed_notified_at.is_(None),
-            )
+            .where(TopicCrud._closed_without_notifications_filter(current_time))
             .order_by(Topic.expires_at, Topic.topic_id)
             .limit(limit)
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count_closed_without_notifications(
+        db: AsyncSession, *, now: datetime | None = None
+    ) -> int:
+        current_time = now or datetime.now(timezone.utc)
+        result = await db.execute(
+            select(func.count(Topic.topic_id)).where(
+                TopicCrud._closed_without_notifications_filter(current_time)
+            )
+        )
+        return result.scalar_one() or 0
+
     @staticmethod
     async def mark_closed_notified(
         db: AsyncSession,
-        topic: Topic,
+        topic_ids: list[int],
         *,
         notified_at: datetime | None = None,
-    ) -> Topic:
-        topic.closed_notified_at = notified_at or datetime.now(timezone.utc)
-        await db.flush()
-        return topic
+    ) -> int:
+        if not topic_ids:
+            return 0
+        result = await db.execute(
+            update(Topic)
+            .where(Topic.topic_id.in_(topic_ids))
+            .values(closed_notified_at=notified_at or datetime.now(timezone.utc))
+        )
+        return result.rowcount or 0
 
     @staticmethod
     async def hide(
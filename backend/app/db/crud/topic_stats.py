@@ -0,0 +1,62 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import TopicStats
+
+
+class TopicStatsCrud:
+    @staticmethod
+    async def create(db: AsyncSession, topic_id: int, option_count: int) -> TopicStats:
+        stats = TopicStats(
+            topic_id=topic_id,
+            vote_counts=[0] * option_count,
+            like_count=0,
+            comment_count=0,
+            reply_count=0,
+        )
+        db.add(stats)
+        await db.flush()
+        return stats
+
+    @staticmethod
+    async def get_by_topic_ids(
+        db: AsyncSession, topic_ids: list[int]
+    ) -> dict[int, TopicStats]:
+        if not topic_ids:
+            return {}
+
+        result = await db.execute(
+            select(TopicStats).where(TopicStats.topic_id.in_(topic_ids))
+        )
+        return {stats.topic_id: stats for stats in result.scalars().all()}
+
+    @staticmethod
+    async def get_for_update(db: AsyncSession, topic_id: int) -> TopicStats | None:
+        result = await db.execute(
+            select(TopicStats)
+            .where(TopicStats.topic_id == topic_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def upsert(
+        db: AsyncSession,
+        topic_id: int,
+        *,
+        vote_counts: list[int],
+        like_count: int,
+        comment_count: int,
+        reply_count: int,
+    ) -> TopicStats:
+        stats = await db.get(TopicStats, topic_id)
+        if stats is None:
+            stats = TopicStats(topic_id=topic_id)
+            db.add(stats)
+        stats.vote_counts = vote_counts
+        stats.like_count = like_count
+        stats.comment_count = comment_count
+        stats.reply_count = reply_count
+        await db.flush()
+        return stats
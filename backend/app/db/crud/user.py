@@ -19,6 +19,18 @@ class UserCrud:
         result = await db.execute(select(User).filter(User.user_id.in_(user_ids)))
         return {user.user_id: user for user in result.scalars().all()}
 
+    @staticmethod
+    async def get_ids_after_id(
+        db: AsyncSession, *, after_user_id: int = 0, limit: int = 500
+    ) -> list[int]:
+        result = await db.execute(
+            select(User.user_id)
+            .where(User.user_id > after_user_id)
+            .order_by(User.user_id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     @staticmethod
     async def get_all_for_admin(
         db: AsyncSession,
@@ -0,0 +1,84 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import UserStatsRollup, Vote
+
+
+class UserStatsCrud:
+    @staticmethod
+    async def create(db: AsyncSession, user_id: int) -> UserStatsRollup:
+        stats = UserStatsRollup(user_id=user_id, topic_count=0, vote_count=0, likes_received=0)
+        db.add(stats)
+        await db.flush()
+        return stats
+
+    @staticmethod
+    async def get_by_user_id(db: AsyncSession, user_id: int) -> UserStatsRollup | None:
+        return await db.get(UserStatsRollup, user_id)
+
+    @staticmethod
+    async def get_by_user_ids(
+        db: AsyncSession, user_ids: list[int]
+    ) -> dict[int, UserStatsRollup]:
+        if not user_ids:
+            return {}
+
+        result = await db.execute(
+            select(UserStatsRollup).where(UserStatsRollup.user_id.in_(user_ids))
+        )
+        return {stats.user_id: stats for stats in result.scalars().all()}
+
+    @staticmethod
+    async def increment(
+        db: AsyncSession,
+        user_id: int,
+        *,
+        topic_delta: int = 0,
+        vote_delta: int = 0,
+        like_delta: int = 0,
+    ) -> bool:
+        """Atomically add the deltas; False when the user has no rollup row yet."""
+        result = await db.execute(
+            update(UserStatsRollup)
+            .where(UserStatsRollup.user_id == user_id)
+            .values(
+                topic_count=UserStatsRollup.topic_count + topic_delta,
+                vote_count=UserStatsRollup.vote_count + vote_delta,
+                likes_received=UserStatsRollup.likes_received + like_delta,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    @staticmethod
+    async def decrement_votes_by_topic_id(db: AsyncSession, topic_id: int) -> None:
+        """Take back the votes cast on a topic that is about to be deleted."""
+        await db.execute(
+            update(UserStatsRollup)
+            .where(
+                UserStatsRollup.user_id.in_(
+                    select(Vote.user_id).where(Vote.topic_id == topic_id)
+                )
+            )
+            .values(vote_count=UserStatsRollup.vote_count - 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def upsert(
+        db: AsyncSession,
+        user_id: int,
+        *,
+        topic_count: int,
+        vote_count: int,
+        likes_received: int,
+    ) -> UserStatsRollup:
+        stats = await db.get(UserStatsRollup, user_id)
+        if stats is None:
+            stats = UserStatsRollup(user_id=user_id)
+            db.add(stats)
+        stats.topic_count = topic_count
+        stats.vote_count = vote_count
+        stats.likes_received = likes_received
+        await db.flush()
+        return stats
@@ -1,5 +1,6 @@
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models import Vote
 from app.db.schemas.votes import VoteCreate
@@ -53,9 +54,16 @@ class VoteCrud:
         return result.scalars().all()
 
     @staticmethod
-    async def count_by_user_id(db: AsyncSession, user_id: int) -> int:
-        result = await db.execute(select(func.count()).where(Vote.user_id == user_id))
-        return result.scalar() or 0
+    async def count_by_user_ids(db: AsyncSession, user_ids: list[int]) -> dict[int, int]:
+        if not user_ids:
+            return {}
+
+        result = await db.execute(
+            select(Vote.user_id, func.count(Vote.vote_id))
+            .where(Vote.user_id.in_(user_ids))
+            .group_by(Vote.user_id)
+        )
+        return {user_id: count for user_id, count in result.all()}
 
     @staticmethod
     async def get_by_topic_and_user(db: AsyncSession, topic_id: int, user_id: int):
@@ -65,47 +73,57 @@ class VoteCrud:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_all_by_topic_id_and_range(
-        db: AsyncSession,
-        topic_id: int,
-        delta: timedelta | None,
-        order_by_created: bool = True
-    ) -> list[Vote]:
-        base_query = select(Vote).where(Vote.topic_id == topic_id)
-        if delta is not None:
-            now = datetime.now(timezone.utc)
-            start_time = now - delta
-            base_query = base_query.where(Vote.created_at.between(start_time, now))
-
-        if order_by_created:
-            base_query = base_query.order_by(Vote.created_at)
-
-        result = await db.execute(base_query)
-        return result.scalars().all()
-
-    @staticmethod
-    async def get_user_ids_by_topic_ids(
-        db: AsyncSession, topic_ids: list[int]
-    ) -> dict[int, set[int]]:
+    async def get_vote_indexes_by_user_and_topic_ids(
+        db: AsyncSession, user_id: int, topic_ids: list[int]
+    ) -> dict[int, int]:
         if not topic_ids:
             return {}
 
         result = await db.execute(
-            select(Vote.topic_id, Vote.user_id)
-            .where(Vote.topic_id.in_(topic_ids))
-            .group_by(Vote.topic_id, Vote.user_id)
+            select(Vote.topic_id, Vote.vote_index).where(
+                (Vote.user_id == user_id) & (Vote.topic_id.in_(topic_ids))
+            )
         )
+        return {topic_id: vote_index for topic_id, vote_index in result.all()}
 
-        user_ids_by_topic: dict[int, set[int]] = {}
-        for topic_id, user_id in result.all():
-            user_ids_by_topic.setdefault(topic_id, set()).add(user_id)
-        return user_ids_by_topic
+    @staticmethod
+    def _range_filter(topic_id: int, delta: timedelta | None):
+        condition = Vote.topic_id == topic_id
+        if delta is not None:
+            now = datetime.now(timezone.utc)
+            condition = condition & Vote.created_at.between(now - delta, now)
+        return condition
 
     @staticmethod
-    async def get_first_vote_created_at(
-        db: AsyncSession, topic_id: int
-    ) -> datetime | None:
+    async def count_by_vote_index_in_range(
+        db: AsyncSession, topic_id: int, delta: timedelta | None
+    ) -> dict[int, int]:
         result = await db.execute(
-            select(func.min(Vote.created_at)).where(Vote.topic_id == topic_id)
+            select(Vote.vote_index, func.count(Vote.vote_id))
+            .where(VoteCrud._range_filter(topic_id, delta))
+            .group_by(Vote.vote_index)
         )
-        return result.scalar_one_or_none()
+        return {vote_index: count for vote_index, count in result.all()}
+
+    @staticmethod
+    async def stream_times_by_topic_id(
+        db: AsyncSession, topic_id: int, delta: timedelta | None = None
+    ) -> AsyncIterator[tuple[datetime, int]]:
+        result = await db.stream(
+            select(Vote.created_at, Vote.vote_index)
+            .where(VoteCrud._range_filter(topic_id, delta))
+            .order_by(Vote.created_at)
+            .execution_options(yield_per=1000)
+        )
+        try:
+            async for created_at, vote_index in result:
+                yield created_at, vote_index
+        finally:
+            await result.close()
+
+    @staticmethod
+    def user_ids_by_topic_query(topic_id: int, *, exclude_user_id: int | None = None) -> Select:
+        query = select(Vote.user_id).where(Vote.topic_id == topic_id)
+        if exclude_user_id is not None:
+            query = query.where(Vote.user_id != exclude_user_id)
+        return query
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import VoteBucket
+
+
+class VoteBucketCrud:
+    @staticmethod
+    async def increment(
+        db: AsyncSession, topic_id: int, vote_index: int, bucket_start: datetime
+    ) -> None:
+        values = {
+            "topic_id": topic_id,
+            "bucket_start": bucket_start,
+            "vote_index": vote_index,
+            "vote_count": 1,
+        }
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            statement = mysql_insert(VoteBucket).values(**values)
+            statement = statement.on_duplicate_key_update(
+                vote_count=VoteBucket.vote_count + 1
+            )
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            statement = sqlite_insert(VoteBucket).values(**values)
+            statement = statement.on_conflict_do_update(
+                index_elements=["topic_id", "bucket_start", "vote_index"],
+                set_={"vote_count": VoteBucket.vote_count + 1},
+            )
+        else:
+            await VoteBucketCrud._increment_portable(db, values)
+            return
+
+        await db.execute(statement)
+
+    @staticmethod
+    async def _increment_portable(db: AsyncSession, values: dict) -> None:
+        # No native upsert: bump the bucket, creating it on the first vote of the minute.
+        bucket = (
+            VoteBucket.topic_id == values["topic_id"],
+            VoteBucket.bucket_start == values["bucket_start"],
+            VoteBucket.vote_index == values["vote_index"],
+        )
+        bump = (
+            update(VoteBucket)
+            .where(*bucket)
+            .values(vote_count=VoteBucket.vote_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if (await db.execute(bump)).rowcount > 0:
+            return
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(VoteBucket).values(**values))
+        except IntegrityError:
+            # A concurrent vote created the bucket between the UPDATE and the INSERT.
+            await db.execute(bump)
+
+    @staticmethod
+    async def get_counts_by_topic_id(
+        db: AsyncSession, topic_id: int, start_time: datetime | None = None
+    ) -> list[tuple[datetime, int, int]]:
+        query = select(
+            VoteBucket.bucket_start,
+            VoteBucket.vote_index,
+            VoteBucket.vote_count,
+        ).where(VoteBucket.topic_id == topic_id)
+        if start_time is not None:
+            query = query.where(VoteBucket.bucket_start >= start_time)
+
+        result = await db.execute(query.order_by(VoteBucket.bucket_start))
+        return [tuple(row) for row in result.all()]
+
+    @staticmethod
+    async def get_first_bucket_start(db: AsyncSession, topic_id: int) -> datetime | None:
+        result = await db.execute(
+            select(func.min(VoteBucket.bucket_start)).where(VoteBucket.topic_id == topic_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def replace_for_topic(
+        db: AsyncSession, topic_id: int, counts: dict[tuple[datetime, int], int]
+    ) -> None:
+        await db.execute(delete(VoteBucket).where(VoteBucket.topic_id == topic_id))
+        if counts:
+            await db.execute(
+                insert(VoteBucket),
+                [
+                    {
+                        "topic_id": topic_id,
+                        "bucket_start": bucket_start,
+                        "vote_index": vote_index,
+                        "vote_count": vote_count,
+                    }
+                    for (bucket_start, vote_index), vote_count in counts.items()
+                ],
+            )
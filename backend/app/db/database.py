@@ -1,31 +1,43 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.settings import settings
+from app.db.pool import InstrumentedAsyncQueuePool, register_pool_metrics
 from app.perf import register_async_engine_perf_hooks
 
-async_engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-)
-register_async_engine_perf_hooks(async_engine)
+
+def create_pooled_engine(url: str, *, pool_name: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+    register_async_engine_perf_hooks(engine)
+    register_pool_metrics(engine, pool_name)
+    return engine
+
+
+async_engine = create_pooled_engine(settings.database_url, pool_name="primary")
 AsyncSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=async_engine, class_=AsyncSession
 )
 
-sync_engine = create_engine(settings.sync_database_url, pool_pre_ping=True)
 Base = declarative_base()
 
+
+@lru_cache(maxsize=1)
+def get_sync_engine() -> Engine:
+    """Blocking engine for alembic and maintenance scripts, created on first use."""
+    return create_engine(settings.sync_database_url, pool_pre_ping=True)
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
-
-
-# async def get_db():
-#     db = AsyncSessionLocal()
-#     try:
-#         yield db
-#     finally:
-#         await db.close()
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import and_, or_
+
+
+def keyset_filter(columns: list, values: list, *, descending: bool = True):
+    """Return the WHERE clause for rows after ``values`` in ``columns`` order.
+
+    ``(c1, c2, ...) < (v1, v2, ...)`` (or ``>`` when ascending) is expanded so
+    that both MySQL and SQLite can range-scan the leading index column.
+    """
+
+    def after(column, value):
+        return column < value if descending else column > value
+
+    condition = after(columns[-1], values[-1])
+    for column, value in zip(reversed(columns[:-1]), reversed(values[:-1])):
+        condition = or_(after(column, value), and_(column == value, condition))
+    return condition
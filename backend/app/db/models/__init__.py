@@ -1,6 +1,9 @@
 from .user import User
+from .user_stats import UserStatsRollup
 from .topic import Topic
+from .topic_stats import TopicStats
 from .vote import Vote
+from .vote_bucket import VoteBucket
 from .comment import Comment
 from .reply import Reply
 from .like import TopicLike, CommentLike, ReplyLike
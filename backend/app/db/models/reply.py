@@ -9,7 +9,7 @@ from app.db.database import Base
 class Reply(Base):
     __tablename__ = "replies"
     __table_args__ = (
-        Index("ix_replies_comment_id", "comment_id"),
+        Index("ix_replies_comment_created_at", "comment_id", "created_at"),
     )
 
     reply_id: Mapped[int] = mapped_column(primary_key=True, index=True)
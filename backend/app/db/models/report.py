@@ -14,12 +14,17 @@ class Report(Base):
         UniqueConstraint("reporter_user_id", "target_type", "target_id", name="uq_reports_reporter_target"),
         Index("ix_reports_status_created_at", "status", "created_at"),
         Index("ix_reports_target", "target_type", "target_id"),
+        Index("ix_reports_status_topic_id", "status", "topic_id"),
+        Index("ix_reports_status_comment_id", "status", "comment_id"),
     )
 
     report_id: Mapped[int] = mapped_column(primary_key=True, index=True)
     reporter_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=False)
     target_type: Mapped[str] = mapped_column(String(20), nullable=False)
     target_id: Mapped[int] = mapped_column(nullable=False)
+    # Denormalized from the target so related pending reports are an indexed lookup.
+    topic_id: Mapped[int | None] = mapped_column(nullable=True)
+    comment_id: Mapped[int | None] = mapped_column(nullable=True)
     reason: Mapped[str] = mapped_column(String(30), nullable=False)
     detail: Mapped[str | None] = mapped_column(String(500), nullable=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", server_default="pending")
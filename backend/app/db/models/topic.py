@@ -11,6 +11,13 @@ class Topic(Base):
     __table_args__ = (
         Index("ix_topics_created_at", "created_at"),
         Index("ix_topics_category_created_at", "category", "created_at"),
+        Index(
+            "ft_topics_title_description",
+            "title",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
     )
 
     topic_id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -44,3 +51,9 @@ class Topic(Base):
     likes: Mapped[List["TopicLike"]] = relationship(
         "TopicLike", back_populates="topic", cascade="all, delete-orphan"
     )
+    vote_buckets: Mapped[List["VoteBucket"]] = relationship(
+        "VoteBucket", back_populates="topic", cascade="all, delete-orphan"
+    )
+    stats: Mapped[Optional["TopicStats"]] = relationship(
+        "TopicStats", back_populates="topic", uselist=False, cascade="all, delete-orphan"
+    )
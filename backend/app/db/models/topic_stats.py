@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, JSON, TIMESTAMP, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.database import Base
+
+
+class TopicStats(Base):
+    __tablename__ = "topic_stats"
+
+    topic_id: Mapped[int] = mapped_column(
+        ForeignKey("topics.topic_id", ondelete="CASCADE"), primary_key=True
+    )
+    vote_counts: Mapped[list] = mapped_column(JSON, nullable=False)
+    like_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+    reply_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    topic: Mapped["Topic"] = relationship("Topic", back_populates="stats")
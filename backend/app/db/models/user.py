@@ -59,6 +59,9 @@ class User(Base):
         cascade="all, delete-orphan",
         foreign_keys="Notification.user_id",
     )
+    stats: Mapped[Optional["UserStatsRollup"]] = relationship(
+        "UserStatsRollup", back_populates="user", uselist=False, cascade="all, delete-orphan"
+    )
 
 
 def normalize_username(username: str) -> str:
@@ -9,6 +9,7 @@ class Vote(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "topic_id", name="unique_vote_user_topic"),
         Index("ix_votes_topic_vote_index", "topic_id", "vote_index"),
+        Index("ix_votes_topic_created_at", "topic_id", "created_at"),
     )
 
     vote_id: Mapped[int] = mapped_column(primary_key=True, index=True)
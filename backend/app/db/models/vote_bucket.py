@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.database import Base
+
+
+class VoteBucket(Base):
+    __tablename__ = "vote_buckets"
+
+    topic_id: Mapped[int] = mapped_column(
+        ForeignKey("topics.topic_id", ondelete="CASCADE"), primary_key=True
+    )
+    bucket_start: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True)
+    vote_index: Mapped[int] = mapped_column(primary_key=True)
+    vote_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+
+    topic: Mapped["Topic"] = relationship("Topic", back_populates="vote_buckets")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.metrics import (
+    db_pool_checked_out,
+    db_pool_checkout_timeouts_total,
+    db_pool_checkout_wait_seconds,
+    db_pool_overflow,
+    db_pool_size,
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that times each checkout and exports its occupancy gauges.
+
+    The gauges are refreshed from ``_do_get``/``_do_return_conn`` rather than the
+    ``checkout``/``checkin`` events, which fire before the connection has actually
+    been returned to the queue.
+    """
+
+    pool_name = "primary"
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            db_pool_checkout_timeouts_total.labels(pool=self.pool_name).inc()
+            raise
+        finally:
+            db_pool_checkout_wait_seconds.labels(pool=self.pool_name).observe(
+                time.perf_counter() - started_at
+            )
+            self.refresh_metrics()
+
+    def _do_return_conn(self, record) -> None:
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self.refresh_metrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.pool_name = self.pool_name
+        return pool
+
+    def refresh_metrics(self) -> None:
+        db_pool_size.labels(pool=self.pool_name).set(self.size())
+        db_pool_checked_out.labels(pool=self.pool_name).set(self.checkedout())
+        db_pool_overflow.labels(pool=self.pool_name).set(max(self.overflow(), 0))
+
+
+def register_pool_metrics(async_engine: AsyncEngine, pool_name: str) -> None:
+    """Export the pool metrics for ``async_engine`` under the ``pool`` label ``pool_name``."""
+    pool = async_engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        pool.pool_name = pool_name
+        pool.refresh_metrics()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from fastapi import Depends, Request
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.settings import settings
+from app.db.database import create_pooled_engine, get_db
+from app.metrics import db_read_routing_total, db_replica_healthy
+
+logger = logging.getLogger(__name__)
+
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "X-Read-Primary"
+# Session.info key naming the replica a read session is bound to.
+REPLICA_SESSION_INFO_KEY = "read_replica"
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker
+    healthy: bool = True
+
+    def set_healthy(self, healthy: bool) -> None:
+        if healthy != self.healthy:
+            logger.warning("read replica %s is %s", self.name, "up" if healthy else "down")
+        self.healthy = healthy
+        db_replica_healthy.labels(pool=self.name).set(int(healthy))
+
+
+class ReplicaRouter:
+    """Round-robins read-only sessions across the healthy read replicas.
+
+    A background task pings every replica with ``SELECT 1``; a replica that fails the
+    check, or drops a connection mid-request, is skipped until it passes again. With
+    no healthy replica, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        *,
+        health_check_interval_seconds: float | None = None,
+        health_check_timeout_seconds: float | None = None,
+    ):
+        self.replicas = [
+            self._create_replica(f"replica-{index}", url)
+            for index, url in enumerate(urls, start=1)
+        ]
+        self.health_check_interval_seconds = (
+            health_check_interval_seconds
+            if health_check_interval_seconds is not None
+            else settings.replica_health_check_interval_seconds
+        )
+        self.health_check_timeout_seconds = (
+            health_check_timeout_seconds
+            if health_check_timeout_seconds is not None
+            else settings.replica_health_check_timeout_seconds
+        )
+        self._turns = itertools.count()
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    @staticmethod
+    def _create_replica(name: str, url: str) -> Replica:
+        engine = create_pooled_engine(url, pool_name=name)
+        replica = Replica(
+            name=name,
+            engine=engine,
+            session_factory=async_sessionmaker(engine, class_=AsyncSession, autoflush=False),
+        )
+        replica.set_healthy(True)
+        return replica
+
+    def choose(self) -> Replica | None:
+        """Return the next healthy replica in round-robin order, or None."""
+        if not self.replicas:
+            return None
+        start = next(self._turns)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if replica.healthy:
+                return replica
+        return None
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            await asyncio.wait_for(
+                self._ping(replica.engine), timeout=self.health_check_timeout_seconds
+            )
+        except Exception:
+            replica.set_healthy(False)
+        else:
+            replica.set_healthy(True)
+
+    @staticmethod
+    async def _ping(engine: AsyncEngine) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="replica-health-checks")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            await self.check_health()
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.health_check_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+replica_router = ReplicaRouter(settings.replica_database_url_list)
+
+
+def is_replica_session(db: AsyncSession) -> bool:
+    return REPLICA_SESSION_INFO_KEY in db.info
+
+
+def read_primary_reason(request: Request) -> str | None:
+    """Why this request must read from the primary, if it must."""
+    if request.headers.get(READ_PRIMARY_HEADER) == "1":
+        return "header"
+    read_primary_until = request.cookies.get(READ_PRIMARY_COOKIE)
+    if read_primary_until:
+        try:
+            if float(read_primary_until) > time.time():
+                return "recent_write"
+        except ValueError:
+            pass
+    return None
+
+
+async def get_read_db(
+    request: Request, primary: AsyncSession = Depends(get_db)
+) -> AsyncIterator[AsyncSession]:
+    """Session for read-only endpoints: a replica unless the client must see its own writes.
+
+    ``primary`` is the request's regular session; it holds no connection until used.
+    """
+    if not replica_router.replicas:
+        yield primary
+        return
+
+    reason = read_primary_reason(request)
+    replica = None if reason else replica_router.choose()
+    if replica is None:
+        db_read_routing_total.labels(pool="primary", reason=reason or "no_healthy_replica").inc()
+        yield primary
+        return
+
+    db_read_routing_total.labels(pool=replica.name, reason="round_robin").inc()
+    async with replica.session_factory() as session:
+        session.info[REPLICA_SESSION_INFO_KEY] = replica.name
+        try:
+            yield session
+        except OperationalError:
+            replica.set_healthy(False)
+            raise
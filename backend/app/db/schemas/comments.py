@@ -39,7 +39,9 @@ class CommentInDB(CommentBase):
 
 class CommentRead(CommentInDB):
     username: str
+    # Only the oldest few replies; reply_count covers the whole thread.
     replies: list[ReplyRead] = Field(default_factory=list)
+    reply_count: int = 0
     like_count: int = 0
     has_liked: bool = False
 
@@ -30,6 +30,21 @@ class NotificationRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class NotificationEvent(BaseModel):
+    """Payload pushed on the notification stream; bulk-created events carry no id."""
+
+    notification_id: int | None = None
+    type: str
+    actor_user_id: int | None = None
+    target_type: str
+    target_id: int
+    topic_id: int | None = None
+    message: str
+    link: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class NotificationUnreadCount(BaseModel):
     count: int
 
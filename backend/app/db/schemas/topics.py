@@ -127,3 +127,8 @@ class TopicModerationUpdate(BaseModel):
         if not stripped:
             raise ValueError("reason must not be blank.")
         return stripped
+
+
+class TopicStatsRecountResponse(BaseModel):
+    processed_topics: int
+    repaired_topics: int
@@ -57,6 +57,11 @@ class UserStats(BaseModel):
     likes: int
 
 
+class UserStatsRecountResponse(BaseModel):
+    processed_users: int
+    repaired_users: int
+
+
 class UserActivity(BaseModel):
     topic_id: int
     type: str
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import or_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Topic
+
+# InnoDB's default ngram_token_size; shorter terms never match the FULLTEXT index.
+NGRAM_TOKEN_SIZE = 2
+
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+def topic_search_filter(db: AsyncSession, search: str):
+    """Return the WHERE clause for a topic title/description search.
+
+    MySQL uses the ngram FULLTEXT index (``ft_topics_title_description``); other
+    dialects, and terms too short for the ngram parser, use substring matching.
+    """
+    terms = _search_terms(search)
+    if (
+        db.get_bind().dialect.name == "mysql"
+        and terms
+        and all(len(term) >= NGRAM_TOKEN_SIZE for term in terms)
+    ):
+        return _fulltext_filter(terms)
+    return _like_filter(search.strip())
+
+
+def _search_terms(search: str) -> list[str]:
+    return [term for term in _BOOLEAN_OPERATORS.sub(" ", search).split() if term]
+
+
+def _fulltext_filter(terms: list[str]):
+    # Every term is required; quoting makes the ngram parser match it as a phrase.
+    against = " ".join(f'+"{term}"' for term in terms)
+    return match(Topic.title, Topic.description, against=against).in_boolean_mode()
+
+
+def _like_filter(search: str):
+    pattern = f"%{search}%"
+    return or_(Topic.title.ilike(pattern), Topic.description.ilike(pattern))
@@ -1,4 +1,4 @@
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
 
 http_requests_total = Counter(
@@ -19,6 +19,108 @@ rate_limit_blocked_total = Counter(
     ["method", "path", "scope"],
 )
 
+rate_limit_fallback_total = Counter(
+    "waggle_rate_limit_fallback_total",
+    "Total requests rate limited by the in-process fallback instead of Redis",
+    ["reason"],
+)
+
+rate_limit_circuit_open = Gauge(
+    "waggle_rate_limit_circuit_open",
+    "Whether the rate limit Redis circuit breaker is open",
+)
+
+topic_cache_hits_total = Counter(
+    "waggle_topic_cache_hits_total",
+    "Total topic list cache hits",
+    ["cache"],
+)
+
+topic_cache_misses_total = Counter(
+    "waggle_topic_cache_misses_total",
+    "Total topic list cache misses",
+    ["cache"],
+)
+
+
+closed_topic_notification_backlog = Gauge(
+    "waggle_closed_topic_notification_backlog",
+    "Closed topics still waiting for notification dispatch",
+)
+
+closed_topic_notification_dispatch_seconds = Gauge(
+    "waggle_closed_topic_notification_dispatch_seconds",
+    "Duration of the last scheduled closed-topic notification dispatch",
+)
+
+db_queries_per_request = Histogram(
+    "waggle_db_queries_per_request",
+    "SQL statements executed per sampled request",
+    ["method", "path"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+db_query_duration_seconds = Histogram(
+    "waggle_db_query_duration_seconds",
+    "SQL statement duration on sampled requests, by normalized statement fingerprint",
+    ["path", "fingerprint"],
+)
+
+db_query_fingerprint_info = Gauge(
+    "waggle_db_query_fingerprint_info",
+    "Normalized SQL text behind each query fingerprint label",
+    ["fingerprint", "statement"],
+)
+
+db_slow_queries_total = Counter(
+    "waggle_db_slow_queries_total",
+    "SQL statements slower than the slow-query threshold",
+    ["method", "path"],
+)
+
+db_pool_size = Gauge(
+    "waggle_db_pool_size",
+    "Configured persistent connections in the database pool",
+    ["pool"],
+)
+
+db_pool_checked_out = Gauge(
+    "waggle_db_pool_checked_out",
+    "Database connections currently checked out of the pool",
+    ["pool"],
+)
+
+db_pool_overflow = Gauge(
+    "waggle_db_pool_overflow",
+    "Database connections open beyond the pool size",
+    ["pool"],
+)
+
+db_pool_checkout_wait_seconds = Histogram(
+    "waggle_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+db_pool_checkout_timeouts_total = Counter(
+    "waggle_db_pool_checkout_timeouts_total",
+    "Pool checkouts that gave up after the pool timeout",
+    ["pool"],
+)
+
+db_replica_healthy = Gauge(
+    "waggle_db_replica_healthy",
+    "Whether the read replica passed its last health check",
+    ["pool"],
+)
+
+db_read_routing_total = Counter(
+    "waggle_db_read_routing_total",
+    "Read-only request sessions by the pool that served them",
+    ["pool", "reason"],
+)
+
 
 def render_metrics() -> tuple[bytes, str]:
     return generate_latest(), CONTENT_TYPE_LATEST
\ No newline at end of file
@@ -1,19 +1,19 @@
 from secrets import compare_digest
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+class CSRFMiddleware:
     """
     Double Submit Token pattern:
     - Client sends X-CSRF-Token header matching csrf_token cookie for unsafe methods.
     - Safe methods (GET/HEAD/OPTIONS) are skipped.
     """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self._unsafe_methods = {"POST", "PUT", "PATCH", "DELETE"}
         # Endpoints that must stay open (e.g., login/signup/token refresh)
         self._exempt_paths = {
@@ -22,18 +22,26 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             "/users/refresh",
         }
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-        if request.method in self._unsafe_methods:
-            if request.url.path in self._exempt_paths:
-                return await call_next(request)
-
-            # Let auth dependencies return the canonical 401 when no auth cookie exists.
-            if not request.cookies.get("access_token") and not request.cookies.get("refresh_token"):
-                return await call_next(request)
-
-            header_token = request.headers.get("X-CSRF-Token")
-            cookie_token = request.cookies.get("csrf_token")
-            if not header_token or not cookie_token or not compare_digest(header_token, cookie_token):
-                return PlainTextResponse("CSRF validation failed", status_code=403)
-
-        return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self._unsafe_methods:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if request.url.path in self._exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        # Let auth dependencies return the canonical 401 when no auth cookie exists.
+        if not request.cookies.get("access_token") and not request.cookies.get("refresh_token"):
+            await self.app(scope, receive, send)
+            return
+
+        header_token = request.headers.get("X-CSRF-Token")
+        cookie_token = request.cookies.get("csrf_token")
+        if not header_token or not cookie_token or not compare_digest(header_token, cookie_token):
+            response = PlainTextResponse("CSRF validation failed", status_code=403)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
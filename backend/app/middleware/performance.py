@@ -1,36 +1,49 @@
 from __future__ import annotations
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.settings import settings
-from app.perf import begin_request_capture, finish_request_capture
+from app.middleware.prometheus import route_path
+from app.perf import begin_request_capture, finish_request_capture, has_request_observers
 
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        if (
-            not settings.performance_debug_enabled
-            or request.headers.get("X-Perf-Debug") != "1"
-        ):
-            return await call_next(request)
+class PerformanceMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        debug = (
+            settings.performance_debug_enabled
+            and Headers(scope=scope).get("X-Perf-Debug") == "1"
+        )
+        if not debug and not has_request_observers():
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = begin_request_capture(scope["method"])
+        response_started = False
+
+        async def send_with_perf_headers(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                stats = finish_request_capture(route_path(scope), store=debug)
+                if debug and stats is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Perf-Trace-Id"] = trace_id
+                    headers["X-Perf-Query-Count"] = str(stats.query_count)
+                    headers["X-Perf-Query-Time-Ms"] = f"{stats.query_time_ms:.3f}"
+                    headers["X-Perf-Response-Time-Ms"] = f"{stats.response_time_ms:.3f}"
+            await send(message)
 
-        trace_id = begin_request_capture()
-        response = None
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_perf_headers)
         except Exception:
-            finish_request_capture()
+            if not response_started:
+                finish_request_capture(route_path(scope), store=debug)
             raise
-        finally:
-            if response is not None:
-                stats = finish_request_capture()
-            else:
-                stats = None
-
-        if stats is not None:
-            response.headers["X-Perf-Trace-Id"] = trace_id
-            response.headers["X-Perf-Query-Count"] = str(stats.query_count)
-            response.headers["X-Perf-Query-Time-Ms"] = f"{stats.query_time_ms:.3f}"
-            response.headers["X-Perf-Response-Time-Ms"] = f"{stats.response_time_ms:.3f}"
-
-        return response
@@ -2,45 +2,49 @@ from __future__ import annotations
 
 import time
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.metrics import http_request_duration_seconds, http_requests_total
 
 UNMATCHED_ROUTE_PATH = '/unmatched'
 
 
-def _route_path(request) -> str:
-    route = request.scope.get('route')
+def route_path(scope: Scope) -> str:
+    route = scope.get('route')
     return getattr(route, 'path', UNMATCHED_ROUTE_PATH)
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
+class PrometheusMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
         started_at = time.perf_counter()
+        status = '500'
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = str(message['status'])
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_status)
         except Exception:
+            status = '500'
+            raise
+        finally:
             duration = time.perf_counter() - started_at
-            route_path = _route_path(request)
-            method = request.method
+            path = route_path(scope)
+            method = scope['method']
 
             http_requests_total.labels(
-                method=method, path=route_path, status='500'
+                method=method, path=path, status=status
             ).inc()
             http_request_duration_seconds.labels(
-                method=method, path=route_path
+                method=method, path=path
             ).observe(duration)
-            raise
-
-        duration = time.perf_counter() - started_at
-        route_path = _route_path(request)
-        method = request.method
-        status = str(response.status_code)
-
-        http_requests_total.labels(method=method, path=route_path, status=status).inc()
-        http_request_duration_seconds.labels(method=method, path=route_path).observe(
-            duration
-        )
-
-        return response
@@ -1,28 +1,60 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from typing import Literal
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from jwt import InvalidTokenError
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp, Receive, Send
+from starlette.types import Scope as ASGIScope
 
-from app.core.jwt_handler import verify_token
+from app.core.auth import resolve_access_identity
+from app.core.local_rate_limit import local_rate_limiter, redis_circuit_breaker
+from app.core.redis import run_script
 from app.core.settings import settings
-from app.metrics import rate_limit_blocked_total
+from app.metrics import rate_limit_blocked_total, rate_limit_fallback_total
 
 logger = logging.getLogger(__name__)
 
 Scope = Literal["ip", "user", "user_or_ip"]
 
-INCREMENT_WITH_EXPIRY_SCRIPT = """
+Algorithm = Literal["fixed_window", "sliding_window"]
+
+# Both scripts return {count, retry_after_seconds} so a request costs one round trip.
+FIXED_WINDOW_SCRIPT = """
 local current_count = redis.call("INCR", KEYS[1])
 if current_count == 1 then
     redis.call("EXPIRE", KEYS[1], ARGV[1])
 end
-return current_count
+return {current_count, redis.call("TTL", KEYS[1])}
+"""
+
+# Sliding window counter: the previous fixed window is weighted by how much of it
+# still overlaps the sliding window. Blocked requests are not counted.
+SLIDING_WINDOW_SCRIPT = """
+local window_ms = tonumber(ARGV[1])
+local elapsed_ms = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local current = tonumber(redis.call("GET", KEYS[1]) or "0")
+local previous = tonumber(redis.call("GET", KEYS[2]) or "0")
+local remaining_ms = window_ms - elapsed_ms
+local count = math.floor(previous * remaining_ms / window_ms) + current + 1
+if count > limit then
+    local retry_ms
+    if current < limit then
+        retry_ms = remaining_ms - math.floor((limit - 1 - current) * window_ms / previous)
+    else
+        retry_ms = remaining_ms + window_ms - math.floor((limit - 1) * window_ms / current)
+    end
+    return {count, math.ceil(math.max(retry_ms, 1) / 1000)}
+end
+if redis.call("INCR", KEYS[1]) == 1 then
+    redis.call("PEXPIRE", KEYS[1], window_ms * 2)
+end
+return {count, math.ceil(remaining_ms / 1000)}
 """
 
 
@@ -34,11 +66,16 @@ class RateLimitPolicy:
     window_seconds: int
     scope: Scope
     exact: bool = True
+    algorithm: Algorithm = "fixed_window"
 
 
 RATE_LIMIT_POLICIES: tuple[RateLimitPolicy, ...] = (
-    RateLimitPolicy("POST", "/users/login", limit=5, window_seconds=60, scope="ip"),
-    RateLimitPolicy("POST", "/users/signup", limit=3, window_seconds=600, scope="ip"),
+    RateLimitPolicy(
+        "POST", "/users/login", limit=5, window_seconds=60, scope="ip", algorithm="sliding_window"
+    ),
+    RateLimitPolicy(
+        "POST", "/users/signup", limit=3, window_seconds=600, scope="ip", algorithm="sliding_window"
+    ),
     RateLimitPolicy("POST", "/users/refresh", limit=20, window_seconds=60, scope="ip"),
     RateLimitPolicy("POST", "/topics", limit=10, window_seconds=60, scope="user"),
     RateLimitPolicy("POST", "/comments", limit=20, window_seconds=60, scope="user"),
@@ -57,52 +94,105 @@ EXCLUDED_PATH_PREFIXES = (
 )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-        if not settings.rate_limit_enabled or self._is_excluded(request.url.path):
-            return await call_next(request)
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: ASGIScope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.rate_limit_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if self._is_excluded(request.url.path):
+            await self.app(scope, receive, send)
+            return
 
         policy = self._find_policy(request.method, request.url.path)
         if policy is None:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         redis_client = getattr(request.app.state, "redis_client", None)
-        if redis_client is None:
-            return await call_next(request)
+        if redis_client is None and not settings.rate_limit_local_fallback_enabled:
+            await self.app(scope, receive, send)
+            return
 
         identity = self._resolve_identity(request, policy.scope)
         key = self._build_key(policy, identity)
 
+        decision = await self._check(redis_client, policy, key)
+        if decision is not None and decision[0]:
+            retry_after = decision[1]
+            rate_limit_blocked_total.labels(
+                method=request.method,
+                path=policy.path,
+                scope=policy.scope,
+            ).inc()
+            response = JSONResponse(
+                status_code=429,
+                content={
+                    "detail": "Rate limit exceeded",
+                    "retry_after": retry_after,
+                },
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def _check(
+        self, redis_client, policy: RateLimitPolicy, key: str
+    ) -> tuple[bool, int] | None:
+        """Return (blocked, retry_after), or None when the request is let through unchecked."""
+        if redis_client is None:
+            # The client is created once at startup and never reconnected, so a process
+            # that started without Redis limits locally until it is restarted.
+            return self._local_check(policy, key, reason="unavailable")
+        if not redis_circuit_breaker.allow_request():
+            return self._without_redis(policy, key, reason="circuit_open")
+
         try:
-            current_count = await redis_client.eval(
-                INCREMENT_WITH_EXPIRY_SCRIPT,
-                1,
-                key,
-                policy.window_seconds,
+            current_count, retry_after = await asyncio.wait_for(
+                self._hit(redis_client, policy, key),
+                timeout=settings.rate_limit_redis_timeout_seconds,
             )
+        except Exception as exc:
+            redis_circuit_breaker.record_failure()
+            return self._without_redis(policy, key, reason="error", error=exc)
+
+        if redis_circuit_breaker.record_success():
+            # Redis is the source of truth again; drop per-process buckets so a later
+            # outage starts from full buckets instead of stale local counts.
+            logger.info("rate limiting recovered; redis circuit closed")
+            local_rate_limiter.clear()
+        return current_count > policy.limit, retry_after
 
-            if current_count > policy.limit:
-                retry_after = await self._retry_after(redis_client, key, policy.window_seconds)
-                rate_limit_blocked_total.labels(
-                    method=request.method,
-                    path=policy.path,
-                    scope=policy.scope,
-                ).inc()
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "detail": "Rate limit exceeded",
-                        "retry_after": retry_after,
-                    },
-                    headers={"Retry-After": str(retry_after)},
-                )
-        except Exception:
-            if settings.rate_limit_fail_open:
-                logger.exception("rate limiting failed; allowing request")
-                return await call_next(request)
-            raise
-
-        return await call_next(request)
+    def _without_redis(
+        self,
+        policy: RateLimitPolicy,
+        key: str,
+        *,
+        reason: str,
+        error: Exception | None = None,
+    ) -> tuple[bool, int] | None:
+        """Decide a request Redis could not check: local limiter, fail open, or raise."""
+        if settings.rate_limit_local_fallback_enabled:
+            if error is not None:
+                logger.warning("rate limiting via redis failed; using local limiter", exc_info=error)
+            return self._local_check(policy, key, reason=reason)
+        if not settings.rate_limit_fail_open:
+            raise error or RuntimeError("rate limiting unavailable: redis circuit is open")
+        if error is not None:
+            logger.error("rate limiting failed; allowing request", exc_info=error)
+        return None
+
+    @staticmethod
+    def _local_check(policy: RateLimitPolicy, key: str, *, reason: str) -> tuple[bool, int]:
+        rate_limit_fallback_total.labels(reason=reason).inc()
+        allowed, retry_after = local_rate_limiter.hit(key, policy.limit, policy.window_seconds)
+        return not allowed, retry_after
 
     @staticmethod
     def _is_excluded(path: str) -> bool:
@@ -122,14 +212,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     @staticmethod
     def _resolve_identity(request: Request, scope: Scope) -> str:
         if scope in {"user", "user_or_ip"}:
-            access_token = request.cookies.get("access_token")
-            if access_token:
-                try:
-                    user_id = verify_token(access_token)
-                    if user_id is not None:
-                        return f"user:{user_id}"
-                except InvalidTokenError:
-                    pass
+            user_id = resolve_access_identity(request).user_id
+            if user_id is not None:
+                return f"user:{user_id}"
 
             if scope == "user":
                 return "user:anonymous"
@@ -142,11 +227,29 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return f"rate_limit:{policy.method}:{normalized_path}:{identity}"
 
     @staticmethod
-    async def _retry_after(redis_client, key: str, default_window: int) -> int:
-        ttl = await redis_client.ttl(key)
-        if ttl is None or ttl < 0:
-            return default_window
-        return int(ttl)
+    async def _hit(redis_client, policy: RateLimitPolicy, key: str) -> tuple[int, int]:
+        if policy.algorithm == "sliding_window":
+            window_ms = policy.window_seconds * 1000
+            now_ms = _now_ms()
+            window_index = now_ms // window_ms
+            current_count, retry_after = await run_script(
+                redis_client,
+                SLIDING_WINDOW_SCRIPT,
+                [f"{key}:{window_index}", f"{key}:{window_index - 1}"],
+                [window_ms, now_ms - window_index * window_ms, policy.limit],
+            )
+        else:
+            current_count, retry_after = await run_script(
+                redis_client, FIXED_WINDOW_SCRIPT, [key], [policy.window_seconds]
+            )
+
+        if retry_after is None or int(retry_after) < 0:
+            retry_after = policy.window_seconds
+        return int(current_count), int(retry_after)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
 
 
 def _client_ip(request: Request) -> str:
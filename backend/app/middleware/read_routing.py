@@ -0,0 +1,57 @@
+import math
+import time
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+from app.db import replicas
+from app.db.replicas import READ_PRIMARY_COOKIE
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins a client's reads to the primary for READ_YOUR_WRITES_SECONDS after it writes.
+    - Successful unsafe requests set the read_primary_until cookie honoured by get_read_db.
+    - Does nothing when no read replica is configured.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._unsafe_methods = {"POST", "PUT", "PATCH", "DELETE"}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self._unsafe_methods
+            or not replicas.replica_router.replicas
+            or settings.read_your_writes_seconds <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("set-cookie", _read_primary_cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def _read_primary_cookie() -> str:
+    seconds = settings.read_your_writes_seconds
+    cookie = SimpleCookie()
+    cookie[READ_PRIMARY_COOKIE] = str(math.ceil(time.time() + seconds))
+    morsel = cookie[READ_PRIMARY_COOKIE]
+    morsel["max-age"] = seconds
+    morsel["path"] = "/"
+    morsel["httponly"] = True
+    if settings.prod:
+        morsel["secure"] = True
+        morsel["samesite"] = "None"
+        if settings.cookie_domain:
+            morsel["domain"] = settings.cookie_domain
+    else:
+        morsel["samesite"] = "Lax"
+    return morsel.OutputString()
@@ -1,44 +1,54 @@
-from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi import Request
+from fastapi.responses import Response
 from jwt import ExpiredSignatureError, InvalidTokenError
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.db.database import AsyncSessionLocal
 from app.core.jwt_handler import verify_token, create_access_token, create_refresh_token
 from app.db.crud import UserCrud
-from app.core.auth import set_auth_cookies, clear_auth_cookies
+from app.core.auth import (
+    AccessIdentity,
+    clear_auth_cookies,
+    resolve_access_identity,
+    set_auth_cookies,
+)
 
 
-class TokenRefreshMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class TokenRefreshMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         if request.url.path == "/users/refresh":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         access_token = request.cookies.get("access_token")
         refresh_token = request.cookies.get("refresh_token")
-        new_tokens: tuple[str, str] | None = None
 
         # 1) Access 토큰이 유효하면 그대로 진행
-        user_id = None
-        if access_token:
-            try:
-                user_id = verify_token(access_token)
-            except (ExpiredSignatureError, InvalidTokenError):
-                user_id = None
+        user_id = resolve_access_identity(request).user_id if access_token else None
 
         # 2) Access 토큰이 없거나 만료/무효일 때만 refresh 시도
         if user_id is None and refresh_token:
             try:
                 user_id = verify_token(refresh_token)
             except (ExpiredSignatureError, InvalidTokenError):
-                response = await call_next(request)
-                clear_auth_cookies(response)
-                return response
+                await self.app(scope, receive, _with_cookie_headers(send, clear_auth_cookies))
+                return
 
             async with AsyncSessionLocal() as db:
                 user = await UserCrud.get_by_id(db, user_id)
                 if not user or user.refresh_token != refresh_token:
-                    response = await call_next(request)
-                    clear_auth_cookies(response)
-                    return response
+                    await self.app(
+                        scope, receive, _with_cookie_headers(send, clear_auth_cookies)
+                    )
+                    return
 
                 new_access_token = create_access_token(user_id)
                 new_refresh_token = create_refresh_token(user_id)
@@ -50,14 +60,47 @@ class TokenRefreshMiddleware(BaseHTTPMiddleware):
                     await db.rollback()
                     raise
 
-                # Downstream dependency에서 새 access 토큰을 쓰도록 요청 쿠키를 갱신
-                request._cookies = dict(request.cookies)
-                request._cookies["access_token"] = new_access_token
-                new_tokens = (new_access_token, new_refresh_token)
+            # Downstream dependency에서 새 access 토큰을 쓰도록 요청 쿠키를 갱신
+            request.state.access_identity = AccessIdentity(has_token=True, user_id=user_id)
+            cookies = dict(request.cookies)
+            cookies["access_token"] = new_access_token
+            await self.app(
+                _with_request_cookies(scope, cookies),
+                receive,
+                _with_cookie_headers(
+                    send,
+                    lambda response: set_auth_cookies(
+                        response, new_access_token, new_refresh_token
+                    ),
+                ),
+            )
+            return
+
+        await self.app(scope, receive, send)
+
+
+def _with_request_cookies(scope: Scope, cookies: dict[str, str]) -> Scope:
+    # Shallow copy keeps scope["state"] shared with the caller.
+    cookie_header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    headers = [(key, value) for key, value in scope["headers"] if key != b"cookie"]
+    headers.append((b"cookie", cookie_header.encode("latin-1")))
+    return {**scope, "headers": headers}
+
 
-        response = await call_next(request)
+def _with_cookie_headers(send: Send, apply_cookies) -> Send:
+    cookie_response = Response()
+    apply_cookies(cookie_response)
+    set_cookie_values = [
+        value.decode("latin-1")
+        for key, value in cookie_response.raw_headers
+        if key == b"set-cookie"
+    ]
 
-        if new_tokens:
-            set_auth_cookies(response, new_tokens[0], new_tokens[1])
+    async def send_with_cookies(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            for value in set_cookie_values:
+                headers.append("set-cookie", value)
+        await send(message)
 
-        return response
+    return send_with_cookies
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
 import time
 import uuid
+from collections import Counter
+from collections.abc import Callable
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
@@ -9,6 +17,17 @@ from typing import Any
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from app.core.settings import settings
+from app.metrics import (
+    db_queries_per_request,
+    db_query_duration_seconds,
+    db_query_fingerprint_info,
+    db_slow_queries_total,
+)
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.perf.slow_query")
+
 CAPTURED_STATS_MAX_ENTRIES = 100
 CAPTURED_STATS_TTL_SECONDS = 600
 
@@ -18,12 +37,15 @@ class QueryRecord:
     statement: str
     parameters: Any
     duration_ms: float
+    engine_id: int | None = None
 
 
 @dataclass
 class RequestPerfStats:
     trace_id: str
     started_at: float
+    method: str = ""
+    route: str = ""
     query_count: int = 0
     query_time_ms: float = 0.0
     queries: list[QueryRecord] = field(default_factory=list)
@@ -39,7 +61,13 @@ _query_started_at: ContextVar[float | None] = ContextVar(
     default=None,
 )
 _captured_stats: dict[str, RequestPerfStats] = {}
-_registered_engine_ids: set[int] = set()
+_registered_engines: dict[int, AsyncEngine] = {}
+_request_observers: list[Callable[[RequestPerfStats], None]] = []
+
+_SQL_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%s|:\w+)\s*,)+\s*(?:\?|%s|:\w+)\s*\)")
+_SQL_PLACEHOLDER = re.compile(r"%s|:\w+|\?")
 
 
 def _prune_captured_stats(now: float) -> None:
@@ -56,23 +84,42 @@ def _prune_captured_stats(now: float) -> None:
         _captured_stats.pop(oldest_trace_id, None)
 
 
-def begin_request_capture() -> str:
+def add_request_observer(observer: Callable[[RequestPerfStats], None]) -> None:
+    """Capture every request and pass its finished stats to ``observer``."""
+    _request_observers.append(observer)
+
+
+def remove_request_observer(observer: Callable[[RequestPerfStats], None]) -> None:
+    if observer in _request_observers:
+        _request_observers.remove(observer)
+
+
+def has_request_observers() -> bool:
+    return bool(_request_observers)
+
+
+def begin_request_capture(method: str = "") -> str:
     trace_id = uuid.uuid4().hex
     _current_stats.set(
-        RequestPerfStats(trace_id=trace_id, started_at=time.perf_counter())
+        RequestPerfStats(trace_id=trace_id, started_at=time.perf_counter(), method=method)
     )
     return trace_id
 
 
-def finish_request_capture() -> RequestPerfStats | None:
+def finish_request_capture(route: str = "", *, store: bool = True) -> RequestPerfStats | None:
+    """End the current capture; ``store`` keeps it for ``build_explain_rows``."""
     stats = _current_stats.get()
     if stats is None:
         return None
 
+    stats.route = route
     stats.response_time_ms = (time.perf_counter() - stats.started_at) * 1000
-    _captured_stats[stats.trace_id] = stats
-    _prune_captured_stats(time.perf_counter())
+    if store:
+        _captured_stats[stats.trace_id] = stats
+        _prune_captured_stats(time.perf_counter())
     _current_stats.set(None)
+    for observer in tuple(_request_observers):
+        observer(stats)
     return stats
 
 
@@ -99,6 +146,29 @@ def _normalize_sql(statement: str) -> str:
     return " ".join(statement.split())
 
 
+def fingerprint_sql(statement: str) -> str:
+    """Normalize a statement so repeats with different values compare equal.
+
+    Literals and bound parameters become ``?`` and expanded ``IN (...)`` lists
+    collapse to ``(?)``, so an N+1 loop produces one fingerprint N times.
+    """
+    fingerprint = _SQL_STRING_LITERAL.sub("?", _normalize_sql(statement))
+    fingerprint = _SQL_NUMBER_LITERAL.sub("?", fingerprint)
+    fingerprint = _SQL_PLACEHOLDER_LIST.sub("(?)", fingerprint)
+    return _SQL_PLACEHOLDER.sub("?", fingerprint)
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Short stable label for a fingerprint, used as a Prometheus label value."""
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:12]
+
+
+def duplicate_fingerprints(stats: RequestPerfStats) -> list[tuple[str, int]]:
+    """Return fingerprints executed more than once in a request, most repeated first."""
+    counts = Counter(fingerprint_sql(query.statement) for query in stats.queries)
+    return [(fingerprint, count) for fingerprint, count in counts.most_common() if count > 1]
+
+
 async def build_explain_rows(db: AsyncSession, trace_id: str) -> list[dict[str, Any]]:
     stats = pop_captured_stats(trace_id)
     if not stats:
@@ -119,26 +189,130 @@ async def build_explain_rows(db: AsyncSession, trace_id: str) -> list[dict[str,
             continue
         seen.add(query_key)
 
-        if dialect_name == "sqlite":
-            explain_sql = f"EXPLAIN QUERY PLAN {query.statement}"
-        else:
-            explain_sql = f"EXPLAIN {query.statement}"
-
-        result = await conn.exec_driver_sql(explain_sql, query.parameters)
         explain_rows.append(
-            {
-                "sql": normalized,
-                "plan": [dict(row._mapping) for row in result.fetchall()],
-            }
+            {"sql": normalized, "plan": await _explain(conn, dialect_name, query)}
         )
 
     return explain_rows
 
 
+async def _explain(conn, dialect_name: str, query: QueryRecord) -> list[dict[str, Any]]:
+    if dialect_name == "sqlite":
+        explain_sql = f"EXPLAIN QUERY PLAN {query.statement}"
+    else:
+        explain_sql = f"EXPLAIN {query.statement}"
+
+    result = await conn.exec_driver_sql(explain_sql, query.parameters)
+    return [dict(row._mapping) for row in result.fetchall()]
+
+
+class QueryProfiler:
+    """Always-on request observer feeding query shape into Prometheus and the slow-query log.
+
+    A ``QUERY_PROFILE_SAMPLE_RATE`` share of requests records its query count
+    per route and each statement's duration per fingerprint. Statements slower
+    than ``SLOW_QUERY_THRESHOLD_MS`` are logged as JSON on every request; the
+    first one per fingerprint in each explain interval also carries an EXPLAIN
+    plan, run on a separate connection after the response has started.
+    """
+
+    def __init__(self):
+        self._explained_at: dict[str, float] = {}
+        self._explain_tasks: set[asyncio.Task] = set()
+        self._started = False
+
+    def start(self) -> None:
+        if self._started or not settings.query_profile_enabled:
+            return
+        add_request_observer(self.observe)
+        self._started = True
+
+    async def stop(self) -> None:
+        remove_request_observer(self.observe)
+        self._started = False
+        await self.wait_pending()
+
+    async def wait_pending(self) -> None:
+        """Wait for in-flight EXPLAIN lookups and their slow-query log lines."""
+        while self._explain_tasks:
+            await asyncio.gather(*self._explain_tasks, return_exceptions=True)
+
+    def observe(self, stats: RequestPerfStats) -> None:
+        if random.random() < settings.query_profile_sample_rate:
+            self._record_profile(stats)
+        for query in stats.queries:
+            if query.duration_ms >= settings.slow_query_threshold_ms:
+                self._record_slow_query(stats, query)
+
+    def _record_profile(self, stats: RequestPerfStats) -> None:
+        db_queries_per_request.labels(method=stats.method, path=stats.route).observe(
+            stats.query_count
+        )
+        for query in stats.queries:
+            fingerprint = fingerprint_sql(query.statement)
+            label = fingerprint_id(fingerprint)
+            db_query_fingerprint_info.labels(fingerprint=label, statement=fingerprint).set(1)
+            db_query_duration_seconds.labels(path=stats.route, fingerprint=label).observe(
+                query.duration_ms / 1000
+            )
+
+    def _record_slow_query(self, stats: RequestPerfStats, query: QueryRecord) -> None:
+        db_slow_queries_total.labels(method=stats.method, path=stats.route).inc()
+        fingerprint = fingerprint_sql(query.statement)
+        record = {
+            "event": "slow_query",
+            "trace_id": stats.trace_id,
+            "method": stats.method,
+            "route": stats.route,
+            "duration_ms": round(query.duration_ms, 3),
+            "fingerprint": fingerprint_id(fingerprint),
+            "statement": _normalize_sql(query.statement),
+            "plan": None,
+        }
+        engine = _registered_engines.get(query.engine_id)
+        if engine is None or not self._should_explain_now(fingerprint, query):
+            _log_slow_query(record)
+            return
+
+        task = asyncio.create_task(self._explain_and_log(engine, query, record))
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    def _should_explain_now(self, fingerprint: str, query: QueryRecord) -> bool:
+        if not settings.slow_query_explain_enabled or not _should_explain(query.statement):
+            return False
+        now = time.monotonic()
+        explained_at = self._explained_at.get(fingerprint)
+        if (
+            explained_at is not None
+            and now - explained_at < settings.slow_query_explain_interval_seconds
+        ):
+            return False
+        self._explained_at[fingerprint] = now
+        return True
+
+    async def _explain_and_log(
+        self, engine: AsyncEngine, query: QueryRecord, record: dict[str, Any]
+    ) -> None:
+        try:
+            async with engine.connect() as conn:
+                record["plan"] = await _explain(conn, engine.dialect.name, query)
+        except Exception:
+            logger.warning("EXPLAIN for slow query %s failed", record["fingerprint"], exc_info=True)
+        _log_slow_query(record)
+
+
+def _log_slow_query(record: dict[str, Any]) -> None:
+    slow_query_logger.warning(json.dumps(record, default=str, ensure_ascii=False))
+
+
+query_profiler = QueryProfiler()
+
+
 def register_async_engine_perf_hooks(async_engine: AsyncEngine) -> None:
     sync_engine = async_engine.sync_engine
     engine_id = id(sync_engine)
-    if engine_id in _registered_engine_ids:
+    if engine_id in _registered_engines:
         return
 
     @event.listens_for(sync_engine, "before_cursor_execute")
@@ -176,8 +350,9 @@ def register_async_engine_perf_hooks(async_engine: AsyncEngine) -> None:
                 statement=statement,
                 parameters=parameters,
                 duration_ms=duration_ms,
+                engine_id=engine_id,
             )
         )
         _query_started_at.set(None)
 
-    _registered_engine_ids.add(engine_id)
+    _registered_engines[engine_id] = async_engine
@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import Any
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import require_admin_user_id
+from app.core.topic_cache import TopicListCache, get_redis_client
 from app.db.database import get_db
 from app.db.schemas.admin import AdminDeleteResponse, AdminMeResponse
 from app.db.schemas.admin_action_logs import AdminActionLogRead
@@ -12,8 +14,12 @@ from app.db.schemas.inquiries import InquiryDeleteUpdate, InquiryRead, InquirySt
 from app.db.schemas.reports import ReportAdminRead, ReportResolutionUpdate
 from app.db.schemas.notifications import ClosedTopicNotificationDispatchResponse
 from app.db.schemas.pagination import PaginatedResponse
-from app.db.schemas.topics import TopicAdminRead, TopicModerationUpdate
-from app.db.schemas.users import UserRead
+from app.db.schemas.topics import (
+    TopicAdminRead,
+    TopicModerationUpdate,
+    TopicStatsRecountResponse,
+)
+from app.db.schemas.users import UserRead, UserStatsRecountResponse
 from app.services import (
     AdminActionLogService,
     CommentService,
@@ -21,7 +27,9 @@ from app.services import (
     NotificationService,
     ReportService,
     TopicService,
+    TopicStatsService,
     UserService,
+    UserStatsService,
 )
 
 router = APIRouter(prefix="/manage-api", tags=["Admin"])
@@ -45,6 +53,15 @@ async def list_users_for_admin(
     )
 
 
+@router.post("/users/stats/recount", response_model=UserStatsRecountResponse)
+async def recount_user_stats(
+    _admin_user_id: int = Depends(require_admin_user_id),
+    db: AsyncSession = Depends(get_db),
+    batch_size: int = Query(default=500, ge=1, le=5000),
+):
+    return await UserStatsService.recount_all(db, batch_size=batch_size)
+
+
 @router.get("/logs", response_model=list[AdminActionLogRead])
 async def list_admin_action_logs(
     _admin_user_id: int = Depends(require_admin_user_id),
@@ -156,14 +173,26 @@ async def list_topics_for_admin(
     )
 
 
+@router.post("/topics/stats/recount", response_model=TopicStatsRecountResponse)
+async def recount_topic_stats(
+    _admin_user_id: int = Depends(require_admin_user_id),
+    db: AsyncSession = Depends(get_db),
+    batch_size: int = Query(default=500, ge=1, le=5000),
+):
+    return await TopicStatsService.recount_all(db, batch_size=batch_size)
+
+
 @router.patch("/topics/{topic_id}/delete", response_model=AdminDeleteResponse)
 async def delete_topic_for_admin(
     topic_id: int,
     update: TopicModerationUpdate,
     admin_user_id: int = Depends(require_admin_user_id),
     db: AsyncSession = Depends(get_db),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await TopicService.delete_for_admin(db, topic_id, update, admin_user_id)
+    result = await TopicService.delete_for_admin(db, topic_id, update, admin_user_id)
+    await TopicListCache.invalidate(redis_client, topics=True)
+    return result
 
 
 @router.get("/comments", response_model=PaginatedResponse[CommentAdminRead])
@@ -226,10 +255,14 @@ async def resolve_report_for_admin(
     update: ReportResolutionUpdate,
     admin_user_id: int = Depends(require_admin_user_id),
     db: AsyncSession = Depends(get_db),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await ReportService.resolve_for_admin(
+    report = await ReportService.resolve_for_admin(
         db, report_id, update, admin_user_id
     )
+    if report.target_type == "topic":
+        await TopicListCache.invalidate(redis_client, topics=True)
+    return report
 
 
 @router.patch("/reports/{report_id}/dismiss", response_model=ReportAdminRead)
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
+from app.db.replicas import get_read_db
 from app.core.auth import get_user_id, get_user_id_optional
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.db.schemas.comments import CommentCreate, CommentUpdate, CommentRead
-from app.services import CommentService
+from app.db.schemas.replys import ReplyRead
+from app.services import CommentService, ReplyService
+from app.services.comment import COMMENT_PAGE_SIZE
 
 router = APIRouter(prefix="/comments", tags=["Comment"])
 
@@ -35,7 +41,37 @@ async def delete_comment(
 @router.get("/by-topic/{topic_id}", response_model=list[CommentRead])
 async def get_comments_by_topic(
     topic_id: int,
+    response: Response,
+    user_id: int | None = Depends(get_user_id_optional),
+    db: AsyncSession = Depends(get_read_db),
+    sort: Literal["oldest", "newest", "like_count"] = Query("oldest"),
+    limit: int | None = Query(None, ge=1, le=100),
+    cursor: str | None = Query(None, min_length=1, max_length=512),
+):
+    # Clients that send neither limit nor cursor get the whole thread, unpaged.
+    if limit is None and cursor is not None:
+        limit = COMMENT_PAGE_SIZE
+    comments = await CommentService.get_page_by_topic_id(
+        db, topic_id, user_id, sort=sort, limit=limit, cursor=cursor
+    )
+    next_cursor = CommentService.next_cursor(comments, sort=sort, limit=limit)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return comments
+
+@router.get("/{comment_id}/replies", response_model=list[ReplyRead])
+async def get_comment_replies(
+    comment_id: int,
+    response: Response,
     user_id: int | None = Depends(get_user_id_optional),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, min_length=1, max_length=512),
 ):
-    return await CommentService.get_all_by_topic_id(db, topic_id, user_id)
\ No newline at end of file
+    replies = await ReplyService.get_page_by_comment_id(
+        db, comment_id, user_id, limit=limit, cursor=cursor
+    )
+    next_cursor = ReplyService.next_cursor(replies, limit=limit)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return replies
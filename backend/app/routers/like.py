@@ -1,7 +1,10 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
 from app.core.auth import get_user_id
+from app.core.topic_cache import TopicListCache, get_redis_client
 from app.services import LikeService
 
 router = APIRouter(prefix="/likes", tags=["Like"])
@@ -12,8 +15,11 @@ async def toggle_topic_like(
     topic_id: int,
     user_id: int = Depends(get_user_id),
     db: AsyncSession = Depends(get_db),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await LikeService.toggle_topic_like(db, user_id, topic_id)
+    liked = await LikeService.toggle_topic_like(db, user_id, topic_id)
+    await TopicListCache.invalidate(redis_client, stats=True)
+    return liked
 
 
 @router.put("/comment/{comment_id}", response_model=bool)
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_user_id
+from app.core.notification_broker import notification_broker
 from app.db.database import get_db
+from app.db.replicas import get_read_db
 from app.db.schemas.notifications import (
     NotificationRead,
     NotificationReadAllResponse,
@@ -16,7 +20,7 @@ router = APIRouter(prefix="/notifications", tags=["Notification"])
 @router.get("", response_model=list[NotificationRead])
 async def list_notifications(
     user_id: int = Depends(get_user_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     limit: int = Query(default=10, ge=1, le=50),
     offset: int = Query(default=0, ge=0),
 ):
@@ -33,6 +37,24 @@ async def get_unread_count(
     return await NotificationService.unread_count(db, user_id)
 
 
+@router.get("/stream")
+async def stream_notifications(
+    user_id: int = Depends(get_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    subscription = notification_broker.subscribe(user_id)
+    if subscription is None:
+        raise HTTPException(status_code=429, detail="Too many notification streams")
+
+    return StreamingResponse(
+        NotificationService.stream_events(db, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also covers responses cancelled before the generator starts.
+        background=BackgroundTask(notification_broker.unsubscribe, subscription),
+    )
+
+
 @router.patch("/{notification_id}/read", response_model=NotificationRead)
 async def mark_notification_as_read(
     notification_id: int,
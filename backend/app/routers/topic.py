@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Literal
+from typing import Any, Literal
 from app.db.database import get_db
+from app.db.replicas import get_read_db
 from app.core.auth import get_user_id, get_user_id_optional
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.topic_cache import TopicListCache, get_redis_client
 from app.db.schemas.topics import TopicCreate, TopicRead
 from app.services import TopicService
 from app.db.crud import PinnedTopicCrud, TopicCrud
@@ -16,22 +19,28 @@ async def create_topic(
     topic_data: TopicCreate,
     user_id: int = Depends(get_user_id),
     db: AsyncSession = Depends(get_db),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await TopicService.create(db, user_id, topic_data)
+    topic = await TopicService.create(db, user_id, topic_data)
+    await TopicListCache.invalidate(redis_client, topics=True)
+    return topic
 
 
 @router.get("", response_model=list[TopicRead])
 async def list_topics(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     user_id: int | None = Depends(get_user_id_optional),
+    redis_client: Any | None = Depends(get_redis_client),
     search: str | None = Query(None, min_length=1, max_length=100),
     category: str | None = Query(None),
     sort: Literal["created_at", "like_count"] = Query("created_at"),
     status: TopicStatus = Query("active"),
     limit: int = Query(10, ge=1, le=50),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, min_length=1, max_length=512),
 ):
-    return await TopicService.get_all(
+    topics = await TopicService.get_all(
         db=db,
         search=search,
         category=category,
@@ -39,23 +48,32 @@ async def list_topics(
         status=status,
         limit=limit,
         offset=offset,
-        user_id=user_id
-    ) 
+        user_id=user_id,
+        cursor=cursor,
+        redis_client=redis_client,
+    )
+    next_cursor = TopicService.next_cursor(topics, sort=sort, status=status, limit=limit)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return topics
 
 
 @router.get("/count", response_model=int)
 async def count_topics(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_id: int | None = Depends(get_user_id_optional),
     search: str | None = Query(None, min_length=1, max_length=100),
     category: str | None = Query(None),
     status: TopicStatus = Query("active"),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await TopicService.count_total(db, category, search, status, user_id)
+    return await TopicService.count_total(
+        db, category, search, status, user_id, redis_client=redis_client
+    )
 
 
 @router.get("/{topic_id}", response_model=TopicRead)
-async def get_topic_detail(topic_id:int, db:AsyncSession = Depends(get_db), user_id: int | None = Depends(get_user_id_optional)):
+async def get_topic_detail(topic_id:int, db:AsyncSession = Depends(get_read_db), user_id: int | None = Depends(get_user_id_optional)):
     db_topic = await TopicService.get_by_id(db,topic_id,user_id)
     return db_topic
 
@@ -64,8 +82,11 @@ async def delete_topic(
     topic_id: int,
     user_id: int = Depends(get_user_id),
     db: AsyncSession = Depends(get_db),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await TopicService.delete(db, topic_id, user_id)
+    deleted = await TopicService.delete(db, topic_id, user_id)
+    await TopicListCache.invalidate(redis_client, topics=True)
+    return deleted
 
 
 @router.post("/{topic_id}/pin", response_model=bool)
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
+from app.db.replicas import get_read_db
 from app.core.auth import get_user_id
+from app.core.topic_cache import TopicListCache, get_redis_client
+from app.core.vote_stream import vote_stream_hub
 from app.db.schemas.votes import VoteCreate, VoteRead, VoteStatsResponse
 from app.services import VoteService
 
@@ -13,8 +20,11 @@ async def vote_on_topic(
     vote_data: VoteCreate,
     user_id: int = Depends(get_user_id),
     db: AsyncSession = Depends(get_db),
+    redis_client: Any | None = Depends(get_redis_client),
 ):
-    return await VoteService.create(db, vote_data, user_id)
+    vote = await VoteService.create(db, vote_data, user_id)
+    await TopicListCache.invalidate(redis_client, stats=True)
+    return vote
 
 
 @router.get("/me", response_model=list[VoteRead])
@@ -30,6 +40,30 @@ async def get_vote_stats(
     topic_id: int,
     time_range: str = Query("24h"),
     interval: str | None = Query(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await VoteService.get_statistics(db, topic_id, time_range, interval)
+
+
+@router.get("/topic/{topic_id}/stream")
+async def stream_vote_results(
+    topic_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    # Subscribe before the snapshot: without Redis, deltas for topics nobody watches
+    # are dropped, so a vote committed in between would otherwise never reach us.
+    subscription = vote_stream_hub.subscribe(topic_id)
+    if subscription is None:
+        raise HTTPException(status_code=503, detail="Too many vote result streams")
+    try:
+        snapshot = await VoteService.get_live_counts(db, topic_id)
+    except BaseException:
+        vote_stream_hub.unsubscribe(subscription)
+        raise
+
+    return StreamingResponse(
+        VoteService.stream_results(snapshot, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(vote_stream_hub.unsubscribe, subscription),
+    )
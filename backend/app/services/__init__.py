@@ -1,5 +1,7 @@
 from .user import UserService
+from .user_stats import UserStatsService
 from .topic import TopicService
+from .topic_stats import TopicStatsService
 from .vote import VoteService
 from .comment import CommentService
 from .reply import ReplyService
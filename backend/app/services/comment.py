@@ -1,6 +1,8 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import decode_keyset_cursor, encode_cursor
+
 from app.db.crud import CommentCrud, LikeCrud, ReplyCrud, UserCrud
 from app.db.schemas.admin import AdminDeleteResponse
 from app.db.schemas.pagination import PaginatedResponse
@@ -15,8 +17,12 @@ from app.db.schemas.comments import (
 from app.db.schemas.replys import ReplyRead
 from app.services.admin_action_log import AdminActionLogService
 from app.services.notification import NotificationService
-from app.services.reply import ReplyService
+from app.services.reply import REPLY_PREVIEW_SIZE, ReplyService
 from app.services.topic import TopicService
+from app.services.topic_stats import TopicStatsService
+from app.services.user_stats import UserStatsService
+
+COMMENT_PAGE_SIZE = 20
 
 
 class CommentService:
@@ -27,6 +33,7 @@ class CommentService:
         topic = await TopicService.get_public_topic(db, comment_data.topic_id)
         try:
             comment = await CommentCrud.create(db, comment_data, user_id)
+            await TopicStatsService.apply_delta(db, topic.topic_id, comment_delta=1)
             actor = await UserCrud.get_by_id(db, user_id)
             await NotificationService.create_if_not_self(
                 db,
@@ -85,12 +92,17 @@ class CommentService:
                 comment.content = "삭제된 댓글입니다."
                 comment.is_deleted = True
                 await db.flush()
+                await TopicStatsService.refresh(db, comment.topic_id)
+                await UserStatsService.refresh(db, [comment.user_id])
                 await db.commit()
                 await db.refresh(comment)
                 return await CommentService._build_comment_read(db, comment, user_id)
 
             await LikeCrud.delete_comment_likes_by_comment_id(db, comment_id)
+            topic_id = comment.topic_id
             deleted = await CommentCrud.delete_by_id(db, comment_id)
+            await TopicStatsService.refresh(db, topic_id)
+            await UserStatsService.refresh(db, [deleted.user_id])
             await db.commit()
             return await CommentService._build_comment_read(db, deleted, user_id)
         except Exception:
@@ -98,31 +110,68 @@ class CommentService:
             raise
 
     @staticmethod
-    async def get_all_by_topic_id(
-        db: AsyncSession, topic_id: int, user_id: int | None = None
+    async def get_page_by_topic_id(
+        db: AsyncSession,
+        topic_id: int,
+        user_id: int | None = None,
+        *,
+        sort: str = "oldest",
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[CommentRead]:
+        # Fixed query count: topic, comments, reply previews, authors, comment likes,
+        # reply likes. ``limit=None`` returns the whole thread with every reply.
         await TopicService.get_public_topic(db, topic_id)
-        comments = await CommentCrud.get_all_by_topic_id(db, topic_id)
+        cursor_values = (
+            decode_keyset_cursor(
+                cursor, expected={"sort": sort}, leading=int(sort == "like_count")
+            )
+            if cursor is not None
+            else None
+        )
+        comments = await CommentCrud.get_page_by_topic_id(
+            db, topic_id, sort=sort, limit=limit, cursor_values=cursor_values
+        )
+        if not comments:
+            return []
         comment_ids = [comment.comment_id for comment in comments]
-        replies_by_comment_id = await ReplyService.get_all_by_comment_ids(
-            db, comment_ids, user_id
+        replies, reply_counts = await ReplyCrud.get_previews_by_comment_ids(
+            db, comment_ids, None if limit is None else REPLY_PREVIEW_SIZE
         )
-        like_counts = await LikeCrud.count_comment_likes_by_comment_ids(
-            db, comment_ids
+        users = await UserCrud.get_by_ids(
+            db,
+            list({comment.user_id for comment in comments} | {reply.user_id for reply in replies}),
         )
-        comment_user_ids = list({comment.user_id for comment in comments})
-        comment_users = await UserCrud.get_by_ids(db, comment_user_ids)
-        return [
-            await CommentService._build_comment_read(
-                db,
-                comment,
-                user_id,
-                replies=replies_by_comment_id.get(comment.comment_id, []),
-                like_count=like_counts.get(comment.comment_id, 0),
-                username=comment_users[comment.user_id].username,
+        like_summaries = await LikeCrud.get_comment_like_summaries(db, comment_ids, user_id)
+        replies_by_comment_id = await ReplyService.build_threads(
+            db, comment_ids, replies, users, user_id
+        )
+        comment_reads = []
+        for comment in comments:
+            like_count, has_liked = like_summaries.get(comment.comment_id, (0, False))
+            comment_reads.append(
+                CommentService._to_comment_read(
+                    comment,
+                    username=users[comment.user_id].username,
+                    replies=replies_by_comment_id[comment.comment_id],
+                    reply_count=reply_counts.get(comment.comment_id, 0),
+                    like_count=like_count,
+                    has_liked=has_liked,
+                )
             )
-            for comment in comments
-        ]
+        return comment_reads
+
+    @staticmethod
+    def next_cursor(
+        comment_reads: list[CommentRead], *, sort: str, limit: int | None
+    ) -> str | None:
+        if limit is None or len(comment_reads) < limit:
+            return None
+        last = comment_reads[-1]
+        values: list = [last.created_at.isoformat(), last.comment_id]
+        if sort == "like_count":
+            values.insert(0, last.like_count)
+        return encode_cursor({"sort": sort, "values": values})
 
     @staticmethod
     async def get_all_for_admin(
@@ -191,7 +240,10 @@ class CommentService:
                 message="작성한 댓글이 관리자에 의해 삭제되었습니다.",
                 link="/profile",
             )
+            authors = await ReplyCrud.get_user_ids_by_comment_id(db, comment_id)
             await CommentCrud.delete_by_id(db, comment_id)
+            await TopicStatsService.refresh(db, comment.topic_id)
+            await UserStatsService.refresh(db, authors | {comment.user_id})
             if commit:
                 await db.commit()
             else:
@@ -206,32 +258,33 @@ class CommentService:
         db: AsyncSession,
         comment: Comment,
         user_id: int | None = None,
-        replies: list[ReplyRead] | None = None,
-        like_count: int | None = None,
-        username: str | None = None,
     ) -> CommentRead:
-        comment_username = username
-        if comment_username is None:
-            user = await UserCrud.get_by_id(db=db, user_id=comment.user_id)
-            comment_username = user.username
-        comment_replies = (
-            replies
-            if replies is not None
-            else await ReplyService.get_all_by_comment_id(
-                db, comment.comment_id, user_id
-            )
-        )
-        comment_like_count = (
-            like_count
-            if like_count is not None
-            else await LikeCrud.count_comment_likes(db, comment.comment_id)
+        user = await UserCrud.get_by_id(db=db, user_id=comment.user_id)
+        replies_by_comment_id, reply_counts = await ReplyService.get_previews_by_comment_ids(
+            db, [comment.comment_id], user_id
         )
-        has_liked = (
-            await LikeCrud.has_user_liked_comment(db, comment.comment_id, user_id)
-            if user_id
-            else False
+        like_count, has_liked = (
+            await LikeCrud.get_comment_like_summaries(db, [comment.comment_id], user_id)
+        ).get(comment.comment_id, (0, False))
+        return CommentService._to_comment_read(
+            comment,
+            username=user.username,
+            replies=replies_by_comment_id[comment.comment_id],
+            reply_count=reply_counts.get(comment.comment_id, 0),
+            like_count=like_count,
+            has_liked=has_liked,
         )
 
+    @staticmethod
+    def _to_comment_read(
+        comment: Comment,
+        *,
+        username: str,
+        replies: list[ReplyRead],
+        reply_count: int,
+        like_count: int,
+        has_liked: bool,
+    ) -> CommentRead:
         return CommentRead(
             comment_id=comment.comment_id,
             user_id=comment.user_id,
@@ -239,8 +292,9 @@ class CommentService:
             content=comment.content,
             is_deleted=comment.is_deleted,
             created_at=comment.created_at,
-            username=comment_username,
-            replies=comment_replies,
-            like_count=comment_like_count,
+            username=username,
+            replies=replies,
+            reply_count=reply_count,
+            like_count=like_count,
             has_liked=has_liked,
         )
@@ -4,6 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.crud import LikeCrud, CommentCrud, ReplyCrud, UserCrud
 from app.services.notification import NotificationService
 from app.services.topic import TopicService
+from app.services.topic_stats import TopicStatsService
+from app.services.user_stats import UserStatsService
 
 
 class LikeService:
@@ -47,9 +49,13 @@ class LikeService:
             )
             if like:
                 await LikeCrud.delete_topic_like(db, like.like_id)
+                await TopicStatsService.apply_delta(db, topic_id, like_delta=-1)
+                await UserStatsService.apply_delta(db, topic.user_id, like_delta=-1)
                 result = False
             else:
                 created_like = await LikeCrud.create_topic_like(db, user_id, topic_id)
+                await TopicStatsService.apply_delta(db, topic_id, like_delta=1)
+                await UserStatsService.apply_delta(db, topic.user_id, like_delta=1)
                 actor = await UserCrud.get_by_id(db, user_id)
                 await NotificationService.create_if_not_self(
                     db,
@@ -86,9 +92,11 @@ class LikeService:
             )
             if like:
                 await LikeCrud.delete_comment_like(db, like.like_id)
+                await UserStatsService.apply_delta(db, comment.user_id, like_delta=-1)
                 result = False
             else:
                 created_like = await LikeCrud.create_comment_like(db, user_id, comment_id)
+                await UserStatsService.apply_delta(db, comment.user_id, like_delta=1)
                 actor = await UserCrud.get_by_id(db, user_id)
                 await NotificationService.create_if_not_self(
                     db,
@@ -126,9 +134,11 @@ class LikeService:
             )
             if like:
                 await LikeCrud.delete_reply_like(db, like.like_id)
+                await UserStatsService.apply_delta(db, reply.user_id, like_delta=-1)
                 result = False
             else:
                 created_like = await LikeCrud.create_reply_like(db, user_id, reply_id)
+                await UserStatsService.apply_delta(db, reply.user_id, like_delta=1)
                 actor = await UserCrud.get_by_id(db, user_id)
                 await NotificationService.create_if_not_self(
                     db,
@@ -1,8 +1,13 @@
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.event_stream import SSE_PING, SSE_RETRY, format_sse, iter_events
+from app.core.notification_broker import NotificationSubscription, notification_broker
+from app.core.notification_counter import unread_notification_counter
+from app.core.settings import settings
 from app.db.crud import NotificationCrud, PinnedTopicCrud, TopicCrud, VoteCrud
 from app.db.schemas.notifications import (
     ClosedTopicNotificationDispatchResponse,
@@ -12,6 +17,8 @@ from app.db.schemas.notifications import (
     NotificationUnreadCount,
 )
 
+CLOSED_TOPIC_DISPATCH_BATCH_SIZE = 20
+
 
 class NotificationService:
     @staticmethod
@@ -49,42 +56,43 @@ class NotificationService:
         )
 
     @staticmethod
-    def _closed_topic_notification_targets(
-        *,
-        author_user_id: int,
-        voter_user_ids: set[int],
-        pinned_user_ids: set[int],
-    ) -> list[tuple[int, str, str]]:
-        targets: list[tuple[int, str, str]] = [
-            (
-                author_user_id,
-                "topic_closed_author",
-                "내가 만든 투표가 마감되었습니다. 결과를 확인해보세요.",
-            )
-        ]
-        notified_user_ids = {author_user_id}
-
-        for user_id in sorted(voter_user_ids - notified_user_ids):
-            targets.append(
-                (
-                    user_id,
-                    "topic_closed_voter",
-                    "참여한 투표가 마감되었습니다. 결과를 확인해보세요.",
-                )
-            )
-            notified_user_ids.add(user_id)
-
-        for user_id in sorted(pinned_user_ids - notified_user_ids):
-            targets.append(
-                (
-                    user_id,
-                    "topic_closed_pinned",
-                    "북마크한 투표가 마감되었습니다. 결과를 확인해보세요.",
-                )
-            )
-            notified_user_ids.add(user_id)
-
-        return targets
+    async def _create_closed_topic_notifications(db: AsyncSession, topic) -> int:
+        # Author first, then voters, then pinners; each user is notified at most once.
+        values = {
+            "target_type": "Topic",
+            "target_id": topic.topic_id,
+            "topic_id": topic.topic_id,
+            "link": f"/topic/{topic.topic_id}?focus=results",
+        }
+        await NotificationCrud.create(
+            db,
+            NotificationCreate(
+                user_id=topic.user_id,
+                type="topic_closed_author",
+                actor_user_id=None,
+                message="내가 만든 투표가 마감되었습니다. 결과를 확인해보세요.",
+                **values,
+            ),
+        )
+        voter_count = await NotificationCrud.create_for_user_ids(
+            db,
+            VoteCrud.user_ids_by_topic_query(topic.topic_id, exclude_user_id=topic.user_id),
+            type="topic_closed_voter",
+            message="참여한 투표가 마감되었습니다. 결과를 확인해보세요.",
+            **values,
+        )
+        pinned_count = await NotificationCrud.create_for_user_ids(
+            db,
+            PinnedTopicCrud.user_ids_by_topic_query(
+                topic.topic_id,
+                exclude_user_id=topic.user_id,
+                exclude_user_ids=VoteCrud.user_ids_by_topic_query(topic.topic_id),
+            ),
+            type="topic_closed_pinned",
+            message="북마크한 투표가 마감되었습니다. 결과를 확인해보세요.",
+            **values,
+        )
+        return 1 + voter_count + pinned_count
 
     @staticmethod
     async def dispatch_closed_topic_notifications(
@@ -92,51 +100,45 @@ class NotificationService:
         *,
         now: datetime | None = None,
         limit: int = 100,
+        batch_size: int = CLOSED_TOPIC_DISPATCH_BATCH_SIZE,
     ) -> ClosedTopicNotificationDispatchResponse:
         current_time = now or datetime.now(timezone.utc)
-        topics = await TopicCrud.get_closed_without_notifications(
-            db, now=current_time, limit=limit
-        )
-        topic_ids = [topic.topic_id for topic in topics]
-        voter_user_ids_by_topic = await VoteCrud.get_user_ids_by_topic_ids(db, topic_ids)
-        pinned_user_ids_by_topic = await PinnedTopicCrud.get_user_ids_by_topic_ids(
-            db, topic_ids
-        )
-
+        processed_topics = 0
         created_count = 0
-        try:
-            for topic in topics:
-                targets = NotificationService._closed_topic_notification_targets(
-                    author_user_id=topic.user_id,
-                    voter_user_ids=voter_user_ids_by_topic.get(topic.topic_id, set()),
-                    pinned_user_ids=pinned_user_ids_by_topic.get(topic.topic_id, set()),
-                )
-                for user_id, notification_type, message in targets:
-                    await NotificationService.create(
-                        db,
-                        NotificationCreate(
-                            user_id=user_id,
-                            type=notification_type,
-                            actor_user_id=None,
-                            target_type="Topic",
-                            target_id=topic.topic_id,
-                            topic_id=topic.topic_id,
-                            message=message,
-                            link=f"/topic/{topic.topic_id}?focus=results",
-                        ),
+
+        # Each batch commits together with closed_notified_at, so an interrupted run
+        # resumes from the first topic that was not committed.
+        while processed_topics < limit:
+            batch_limit = min(batch_size, limit - processed_topics)
+            topics = await TopicCrud.get_closed_without_notifications(
+                db, now=current_time, limit=batch_limit
+            )
+            if not topics:
+                break
+
+            try:
+                batch_created = 0
+                for topic in topics:
+                    batch_created += await NotificationService._create_closed_topic_notifications(
+                        db, topic
                     )
-                    created_count += 1
                 await TopicCrud.mark_closed_notified(
-                    db, topic, notified_at=current_time
+                    db, [topic.topic_id for topic in topics], notified_at=current_time
                 )
-            await db.commit()
-            return ClosedTopicNotificationDispatchResponse(
-                processed_topics=len(topics),
-                created_notifications=created_count,
-            )
-        except Exception:
-            await db.rollback()
-            raise
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+            processed_topics += len(topics)
+            created_count += batch_created
+            if len(topics) < batch_limit:
+                break
+
+        return ClosedTopicNotificationDispatchResponse(
+            processed_topics=processed_topics,
+            created_notifications=created_count,
+        )
 
     @staticmethod
     async def list_for_user(
@@ -149,9 +151,39 @@ class NotificationService:
 
     @staticmethod
     async def unread_count(db: AsyncSession, user_id: int) -> NotificationUnreadCount:
-        count = await NotificationCrud.count_unread_by_user_id(db, user_id)
+        count = await unread_notification_counter.get(user_id)
+        if count is None:
+            count = await NotificationCrud.count_unread_by_user_id(db, user_id)
+            await unread_notification_counter.prime(user_id, count)
         return NotificationUnreadCount(count=count)
 
+    @staticmethod
+    async def stream_events(
+        db: AsyncSession, subscription: NotificationSubscription
+    ) -> AsyncIterator[str]:
+        user_id = subscription.user_id
+        try:
+            yield SSE_RETRY
+            yield await NotificationService._unread_count_event(db, user_id)
+            async for stream_event in iter_events(
+                subscription, settings.notification_stream_heartbeat_seconds
+            ):
+                if stream_event is None:
+                    yield SSE_PING
+                    continue
+
+                yield format_sse(stream_event["event"], stream_event["data"])
+                yield await NotificationService._unread_count_event(db, user_id)
+        finally:
+            notification_broker.unsubscribe(subscription)
+
+    @staticmethod
+    async def _unread_count_event(db: AsyncSession, user_id: int) -> str:
+        unread = await NotificationService.unread_count(db, user_id)
+        # Release the pooled connection between events when the count came from the DB.
+        await db.rollback()
+        return format_sse("unread_count", unread.model_dump())
+
     @staticmethod
     async def mark_as_read(
         db: AsyncSession, user_id: int, notification_id: int
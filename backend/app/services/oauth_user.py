@@ -7,6 +7,7 @@ from app.core.jwt_handler import get_password_hash
 from app.db.crud import UserCrud
 from app.db.models import User
 from app.db.schemas.users import UserCreate
+from app.services.user_stats import UserStatsService
 
 
 async def ensure_oauth_user(
@@ -37,6 +38,7 @@ async def ensure_oauth_user(
 
     try:
         db_user = await UserCrud.create(db, user_create)
+        await UserStatsService.create_for_user(db, db_user.user_id)
         await db.commit()
         await db.refresh(db_user)
         return db_user
@@ -1,12 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from app.db.models import Reply
+from app.core.pagination import decode_keyset_cursor, encode_cursor
+from app.db.models import Reply, User
 from app.db.crud import UserCrud, ReplyCrud, LikeCrud, CommentCrud
 from app.db.schemas.replys import ReplyRead, ReplyCreate, ReplyUpdate
 from app.services.notification import NotificationService
 from app.db.schemas.admin import AdminDeleteResponse
 from app.services.admin_action_log import AdminActionLogService
 from app.services.topic import TopicService
+from app.services.topic_stats import TopicStatsService
+from app.services.user_stats import UserStatsService
+
+# Replies embedded in each comment; the rest are paged via GET /comments/{id}/replies.
+REPLY_PREVIEW_SIZE = 3
 
 
 class ReplyService:
@@ -32,6 +38,7 @@ class ReplyService:
                 )
         try:
             reply = await ReplyCrud.create(db, reply_data, user_id)
+            await TopicStatsService.apply_delta(db, comment.topic_id, reply_delta=1)
             actor = await UserCrud.get_by_id(db, user_id)
             notified_user_ids: set[int] = set()
 
@@ -98,16 +105,22 @@ class ReplyService:
         if reply.user_id != user_id:
             raise HTTPException(status_code=403, detail="Not your reply")
         try:
+            # Child replies are deleted with their likes, so refresh every replier in the thread.
+            authors = await ReplyCrud.get_user_ids_by_comment_id(db, reply.comment_id)
             await LikeCrud.delete_reply_likes_by_reply_id(db, reply_id)
             deleted = await ReplyCrud.delete_by_id(db, reply_id)
 
             # If parent comment was soft-deleted and now has no replies, hard delete it.
+            parent_comment = await CommentCrud.get_by_id(db, reply.comment_id)
+            topic_id = parent_comment.topic_id if parent_comment else None
             remaining = await ReplyCrud.count_by_comment_id(db, reply.comment_id)
             if remaining == 0:
-                parent_comment = await CommentCrud.get_by_id(db, reply.comment_id)
                 if parent_comment and getattr(parent_comment, "is_deleted", False):
                     await CommentCrud.delete_by_id(db, parent_comment.comment_id)
 
+            if topic_id is not None:
+                await TopicStatsService.refresh(db, topic_id)
+            await UserStatsService.refresh(db, authors)
             await db.commit()
             return await ReplyService._build_reply_read(db, deleted, user_id)
         except Exception:
@@ -115,34 +128,83 @@ class ReplyService:
             raise
 
     @staticmethod
-    async def get_all_by_comment_id(
-        db: AsyncSession, comment_id: int, user_id: int | None = None
+    async def get_page_by_comment_id(
+        db: AsyncSession,
+        comment_id: int,
+        user_id: int | None = None,
+        *,
+        limit: int = 20,
+        cursor: str | None = None,
     ) -> list[ReplyRead]:
-        replies = await ReplyCrud.get_all_by_comment_id(db, comment_id)
-        built = [await ReplyService._build_reply_read(db, r, user_id) for r in replies]
-        return ReplyService._build_reply_tree(built)
+        """Return one page of a thread, oldest first and flat; clients nest by parent_reply_id."""
+        comment = await CommentCrud.get_by_id(db, comment_id)
+        if not comment or comment.is_hidden:
+            raise HTTPException(status_code=404, detail="Comment not found")
+        await TopicService.get_public_topic(db, comment.topic_id)
+        cursor_values = (
+            decode_keyset_cursor(cursor, expected={}, leading=0) if cursor is not None else None
+        )
+        replies = await ReplyCrud.get_page_by_comment_id(
+            db, comment_id, limit=limit, cursor_values=cursor_values
+        )
+        users = await UserCrud.get_by_ids(db, list({reply.user_id for reply in replies}))
+        like_summaries = await LikeCrud.get_reply_like_summaries(
+            db, [reply.reply_id for reply in replies], user_id
+        )
+        reply_reads = []
+        for reply in replies:
+            like_count, has_liked = like_summaries.get(reply.reply_id, (0, False))
+            reply_reads.append(
+                ReplyService._to_reply_read(
+                    reply,
+                    username=users[reply.user_id].username,
+                    like_count=like_count,
+                    has_liked=has_liked,
+                )
+            )
+        return reply_reads
+
+    @staticmethod
+    def next_cursor(reply_reads: list[ReplyRead], *, limit: int) -> str | None:
+        if len(reply_reads) < limit:
+            return None
+        last = reply_reads[-1]
+        return encode_cursor({"values": [last.created_at.isoformat(), last.reply_id]})
 
     @staticmethod
-    async def get_all_by_comment_ids(
+    async def get_previews_by_comment_ids(
         db: AsyncSession, comment_ids: list[int], user_id: int | None = None
+    ) -> tuple[dict[int, list[ReplyRead]], dict[int, int]]:
+        replies, reply_counts = await ReplyCrud.get_previews_by_comment_ids(
+            db, comment_ids, REPLY_PREVIEW_SIZE
+        )
+        users = await UserCrud.get_by_ids(db, list({reply.user_id for reply in replies}))
+        threads = await ReplyService.build_threads(db, comment_ids, replies, users, user_id)
+        return threads, reply_counts
+
+    @staticmethod
+    async def build_threads(
+        db: AsyncSession,
+        comment_ids: list[int],
+        replies: list[Reply],
+        users: dict[int, User],
+        user_id: int | None = None,
     ) -> dict[int, list[ReplyRead]]:
-        replies = await ReplyCrud.get_all_by_comment_ids(db, comment_ids)
-        reply_ids = [reply.reply_id for reply in replies]
-        reply_user_ids = list({reply.user_id for reply in replies})
-        like_counts = await LikeCrud.count_reply_likes_by_reply_ids(db, reply_ids)
-        reply_users = await UserCrud.get_by_ids(db, reply_user_ids)
+        """Group already-loaded replies into per-comment trees with one like query."""
+        like_summaries = await LikeCrud.get_reply_like_summaries(
+            db, [reply.reply_id for reply in replies], user_id
+        )
         built_by_comment_id: dict[int, list[ReplyRead]] = {
             comment_id: [] for comment_id in comment_ids
         }
-
         for reply in replies:
+            like_count, has_liked = like_summaries.get(reply.reply_id, (0, False))
             built_by_comment_id.setdefault(reply.comment_id, []).append(
-                await ReplyService._build_reply_read(
-                    db,
+                ReplyService._to_reply_read(
                     reply,
-                    user_id,
-                    like_count=like_counts.get(reply.reply_id, 0),
-                    username=reply_users[reply.user_id].username,
+                    username=users[reply.user_id].username,
+                    like_count=like_count,
+                    has_liked=has_liked,
                 )
             )
 
@@ -153,14 +215,27 @@ class ReplyService:
 
     @staticmethod
     def _build_reply_tree(built: list[ReplyRead]) -> list[ReplyRead]:
-        # Build nested tree using parent_reply_id
-        reply_map: dict[int, ReplyRead] = {r.reply_id: r for r in built}
+        # One pass over parent_reply_id; a child seen before its parent waits in
+        # `pending` until the parent arrives.
+        reply_map: dict[int, ReplyRead] = {}
+        pending: dict[int, list[ReplyRead]] = {}
+        position: dict[int, int] = {}
         roots: list[ReplyRead] = []
-        for r in built:
-            if r.parent_reply_id and r.parent_reply_id in reply_map:
+        for index, r in enumerate(built):
+            reply_map[r.reply_id] = r
+            position[r.reply_id] = index
+            r.replies.extend(pending.pop(r.reply_id, ()))
+            if not r.parent_reply_id:
+                roots.append(r)
+            elif r.parent_reply_id in reply_map:
                 reply_map[r.parent_reply_id].replies.append(r)
             else:
-                roots.append(r)
+                pending.setdefault(r.parent_reply_id, []).append(r)
+
+        if pending:
+            # Parents outside this comment's replies leave their children at the root.
+            roots.extend(child for children in pending.values() for child in children)
+            roots.sort(key=lambda r: position[r.reply_id])
         return roots
 
     @staticmethod
@@ -168,27 +243,26 @@ class ReplyService:
         db: AsyncSession,
         reply: Reply,
         user_id: int | None = None,
-        like_count: int | None = None,
-        username: str | None = None,
     ) -> ReplyRead:
-        reply_username = username
-        if reply_username is None:
-            user = await UserCrud.get_by_id(db=db, user_id=reply.user_id)
-            reply_username = user.username
-        reply_like_count = (
-            like_count
-            if like_count is not None
-            else await LikeCrud.count_reply_likes(db, reply.reply_id)
+        user = await UserCrud.get_by_id(db=db, user_id=reply.user_id)
+        like_count, has_liked = (
+            await LikeCrud.get_reply_like_summaries(db, [reply.reply_id], user_id)
+        ).get(reply.reply_id, (0, False))
+        return ReplyService._to_reply_read(
+            reply, username=user.username, like_count=like_count, has_liked=has_liked
         )
-        has_liked = await LikeCrud.has_user_liked_reply(db, reply.reply_id, user_id) if user_id else False
-
 
+    @staticmethod
+    def _to_reply_read(
+        reply: Reply, *, username: str, like_count: int, has_liked: bool
+    ) -> ReplyRead:
         return ReplyRead(
             **reply.__dict__,
-            username=reply_username,
-            like_count=reply_like_count,
+            username=username,
+            like_count=like_count,
             has_liked=has_liked,
         )
+
     @staticmethod
     async def delete_for_admin(
         db: AsyncSession,
@@ -235,7 +309,11 @@ class ReplyService:
                 message="작성한 답글이 관리자에 의해 삭제되었습니다.",
                 link="/profile",
             )
+            authors = await ReplyCrud.get_user_ids_by_comment_id(db, reply.comment_id)
             await ReplyCrud.delete_by_id(db, reply_id)
+            if comment:
+                await TopicStatsService.refresh(db, comment.topic_id)
+            await UserStatsService.refresh(db, authors)
             if commit:
                 await db.commit()
             else:
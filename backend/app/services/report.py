@@ -174,20 +174,18 @@ class ReportService:
                     commit=False,
                 )
 
-            now = datetime.now(timezone.utc)
             for related in related_reports:
                 await ReportService._notify_reporter(
                     db, related, admin_user_id, "신고한 콘텐츠가 운영정책 위반으로 처리되었습니다."
                 )
-                await ReportCrud.resolve_target_reports(
-                    db,
-                    target_type=related.target_type,
-                    target_id=related.target_id,
-                    status="resolved",
-                    handled_by=admin_user_id,
-                    handled_at=now,
-                    resolution=update.resolution,
-                )
+            await ReportCrud.resolve_by_ids(
+                db,
+                [related.report_id for related in related_reports],
+                status="resolved",
+                handled_by=admin_user_id,
+                handled_at=datetime.now(timezone.utc),
+                resolution=update.resolution,
+            )
             await AdminActionLogService.record(
                 db,
                 admin_user_id=admin_user_id,
@@ -213,11 +211,9 @@ class ReportService:
         admin_user_id: int,
     ) -> ReportAdminRead:
         report = await ReportService._get_pending_for_update(db, report_id)
-        reports, _ = await ReportCrud.get_all_for_admin(db, status="pending")
-        matching = [
-            item for item in reports
-            if item.target_type == report.target_type and item.target_id == report.target_id
-        ]
+        matching = await ReportCrud.get_pending_by_targets(
+            db, report.target_type, [report.target_id]
+        )
         try:
             now = datetime.now(timezone.utc)
             for item in matching:
@@ -261,20 +257,16 @@ class ReportService:
 
     @staticmethod
     async def _get_related_pending_reports(db: AsyncSession, report):
-        pending, _ = await ReportCrud.get_all_for_admin(db, status="pending")
         if report.target_type == "topic":
-            topic_id = report.target_id
-            return [item for item in pending if item.target_snapshot.get("topic_id") == topic_id]
+            return await ReportCrud.get_pending_by_topic_id(db, report.target_id)
         if report.target_type == "comment":
-            comment_id = report.target_id
-            return [
-                item for item in pending
-                if item.target_id == comment_id and item.target_type == "comment"
-                or item.target_type == "reply" and item.target_snapshot.get("comment_id") == comment_id
-            ]
+            return await ReportCrud.get_pending_by_comment_id(db, report.target_id)
 
-        comment_id = report.target_snapshot.get("comment_id")
-        replies = await ReplyCrud.get_all_by_comment_id(db, comment_id) if comment_id else []
+        replies = (
+            await ReplyCrud.get_all_by_comment_id(db, report.comment_id)
+            if report.comment_id
+            else []
+        )
         children_by_parent: dict[int, list[int]] = {}
         for reply in replies:
             if reply.parent_reply_id is not None:
@@ -285,7 +277,7 @@ class ReportService:
             children = children_by_parent.get(stack.pop(), [])
             target_ids.update(children)
             stack.extend(children)
-        return [item for item in pending if item.target_type == "reply" and item.target_id in target_ids]
+        return await ReportCrud.get_pending_by_targets(db, "reply", sorted(target_ids))
 
     @staticmethod
     async def _notify_reporter(
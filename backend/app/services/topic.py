@@ -1,20 +1,22 @@
 from datetime import datetime, timezone
+from typing import Any
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import decode_keyset_cursor, encode_cursor
+from app.core.topic_cache import TopicListCache
+from app.db.replicas import is_replica_session
 from app.db.crud import (
-    CommentCrud,
     LikeCrud,
     PinnedTopicCrud,
-    ReplyCrud,
     TopicCrud,
     UserCrud,
     VoteCrud,
 )
 from app.db.schemas.admin import AdminDeleteResponse
 from app.db.schemas.pagination import PaginatedResponse
-from app.db.models import Topic
+from app.db.models import Topic, TopicStats
 from app.db.schemas.topics import (
     TopicAdminRead,
     TopicCreate,
@@ -23,6 +25,8 @@ from app.db.schemas.topics import (
 )
 from app.services.admin_action_log import AdminActionLogService
 from app.services.notification import NotificationService
+from app.services.topic_stats import TopicStatsService
+from app.services.user_stats import UserStatsService
 
 
 class TopicService:
@@ -51,6 +55,8 @@ class TopicService:
     async def create(db: AsyncSession, user_id: int, topic_data: TopicCreate) -> TopicRead:
         try:
             db_topic = await TopicCrud.create(db, topic_data, user_id)
+            await TopicStatsService.create_for_topic(db, db_topic)
+            await UserStatsService.apply_delta(db, user_id, topic_delta=1)
             await db.commit()
             await db.refresh(db_topic)
             public_topic = await TopicCrud.get_public_by_id(db, db_topic.topic_id)
@@ -76,32 +82,64 @@ class TopicService:
         limit: int = 10,
         offset: int = 0,
         user_id: int | None = None,
+        cursor: str | None = None,
+        redis_client: Any | None = None,
     ) -> list[TopicRead]:
+        # Only anonymous pages are shared between viewers; signed-in responses carry
+        # per-user vote/pin state.
+        cache_client = redis_client if user_id is None else None
+        cache_params = {
+            "search": search,
+            "category": category,
+            "sort": sort,
+            "status": status,
+            "limit": limit,
+            "offset": offset if cursor is None else None,
+            "cursor": cursor,
+        }
+        cached, cache_key = await TopicListCache.get(cache_client, "list", cache_params)
+        if cached is not None:
+            return [TopicRead.model_validate(item) for item in cached]
+
+        cursor_values = (
+            decode_keyset_cursor(
+                cursor,
+                expected={"sort": sort, "status": status},
+                leading=(status == "all") + (sort == "like_count"),
+            )
+            if cursor is not None
+            else None
+        )
         db_topics = await TopicCrud.get_all_with_filters(
-            db, search, category, sort, status, limit, offset, user_id
+            db,
+            search,
+            category,
+            sort,
+            status,
+            limit,
+            offset,
+            user_id,
+            cursor_values=cursor_values,
         )
-        topic_ids = [topic.topic_id for topic in db_topics]
         pinned_map: dict[int, int] = {}
         pinned_topic_ids: set[int] = set()
         if user_id is not None:
             pinned = await PinnedTopicCrud.list_by_user(db, user_id)
             pinned_map = {p.topic_id: idx for idx, p in enumerate(pinned)}
             pinned_topic_ids = {p.topic_id for p in pinned}
-        vote_counts_by_topic = await VoteCrud.get_vote_counts_by_topic_ids(db, topic_ids)
-        like_counts = await LikeCrud.count_topic_likes_by_topic_ids(db, topic_ids)
-        comment_counts = await CommentCrud.count_active_by_topic_ids(db, topic_ids)
-        reply_counts = await ReplyCrud.count_by_topic_ids(db, topic_ids)
+        stats_by_topic = await TopicStatsService.get_by_topics(db, list(db_topics))
+        viewer_votes, viewer_liked_topic_ids = await TopicService._load_viewer_state(
+            db, [db_topic.topic_id for db_topic in db_topics], user_id
+        )
 
         topic_reads = [
             await TopicService._build_topic_read(
                 db,
                 db_topic,
                 user_id,
-                vote_counts=vote_counts_by_topic.get(db_topic.topic_id, {}),
-                like_count=like_counts.get(db_topic.topic_id, 0),
-                comment_count=comment_counts.get(db_topic.topic_id, 0),
-                reply_count=reply_counts.get(db_topic.topic_id, 0),
+                stats=stats_by_topic[db_topic.topic_id],
                 is_pinned=db_topic.topic_id in pinned_topic_ids,
+                viewer_state=(viewer_votes, viewer_liked_topic_ids),
             )
             for db_topic in db_topics
         ]
@@ -109,8 +147,42 @@ class TopicService:
         if pinned_map:
             topic_reads.sort(key=lambda t: pinned_map.get(t.topic_id, 10**9))
 
+        # Only the primary fills the shared cache: a lagging replica would stamp its
+        # stale page with the version a write just bumped, for the whole TTL.
+        if not is_replica_session(db):
+            await TopicListCache.set(
+                cache_client,
+                cache_key,
+                [topic_read.model_dump(mode="json") for topic_read in topic_reads],
+            )
         return topic_reads
 
+    @staticmethod
+    def next_cursor(
+        topic_reads: list[TopicRead], *, sort: str, status: str, limit: int
+    ) -> str | None:
+        if len(topic_reads) < limit:
+            return None
+
+        # Pinned topics are re-ordered in memory, so the page boundary is the
+        # smallest sort key rather than the last item.
+        last_values = min(
+            TopicService._list_sort_key(topic, sort, status) for topic in topic_reads
+        )
+        values = list(last_values)
+        values[-2] = values[-2].isoformat()
+        return encode_cursor({"sort": sort, "status": status, "values": values})
+
+    @staticmethod
+    def _list_sort_key(topic: TopicRead, sort: str, status: str) -> tuple:
+        values: list = []
+        if status == "all":
+            values.append(0 if topic.is_closed else 1)
+        if sort == "like_count":
+            values.append(topic.like_count)
+        values.extend([topic.created_at, topic.topic_id])
+        return tuple(values)
+
     @staticmethod
     async def count_total(
         db: AsyncSession,
@@ -118,8 +190,18 @@ class TopicService:
         search: str | None,
         status: str,
         user_id: int | None = None,
+        redis_client: Any | None = None,
     ) -> int:
-        return await TopicCrud.count_all_with_filters(db, category, search, status, user_id)
+        cache_client = redis_client if user_id is None else None
+        cache_params = {"search": search, "category": category, "status": status}
+        cached, cache_key = await TopicListCache.get(cache_client, "count", cache_params)
+        if cached is not None:
+            return cached
+
+        total = await TopicCrud.count_all_with_filters(db, category, search, status, user_id)
+        if not is_replica_session(db):
+            await TopicListCache.set(cache_client, cache_key, total)
+        return total
 
     @staticmethod
     async def get_all_for_admin(
@@ -198,7 +280,9 @@ class TopicService:
                 message="작성한 토픽이 관리자에 의해 삭제되었습니다.",
                 link="/profile",
             )
+            authors = await UserStatsService.before_topic_delete(db, topic)
             deleted = await TopicCrud.delete_by_id(db, topic_id)
+            await UserStatsService.refresh(db, authors)
             if commit:
                 await db.commit()
             else:
@@ -217,7 +301,9 @@ class TopicService:
             raise HTTPException(status_code=403, detail="Not your topic")
         try:
             await PinnedTopicCrud.unpin_by_topic(db, topic_id)
+            authors = await UserStatsService.before_topic_delete(db, topic)
             deleted = await TopicCrud.delete_by_id(db, topic_id)
+            await UserStatsService.refresh(db, authors)
             await db.commit()
             return deleted
         except Exception:
@@ -229,45 +315,52 @@ class TopicService:
         db: AsyncSession,
         topic: Topic,
         user_id: int | None = None,
-        vote_counts: dict[int, int] | None = None,
-        like_count: int | None = None,
-        comment_count: int | None = None,
-        reply_count: int | None = None,
+        stats: TopicStats | None = None,
         is_pinned: bool = False,
+        viewer_state: tuple[dict[int, int], set[int]] | None = None,
     ) -> TopicRead:
-        if vote_counts is None:
-            vote_counts = await VoteCrud.get_vote_counts_by_topic_id(db, topic.topic_id)
-        if like_count is None:
-            like_count = await LikeCrud.count_topic_likes(db, topic.topic_id)
-        if comment_count is None:
-            comment_count = await CommentCrud.count_active_by_topic_id(db, topic.topic_id)
-        if reply_count is None:
-            reply_count = await ReplyCrud.count_by_topic_id(db, topic.topic_id)
+        if stats is None:
+            stats = (await TopicStatsService.get_by_topics(db, [topic]))[topic.topic_id]
 
         vote_results = [0] * len(topic.vote_options)
-        for vote_index, count in vote_counts.items():
-            if 0 <= vote_index < len(vote_results):
+        for vote_index, count in enumerate(stats.vote_counts):
+            if vote_index < len(vote_results):
                 vote_results[vote_index] = count
 
         result = TopicRead(
             **topic.__dict__,
             author_name=topic.user.username if topic.user else None,
             vote_results=vote_results,
-            total_vote=sum(vote_counts.values()),
-            like_count=like_count,
-            comment_count=comment_count + reply_count,
+            total_vote=sum(stats.vote_counts),
+            like_count=stats.like_count,
+            comment_count=stats.comment_count + stats.reply_count,
             is_closed=TopicService.is_closed(topic),
         )
 
         if user_id is not None:
-            vote = await VoteCrud.get_by_topic_and_user(db, topic.topic_id, user_id)
-            result.has_voted = vote is not None
-            result.user_vote_index = vote.vote_index if vote else None
-            result.has_liked = await LikeCrud.has_user_liked_topic(
-                db, topic.topic_id, user_id
-            )
-
-        if user_id is not None:
+            if viewer_state is None:
+                viewer_state = await TopicService._load_viewer_state(
+                    db, [topic.topic_id], user_id
+                )
+            viewer_votes, viewer_liked_topic_ids = viewer_state
+            result.has_voted = topic.topic_id in viewer_votes
+            result.user_vote_index = viewer_votes.get(topic.topic_id)
+            result.has_liked = topic.topic_id in viewer_liked_topic_ids
             result.is_pinned = is_pinned
 
         return result
+
+    @staticmethod
+    async def _load_viewer_state(
+        db: AsyncSession, topic_ids: list[int], user_id: int | None
+    ) -> tuple[dict[int, int], set[int]]:
+        if user_id is None or not topic_ids:
+            return {}, set()
+
+        viewer_votes = await VoteCrud.get_vote_indexes_by_user_and_topic_ids(
+            db, user_id, topic_ids
+        )
+        viewer_liked_topic_ids = await LikeCrud.get_liked_topic_ids_by_user(
+            db, user_id, topic_ids
+        )
+        return viewer_votes, viewer_liked_topic_ids
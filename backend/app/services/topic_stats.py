@@ -0,0 +1,128 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.crud import CommentCrud, LikeCrud, ReplyCrud, TopicCrud, TopicStatsCrud, VoteCrud
+from app.db.models import Topic, TopicStats
+from app.db.schemas.topics import TopicStatsRecountResponse
+
+
+class TopicStatsService:
+    @staticmethod
+    async def create_for_topic(db: AsyncSession, topic: Topic) -> TopicStats:
+        return await TopicStatsCrud.create(db, topic.topic_id, len(topic.vote_options))
+
+    @staticmethod
+    async def get_by_topics(
+        db: AsyncSession, topics: list[Topic]
+    ) -> dict[int, TopicStats]:
+        stats_by_topic = await TopicStatsCrud.get_by_topic_ids(
+            db, [topic.topic_id for topic in topics]
+        )
+        # Topics written before the counter table existed (or by tooling that bypasses
+        # the services) fall back to live aggregation until the recount job repairs them.
+        missing = [topic for topic in topics if topic.topic_id not in stats_by_topic]
+        if missing:
+            counted = await TopicStatsService._count_by_topics(db, missing)
+            for topic_id, values in counted.items():
+                stats_by_topic[topic_id] = TopicStats(topic_id=topic_id, **values)
+        return stats_by_topic
+
+    @staticmethod
+    async def apply_delta(
+        db: AsyncSession,
+        topic_id: int,
+        *,
+        vote_index: int | None = None,
+        like_delta: int = 0,
+        comment_delta: int = 0,
+        reply_delta: int = 0,
+    ) -> TopicStats | None:
+        """Apply a counter change for a write that has already been flushed."""
+        stats = await TopicStatsCrud.get_for_update(db, topic_id)
+        if stats is None:
+            return await TopicStatsService.refresh(db, topic_id)
+
+        if vote_index is not None:
+            vote_counts = list(stats.vote_counts)
+            if vote_index >= len(vote_counts):
+                vote_counts.extend([0] * (vote_index + 1 - len(vote_counts)))
+            vote_counts[vote_index] += 1
+            stats.vote_counts = vote_counts
+        stats.like_count = max(stats.like_count + like_delta, 0)
+        stats.comment_count = max(stats.comment_count + comment_delta, 0)
+        stats.reply_count = max(stats.reply_count + reply_delta, 0)
+        await db.flush()
+        return stats
+
+    @staticmethod
+    async def refresh(db: AsyncSession, topic_id: int) -> TopicStats | None:
+        topic = await TopicCrud.get_by_id(db, topic_id)
+        if topic is None:
+            return None
+
+        counted = await TopicStatsService._count_by_topics(db, [topic])
+        return await TopicStatsCrud.upsert(db, topic_id, **counted[topic_id])
+
+    @staticmethod
+    async def recount_all(
+        db: AsyncSession, *, batch_size: int = 500
+    ) -> TopicStatsRecountResponse:
+        processed_topics = 0
+        repaired_topics = 0
+        after_topic_id = 0
+        try:
+            while True:
+                topics = await TopicCrud.get_batch_after_id(
+                    db, after_topic_id=after_topic_id, limit=batch_size
+                )
+                if not topics:
+                    break
+
+                stored = await TopicStatsCrud.get_by_topic_ids(
+                    db, [topic.topic_id for topic in topics]
+                )
+                counted = await TopicStatsService._count_by_topics(db, topics)
+                for topic in topics:
+                    values = counted[topic.topic_id]
+                    current = stored.get(topic.topic_id)
+                    if current is None or any(
+                        getattr(current, key) != value for key, value in values.items()
+                    ):
+                        await TopicStatsCrud.upsert(db, topic.topic_id, **values)
+                        repaired_topics += 1
+
+                processed_topics += len(topics)
+                after_topic_id = topics[-1].topic_id
+                await db.commit()
+
+            return TopicStatsRecountResponse(
+                processed_topics=processed_topics,
+                repaired_topics=repaired_topics,
+            )
+        except Exception:
+            await db.rollback()
+            raise
+
+    @staticmethod
+    async def _count_by_topics(
+        db: AsyncSession, topics: list[Topic]
+    ) -> dict[int, dict[str, int | list[int]]]:
+        topic_ids = [topic.topic_id for topic in topics]
+        vote_counts_by_topic = await VoteCrud.get_vote_counts_by_topic_ids(db, topic_ids)
+        like_counts = await LikeCrud.count_topic_likes_by_topic_ids(db, topic_ids)
+        comment_counts = await CommentCrud.count_active_by_topic_ids(db, topic_ids)
+        reply_counts = await ReplyCrud.count_by_topic_ids(db, topic_ids)
+
+        counted: dict[int, dict[str, int | list[int]]] = {}
+        for topic in topics:
+            vote_counts = [0] * len(topic.vote_options)
+            for vote_index, count in vote_counts_by_topic.get(topic.topic_id, {}).items():
+                if vote_index >= len(vote_counts):
+                    vote_counts.extend([0] * (vote_index + 1 - len(vote_counts)))
+                vote_counts[vote_index] = count
+            counted[topic.topic_id] = {
+                "vote_counts": vote_counts,
+                "like_count": like_counts.get(topic.topic_id, 0),
+                "comment_count": comment_counts.get(topic.topic_id, 0),
+                "reply_count": reply_counts.get(topic.topic_id, 0),
+            }
+        return counted
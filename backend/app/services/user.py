@@ -12,7 +12,7 @@ from app.core.jwt_handler import (
     get_password_hash,
     verify_password,
 )
-from app.db.crud import CommentCrud, LikeCrud, TopicCrud, UserCrud, VoteCrud
+from app.db.crud import CommentCrud, TopicCrud, UserCrud
 from app.db.models import User
 from app.db.schemas.users import (
     UserActivity,
@@ -24,6 +24,7 @@ from app.db.schemas.users import (
     UserUpdate,
 )
 from app.db.schemas.pagination import PaginatedResponse
+from app.services.user_stats import UserStatsService
 
 EMAIL_VALIDATION_TIMEOUT_SECONDS = 3.0
 
@@ -105,6 +106,7 @@ class UserService:
 
         try:
             db_user = await UserCrud.create(db, user)
+            await UserStatsService.create_for_user(db, db_user.user_id)
             await db.commit()
             await db.refresh(db_user)
             return await UserService._build_user_read(db, db_user)
@@ -167,10 +169,7 @@ class UserService:
 
     @staticmethod
     async def get_stats(db: AsyncSession, user_id: int) -> UserStats:
-        topics = await TopicCrud.count_by_user_id(db, user_id)
-        votes = await VoteCrud.count_by_user_id(db, user_id)
-        likes = await LikeCrud.count_likes_received(db, user_id)
-        return UserStats(topics=topics, votes=votes, likes=likes)
+        return await UserStatsService.get(db, user_id)
 
     @staticmethod
     async def get_activity(db: AsyncSession, user_id: int) -> list[UserActivity]:
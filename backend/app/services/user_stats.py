@@ -0,0 +1,132 @@
+from collections.abc import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.crud import (
+    CommentCrud,
+    LikeCrud,
+    ReplyCrud,
+    TopicCrud,
+    UserCrud,
+    UserStatsCrud,
+    VoteCrud,
+)
+from app.db.models import UserStatsRollup
+from app.db.schemas.users import UserStats, UserStatsRecountResponse
+
+
+class UserStatsService:
+    @staticmethod
+    async def create_for_user(db: AsyncSession, user_id: int) -> UserStatsRollup:
+        return await UserStatsCrud.create(db, user_id)
+
+    @staticmethod
+    async def get(db: AsyncSession, user_id: int) -> UserStats:
+        stats = await UserStatsCrud.get_by_user_id(db, user_id)
+        if stats is not None:
+            return UserStats(
+                topics=stats.topic_count, votes=stats.vote_count, likes=stats.likes_received
+            )
+
+        # No row: an account older than the user_stats migration, or one inserted
+        # directly (admin scripts, fixtures). Count live rather than show zeros;
+        # this read never writes, recount_all creates the row.
+        counted = (await UserStatsService._count_by_users(db, [user_id]))[user_id]
+        return UserStats(
+            topics=counted["topic_count"],
+            votes=counted["vote_count"],
+            likes=counted["likes_received"],
+        )
+
+    @staticmethod
+    async def apply_delta(
+        db: AsyncSession,
+        user_id: int,
+        *,
+        topic_delta: int = 0,
+        vote_delta: int = 0,
+        like_delta: int = 0,
+    ) -> None:
+        """Shift the user's counters by the deltas in a single UPDATE, without a row lock.
+
+        The write being counted must already be flushed: when the user has no row yet,
+        the fallback recount reads it back and stores the full totals instead.
+        """
+        applied = await UserStatsCrud.increment(
+            db, user_id, topic_delta=topic_delta, vote_delta=vote_delta, like_delta=like_delta
+        )
+        if not applied:
+            await UserStatsService.refresh(db, [user_id])
+
+    @staticmethod
+    async def before_topic_delete(db: AsyncSession, topic) -> set[int]:
+        """Settle voters' counts and return the authors to refresh once the topic is gone."""
+        await UserStatsCrud.decrement_votes_by_topic_id(db, topic.topic_id)
+        return await UserStatsService.authors_in_topic(db, topic.topic_id) | {topic.user_id}
+
+    @staticmethod
+    async def authors_in_topic(db: AsyncSession, topic_id: int) -> set[int]:
+        return await CommentCrud.get_user_ids_by_topic_id(
+            db, topic_id
+        ) | await ReplyCrud.get_user_ids_by_topic_id(db, topic_id)
+
+    @staticmethod
+    async def refresh(db: AsyncSession, user_ids: Iterable[int]) -> None:
+        user_ids = sorted(set(user_ids))
+        counted = await UserStatsService._count_by_users(db, user_ids)
+        for user_id in user_ids:
+            await UserStatsCrud.upsert(db, user_id, **counted[user_id])
+
+    @staticmethod
+    async def recount_all(
+        db: AsyncSession, *, batch_size: int = 500
+    ) -> UserStatsRecountResponse:
+        processed_users = 0
+        repaired_users = 0
+        after_user_id = 0
+        try:
+            while True:
+                user_ids = await UserCrud.get_ids_after_id(
+                    db, after_user_id=after_user_id, limit=batch_size
+                )
+                if not user_ids:
+                    break
+
+                stored = await UserStatsCrud.get_by_user_ids(db, user_ids)
+                counted = await UserStatsService._count_by_users(db, user_ids)
+                for user_id in user_ids:
+                    values = counted[user_id]
+                    current = stored.get(user_id)
+                    if current is None or any(
+                        getattr(current, key) != value for key, value in values.items()
+                    ):
+                        await UserStatsCrud.upsert(db, user_id, **values)
+                        repaired_users += 1
+
+                processed_users += len(user_ids)
+                after_user_id = user_ids[-1]
+                await db.commit()
+
+            return UserStatsRecountResponse(
+                processed_users=processed_users,
+                repaired_users=repaired_users,
+            )
+        except Exception:
+            await db.rollback()
+            raise
+
+    @staticmethod
+    async def _count_by_users(
+        db: AsyncSession, user_ids: list[int]
+    ) -> dict[int, dict[str, int]]:
+        topic_counts = await TopicCrud.count_by_user_ids(db, user_ids)
+        vote_counts = await VoteCrud.count_by_user_ids(db, user_ids)
+        likes_received = await LikeCrud.count_likes_received_by_user_ids(db, user_ids)
+        return {
+            user_id: {
+                "topic_count": topic_counts.get(user_id, 0),
+                "vote_count": vote_counts.get(user_id, 0),
+                "likes_received": likes_received.get(user_id, 0),
+            }
+            for user_id in user_ids
+        }
@@ -1,16 +1,29 @@
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.crud import VoteCrud
+from app.core.event_stream import (
+    SSE_PING,
+    SSE_RETRY,
+    EventSubscription,
+    format_sse,
+    iter_events,
+)
+from app.core.settings import settings
+from app.core.vote_stream import vote_stream_hub
+from app.db.crud import VoteBucketCrud, VoteCrud
 from app.db.models import Topic
 from app.db.schemas.votes import VoteCreate, VoteRead
 from app.services.topic import TopicService
+from app.services.topic_stats import TopicStatsService
+from app.services.user_stats import UserStatsService
 
 
 class VoteService:
     _MAX_SERIES_POINTS = 240
+    _BUCKET_WIDTH = timedelta(minutes=1)
 
     @staticmethod
     async def create(db: AsyncSession, vote_data: VoteCreate, user_id: int) -> VoteRead:
@@ -27,7 +40,19 @@ class VoteService:
             raise HTTPException(status_code=400, detail="이미 투표한 토픽입니다.")
         try:
             vote = await VoteCrud.create(db, vote_data, user_id)
+            await db.refresh(vote, ["created_at"])
+            await VoteBucketCrud.increment(
+                db,
+                topic.topic_id,
+                vote.vote_index,
+                VoteService._bucket_start(vote.created_at),
+            )
+            await TopicStatsService.apply_delta(
+                db, topic.topic_id, vote_index=vote_data.vote_index
+            )
+            await UserStatsService.apply_delta(db, user_id, vote_delta=1)
             await db.commit()
+            vote_stream_hub.record(topic.topic_id, vote_data.vote_index)
             await db.refresh(vote)
             return VoteRead.model_validate(vote)
         except IntegrityError:
@@ -37,6 +62,36 @@ class VoteService:
             await db.rollback()
             raise
 
+    @staticmethod
+    async def get_live_counts(db: AsyncSession, topic_id: int) -> dict:
+        topic = await TopicService.get_public_topic(db, topic_id)
+        stats = (await TopicStatsService.get_by_topics(db, [topic]))[topic.topic_id]
+        counts = {
+            i: stats.vote_counts[i] if i < len(stats.vote_counts) else 0
+            for i in range(len(topic.vote_options))
+        }
+        snapshot = {"topic_id": topic.topic_id, "counts": VoteService._format_vote_counts(counts)}
+        # The stream holds no connection; viewers only read the snapshot once.
+        await db.rollback()
+        return snapshot
+
+    @staticmethod
+    async def stream_results(
+        snapshot: dict, subscription: EventSubscription
+    ) -> AsyncIterator[str]:
+        try:
+            yield SSE_RETRY
+            yield format_sse("votes", snapshot)
+            async for stream_event in iter_events(
+                subscription, settings.vote_stream_heartbeat_seconds
+            ):
+                if stream_event is None:
+                    yield SSE_PING
+                    continue
+                yield format_sse(stream_event["event"], stream_event["data"])
+        finally:
+            vote_stream_hub.unsubscribe(subscription)
+
     @staticmethod
     async def get_all_by_user_id(db: AsyncSession, user_id: int) -> list[VoteRead]:
         votes = await VoteCrud.get_all_by_user_id(db, user_id)
@@ -66,48 +121,86 @@ class VoteService:
     ):
         now = datetime.now(timezone.utc)
         if delta is None:
-            first_vote_at = await VoteCrud.get_first_vote_created_at(db, topic.topic_id)
+            first_vote_at = await VoteBucketCrud.get_first_bucket_start(db, topic.topic_id)
             topic_created_at = topic.created_at
 
-            candidates = [dt for dt in (first_vote_at, topic_created_at) if dt is not None]
-            if candidates:
-                start_time = min(candidates)
-                if start_time.tzinfo is None:
-                    start_time = start_time.replace(tzinfo=timezone.utc)
-                else:
-                    start_time = start_time.astimezone(timezone.utc)
-            else:
-                start_time = now
+            candidates = [
+                VoteService._to_utc(dt)
+                for dt in (first_vote_at, topic_created_at)
+                if dt is not None
+            ]
+            start_time = min(candidates) if candidates else now
         else:
             start_time = now - delta
 
         interval_delta = VoteService._normalize_interval(now, start_time, interval_delta)
         option_len = len(topic.vote_options)
 
-        votes = await VoteCrud.get_all_by_topic_id_and_range(
-            db, topic.topic_id, delta, order_by_created=True
-        )
+        if interval_delta < VoteService._BUCKET_WIDTH:
+            # Sub-minute series are finer than the rollup, so read raw votes.
+            points = VoteService._iter_vote_points(db, topic.topic_id, delta)
+        else:
+            points = VoteService._iter_bucket_points(
+                db,
+                topic.topic_id,
+                None if delta is None else VoteService._bucket_start(start_time),
+            )
 
-        pointer = 0
         cumulative_counts = {i: 0 for i in range(option_len)}
         result = {}
         current_time = start_time
+        next_time = current_time + interval_delta
 
-        while current_time < now:
-            next_time = current_time + interval_delta
-            while (
-                pointer < len(votes)
-                and votes[pointer].created_at.astimezone(timezone.utc) < next_time
-            ):
-                vote = votes[pointer]
-                cumulative_counts[vote.vote_index] += 1
-                pointer += 1
+        async for point_time, vote_index, vote_count in points:
+            while point_time >= next_time and current_time < now:
+                result[str(current_time)] = VoteService._format_vote_counts(cumulative_counts)
+                current_time = next_time
+                next_time = current_time + interval_delta
+            if current_time < now:
+                cumulative_counts[vote_index] += vote_count
 
+        while current_time < now:
             result[str(current_time)] = VoteService._format_vote_counts(cumulative_counts)
             current_time = next_time
+            next_time = current_time + interval_delta
 
         return result
 
+    @staticmethod
+    async def _iter_vote_points(
+        db: AsyncSession, topic_id: int, delta: timedelta | None
+    ) -> AsyncIterator[tuple[datetime, int, int]]:
+        async for created_at, vote_index in VoteCrud.stream_times_by_topic_id(
+            db, topic_id, delta
+        ):
+            yield VoteService._to_utc(created_at), vote_index, 1
+
+    @staticmethod
+    async def _iter_bucket_points(
+        db: AsyncSession, topic_id: int, start_time: datetime | None
+    ) -> AsyncIterator[tuple[datetime, int, int]]:
+        bucket_rows = await VoteBucketCrud.get_counts_by_topic_id(db, topic_id, start_time)
+        for bucket_start, vote_index, vote_count in bucket_rows:
+            yield VoteService._to_utc(bucket_start), vote_index, vote_count
+
+    @staticmethod
+    async def rebuild_buckets(db: AsyncSession, topic_id: int) -> None:
+        counts: dict[tuple[datetime, int], int] = {}
+        async for created_at, vote_index in VoteCrud.stream_times_by_topic_id(db, topic_id):
+            key = (VoteService._bucket_start(created_at), vote_index)
+            counts[key] = counts.get(key, 0) + 1
+        await VoteBucketCrud.replace_for_topic(db, topic_id, counts)
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @staticmethod
+    def _bucket_start(value: datetime) -> datetime:
+        return VoteService._to_utc(value).replace(second=0, microsecond=0)
+
     @staticmethod
     def _normalize_interval(
         now: datetime, start_time: datetime, interval_delta: timedelta
@@ -147,10 +240,8 @@ class VoteService:
         topic: Topic,
         delta: timedelta | None
     ):
-        votes = await VoteCrud.get_all_by_topic_id_and_range(db, topic.topic_id, delta)
-        counts = {i: 0 for i in range(len(topic.vote_options))}
-        for v in votes:
-            counts[v.vote_index] += 1
+        counted = await VoteCrud.count_by_vote_index_in_range(db, topic.topic_id, delta)
+        counts = {i: counted.get(i, 0) for i in range(len(topic.vote_options))}
         return VoteService._format_vote_counts(counts)
 
     @staticmethod
@@ -6,8 +6,10 @@ from fastapi.concurrency import asynccontextmanager
 from fastapi.responses import Response
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.database import async_engine, get_db
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.database import AsyncSessionLocal, async_engine, get_db
 from app.db import models as models  # keep model registration side effects
+from app.db.replicas import replica_router
 from app.routers import (
     admin,
     comment,
@@ -27,9 +29,17 @@ from app.middleware.csrf import CSRFMiddleware
 from app.middleware.performance import PerformanceMiddleware
 from app.middleware.prometheus import PrometheusMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.read_routing import ReadYourWritesMiddleware
 from app.metrics import render_metrics
+from app.perf import query_profiler
 from app.admin.setup import setup_admin
+from app.core.notification_broker import notification_broker
+from app.core.notification_counter import unread_notification_counter
+from app.core.notification_effects import notification_effects
 from app.core.redis import close_redis_client, create_redis_client
+from app.core.scheduler import ClosedTopicNotificationScheduler
+from app.services import NotificationService
+from app.core.vote_stream import vote_stream_hub
 from app.core.settings import settings
 from app.db.schemas.health import DatabaseHealthResponse, HealthResponse
 
@@ -39,9 +49,31 @@ load_dotenv(dotenv_path=".env")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     app.state.redis_client = await create_redis_client()
+    unread_notification_counter.redis_client = app.state.redis_client
+    notification_broker.start(app.state.redis_client)
+    vote_stream_hub.start(app.state.redis_client)
+    query_profiler.start()
+    replica_router.start()
+    scheduler = None
+    if settings.closed_topic_scheduler_enabled:
+        scheduler = ClosedTopicNotificationScheduler(
+            AsyncSessionLocal,
+            async_engine,
+            NotificationService.dispatch_closed_topic_notifications,
+            app.state.redis_client,
+        )
+        scheduler.start()
     try:
         yield
     finally:
+        if scheduler is not None:
+            await scheduler.stop()
+        await notification_effects.wait_pending()
+        await notification_broker.stop()
+        await vote_stream_hub.stop()
+        await query_profiler.stop()
+        await replica_router.stop()
+        unread_notification_counter.redis_client = None
         await close_redis_client(getattr(app.state, "redis_client", None))
         await async_engine.dispose()
 
@@ -73,6 +105,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # CSRF should run before token refresh to ensure requests are validated early
@@ -80,6 +113,7 @@ app.add_middleware(PrometheusMiddleware)
 app.add_middleware(PerformanceMiddleware)
 app.add_middleware(RateLimitMiddleware)
 app.add_middleware(CSRFMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 app.add_middleware(TokenRefreshMiddleware)
 
 app.include_router(user.router)
@@ -5,12 +5,12 @@ import argparse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.db.database import sync_engine
+from app.db.database import get_sync_engine
 from app.db.models import User
 
 
 def promote_admin(email: str) -> None:
-    with Session(sync_engine) as session:
+    with Session(get_sync_engine()) as session:
         user = session.execute(select(User).where(User.email == email)).scalar_one_or_none()
         if user is None:
             raise SystemExit(f"User not found: {email}")
@@ -22,6 +22,10 @@ os.environ.setdefault("JWT_ALGORITHM", "HS256")
 os.environ.setdefault("ACCESS_TOKEN_EXPIRE", "900")
 os.environ.setdefault("REFRESH_TOKEN_EXPIRE", "604800")
 os.environ.setdefault("PERFORMANCE_DEBUG_ENABLED", "true")
+# The shared client runs without Redis; keep the in-process limiter out of unrelated tests.
+os.environ.setdefault("RATE_LIMIT_LOCAL_FALLBACK_ENABLED", "false")
+os.environ.setdefault("CLOSED_TOPIC_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("QUERY_PROFILE_SAMPLE_RATE", "0")
 
 from app.core.jwt_handler import create_access_token, create_refresh_token
 from app.db import models  # noqa: F401 - register models to Base metadata
@@ -31,6 +35,8 @@ import main as main_module
 from main import app
 from tests.factories import create_user
 
+pytest_plugins = ["pytester", "tests.query_budget"]
+
 TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
 
 
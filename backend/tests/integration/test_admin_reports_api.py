@@ -207,3 +207,56 @@ async def test_handled_report_cannot_be_processed_again(
 
     assert first.status_code == 200
     assert second.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_resolving_comment_report_handles_reply_reports_under_it_only(
+    client: AsyncClient, db_session, set_auth_cookies
+):
+    owner = await create_user(db_session)
+    reporter = await create_user(db_session)
+    admin = await create_user(db_session, is_admin=True)
+    topic = await create_topic(db_session, user_id=owner.user_id)
+    comment = await create_comment(
+        db_session, user_id=owner.user_id, topic_id=topic.topic_id
+    )
+    sibling = await create_comment(
+        db_session, user_id=owner.user_id, topic_id=topic.topic_id
+    )
+    reply = await create_reply(
+        db_session, user_id=owner.user_id, comment_id=comment.comment_id
+    )
+    await db_session.commit()
+    comment_report = await _create_report(
+        client, set_auth_cookies, reporter.user_id,
+        target_type="comment", target_id=comment.comment_id,
+    )
+    reply_report = await _create_report(
+        client, set_auth_cookies, reporter.user_id,
+        target_type="reply", target_id=reply.reply_id,
+    )
+    sibling_report = await _create_report(
+        client, set_auth_cookies, reporter.user_id,
+        target_type="comment", target_id=sibling.comment_id,
+    )
+    set_auth_cookies(client, admin.user_id)
+
+    response = await client.patch(
+        f"/manage-api/reports/{comment_report['report_id']}/resolve",
+        json={"resolution": "욕설 포함"},
+    )
+
+    assert response.status_code == 200
+    result = await db_session.execute(select(Report).order_by(Report.report_id))
+    reports = {report.report_id: report for report in result.scalars().all()}
+    assert reports[comment_report["report_id"]].status == "resolved"
+    assert reports[reply_report["report_id"]].status == "resolved"
+    assert reports[sibling_report["report_id"]].status == "pending"
+    assert {
+        report_id: (report.topic_id, report.comment_id)
+        for report_id, report in reports.items()
+    } == {
+        comment_report["report_id"]: (topic.topic_id, comment.comment_id),
+        reply_report["report_id"]: (topic.topic_id, comment.comment_id),
+        sibling_report["report_id"]: (topic.topic_id, sibling.comment_id),
+    }
@@ -2,8 +2,8 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 
-from app.db.models import AdminActionLog, Topic
-from tests.factories import create_topic, create_user
+from app.db.models import AdminActionLog, Topic, TopicStats
+from tests.factories import create_comment, create_topic, create_topic_like, create_user, create_vote
 
 
 async def _set_admin_cookies(client: AsyncClient, db_session, set_auth_cookies):
@@ -142,3 +142,41 @@ async def test_delete_missing_topic_returns_404(
     )
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_admin_topic_stats_recount_repairs_drift(
+    client: AsyncClient,
+    db_session,
+    set_auth_cookies,
+):
+    owner = await create_user(db_session)
+    voter = await create_user(db_session)
+    topic = await create_topic(db_session, user_id=owner.user_id)
+    db_session.add(
+        TopicStats(
+            topic_id=topic.topic_id,
+            vote_counts=[5, 5],
+            like_count=9,
+            comment_count=9,
+            reply_count=9,
+        )
+    )
+    await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id, vote_index=1)
+    await create_topic_like(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    await create_comment(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    untracked = await create_topic(db_session, user_id=owner.user_id)
+    await _set_admin_cookies(client, db_session, set_auth_cookies)
+
+    response = await client.post("/manage-api/topics/stats/recount")
+
+    assert response.status_code == 200
+    assert response.json() == {"processed_topics": 2, "repaired_topics": 2}
+    stats = await db_session.get(TopicStats, topic.topic_id, populate_existing=True)
+    assert stats.vote_counts == [0, 1]
+    assert (stats.like_count, stats.comment_count, stats.reply_count) == (1, 1, 0)
+    assert await db_session.get(TopicStats, untracked.topic_id) is not None
+
+    second = await client.post("/manage-api/topics/stats/recount")
+
+    assert second.json() == {"processed_topics": 2, "repaired_topics": 0}
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import mysql
+
+from app.db.crud import AdminActionLogCrud, ReportCrud
+from app.db.crud import bulk_keys
+from app.db.crud.bulk_keys import _restrict, select_by_keys
+from app.db.models import AdminActionLog, Report
+from tests.factories import create_user
+
+COUNT_QUERY = select(Report.target_type, Report.target_id, func.count(Report.report_id)).group_by(
+    Report.target_type, Report.target_id
+)
+KEY_COLUMNS = [Report.target_type, Report.target_id]
+
+
+class _RecordingSession:
+    def __init__(self, db_session):
+        self._db = db_session
+        self.statements: list[str] = []
+
+    def get_bind(self):
+        return self._db.get_bind()
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+        return await self._db.execute(statement)
+
+
+def _compile_mysql(statement) -> str:
+    return str(statement.compile(dialect=mysql.dialect()))
+
+
+async def _seed_reports(db_session, target_count: int) -> list[tuple[str, int]]:
+    reporters = [await create_user(db_session), await create_user(db_session)]
+    await db_session.flush()
+    await db_session.execute(
+        insert(Report),
+        [
+            {
+                "reporter_user_id": reporter.user_id,
+                "target_type": "comment" if target_id % 2 else "reply",
+                "target_id": target_id,
+                "reason": "spam",
+                "target_snapshot": {},
+            }
+            for target_id in range(target_count)
+            for reporter in reporters[: 1 + target_id % 2]
+        ],
+    )
+    await db_session.commit()
+    return [("comment" if target_id % 2 else "reply", target_id) for target_id in range(target_count)]
+
+
+def test_small_composite_key_sets_use_row_value_in():
+    sql = _compile_mysql(_restrict(COUNT_QUERY, KEY_COLUMNS, [("topic", 1), ("reply", 2)], "mysql"))
+
+    assert "(reports.target_type, reports.target_id) IN" in sql
+    assert "JOIN" not in sql
+
+
+def test_large_composite_key_sets_join_a_derived_key_table():
+    keys = [("comment", idx) for idx in range(bulk_keys.ROW_VALUE_IN_MAX_KEYS + 1)]
+
+    sql = _compile_mysql(_restrict(COUNT_QUERY, KEY_COLUMNS, keys, "mysql"))
+
+    assert "JOIN (SELECT" in sql
+    assert "UNION SELECT" in sql
+    assert "reports.target_id = bulk_keys.k1" in sql
+
+
+def test_dialects_without_row_value_in_join_a_derived_key_table():
+    sql = str(_restrict(COUNT_QUERY, KEY_COLUMNS, [("topic", 1)], "mssql"))
+
+    assert "JOIN" in sql
+    assert " IN " not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("target_count", [10, 200, 300, 1000])
+async def test_count_by_targets_matches_per_target_counts(db_session, target_count):
+    targets = await _seed_reports(db_session, target_count)
+
+    counts = await ReportCrud.count_by_targets(db_session, [*targets, ("topic", 999_999)])
+
+    assert counts == {
+        (target_type, target_id): 1 + target_id % 2 for target_type, target_id in targets
+    }
+
+
+@pytest.mark.asyncio
+async def test_key_sets_over_the_chunk_size_run_one_statement_per_chunk(
+    db_session, monkeypatch
+):
+    targets = await _seed_reports(db_session, 90)
+    monkeypatch.setattr(bulk_keys, "BULK_KEY_CHUNK_SIZE", 40)
+    session = _RecordingSession(db_session)
+
+    rows = await select_by_keys(session, COUNT_QUERY, KEY_COLUMNS, targets + targets[:5])
+
+    assert len(session.statements) == 3
+    assert {(target_type, target_id): count for target_type, target_id, count in rows} == {
+        (target_type, target_id): 1 + target_id % 2 for target_type, target_id in targets
+    }
+
+
+@pytest.mark.asyncio
+async def test_composite_key_chunks_stay_under_the_compound_select_limit(db_session):
+    targets = await _seed_reports(db_session, 600)
+    session = _RecordingSession(db_session)
+
+    rows = await select_by_keys(session, COUNT_QUERY, KEY_COLUMNS, targets)
+
+    assert len(session.statements) == 3
+    assert max(statement.count("UNION SELECT") + 1 for statement in session.statements) == 256
+    assert len(rows) == 600
+
+
+@pytest.mark.asyncio
+async def test_chunk_padding_limits_statement_shapes(db_session):
+    targets = await _seed_reports(db_session, 100)
+    shapes = set()
+    for size in range(65, 101):
+        session = _RecordingSession(db_session)
+        await select_by_keys(session, COUNT_QUERY, KEY_COLUMNS, targets[:size])
+        shapes.update(session.statements)
+
+    assert len(shapes) == 1
+
+
+@pytest.mark.asyncio
+async def test_latest_reasons_by_targets_across_chunks(db_session, monkeypatch):
+    admin = await create_user(db_session, is_admin=True)
+    await db_session.flush()
+    await db_session.execute(
+        insert(AdminActionLog),
+        [
+            {
+                "admin_user_id": admin.user_id,
+                "action": "ANSWER_INQUIRY",
+                "target_type": "Inquiry",
+                "target_id": target_id,
+                "before_value": {},
+                "after_value": {},
+                "reason": f"reason-{target_id}-{attempt}",
+            }
+            for target_id in range(10)
+            for attempt in range(2)
+        ],
+    )
+    await db_session.commit()
+    monkeypatch.setattr(bulk_keys, "BULK_KEY_CHUNK_SIZE", 4)
+
+    reasons = await AdminActionLogCrud.get_latest_reasons_by_targets(
+        db_session, action="ANSWER_INQUIRY", target_type="Inquiry", target_ids=list(range(12))
+    )
+
+    assert reasons == {target_id: f"reason-{target_id}-1" for target_id in range(10)}
+
+
+@pytest.mark.asyncio
+async def test_empty_key_sets_skip_the_query():
+    session = SimpleNamespace(get_bind=lambda: None)
+
+    assert await select_by_keys(session, COUNT_QUERY, KEY_COLUMNS, []) == []
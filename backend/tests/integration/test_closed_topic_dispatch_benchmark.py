@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import resource
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, insert, select
+from tabulate import tabulate
+
+from app.db.models import Notification, Topic, User, Vote
+from app.services import NotificationService
+from tests.factories import create_topic
+
+BENCHMARK_VOTER_COUNT = int(os.getenv("DISPATCH_BENCHMARK_VOTERS", "100000"))
+INSERT_BATCH_SIZE = 5000
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="set RUN_BENCHMARKS=1 to run the closed-topic dispatch benchmark",
+)
+
+
+def _reset_peak_rss() -> None:
+    # Linux resets VmHWM when "5" is written to clear_refs; elsewhere the peak is cumulative.
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def _rss_mib(field: str) -> float:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _seed_voters(db_session, topic_ids: list[int], voter_count: int) -> None:
+    user_id_start = (
+        await db_session.execute(select(User.user_id).order_by(User.user_id.desc()).limit(1))
+    ).scalar_one() + 1
+
+    for offset in range(0, voter_count, INSERT_BATCH_SIZE):
+        indexes = range(offset, min(offset + INSERT_BATCH_SIZE, voter_count))
+        await db_session.execute(
+            insert(User),
+            [
+                {
+                    "user_id": user_id_start + idx,
+                    "username": f"voter{idx}",
+                    "username_normalized": f"voter{idx}",
+                    "email": f"voter{idx}@example.com",
+                    "password": "hashed-password",
+                }
+                for idx in indexes
+            ],
+        )
+        for topic_id in topic_ids:
+            await db_session.execute(
+                insert(Vote),
+                [
+                    {"user_id": user_id_start + idx, "topic_id": topic_id, "vote_index": idx % 2}
+                    for idx in indexes
+                ],
+            )
+    await db_session.commit()
+
+
+async def _legacy_dispatch(db_session, topic_id: int) -> int:
+    # Pre-change implementation: load voter ids, then one ORM insert + flush per notification.
+    topic = await db_session.get(Topic, topic_id)
+    voter_ids = set(
+        (await db_session.execute(select(Vote.user_id).where(Vote.topic_id == topic_id)))
+        .scalars()
+        .all()
+    )
+    created = 0
+    for user_id in [topic.user_id, *sorted(voter_ids - {topic.user_id})]:
+        db_session.add(
+            Notification(
+                user_id=user_id,
+                type="topic_closed_voter",
+                target_type="Topic",
+                target_id=topic_id,
+                topic_id=topic_id,
+                message="참여한 투표가 마감되었습니다. 결과를 확인해보세요.",
+                link=f"/topic/{topic_id}?focus=results",
+            )
+        )
+        await db_session.flush()
+        created += 1
+    topic.closed_notified_at = datetime.now(timezone.utc)
+    await db_session.commit()
+    return created
+
+
+async def _bulk_dispatch(db_session, _topic_id: int) -> int:
+    result = await NotificationService.dispatch_closed_topic_notifications(db_session, limit=1)
+    return result.created_notifications
+
+
+async def _measure(db_session, label: str, func, topic_id: int) -> tuple[list, int]:
+    db_session.expunge_all()
+    _reset_peak_rss()
+    rss_before = _rss_mib("VmRSS")
+    started = time.perf_counter()
+    created = await func(db_session, topic_id)
+    elapsed_s = time.perf_counter() - started
+    peak_rss = _rss_mib("VmHWM")
+    db_session.expunge_all()
+    row = [label, f"{elapsed_s:.2f}", f"{peak_rss:.1f}", f"{peak_rss - rss_before:.1f}", created]
+    return row, created
+
+
+@pytest.mark.asyncio
+async def test_closed_topic_dispatch_benchmark(db_session, auth_user):
+    closed_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    bulk_topic = await create_topic(db_session, user_id=auth_user.user_id, expires_at=closed_at)
+    legacy_topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+    bulk_topic_id, legacy_topic_id = bulk_topic.topic_id, legacy_topic.topic_id
+    await _seed_voters(db_session, [bulk_topic_id, legacy_topic_id], BENCHMARK_VOTER_COUNT)
+
+    # Bulk path first so the cumulative-peak fallback does not charge it for the legacy run.
+    bulk_row, bulk_created = await _measure(
+        db_session, "after: INSERT ... SELECT", _bulk_dispatch, bulk_topic_id
+    )
+    legacy_row, legacy_created = await _measure(
+        db_session, "before: ORM insert + flush per row", _legacy_dispatch, legacy_topic_id
+    )
+
+    print()
+    print(f"voters: {BENCHMARK_VOTER_COUNT}")
+    print(
+        tabulate(
+            [legacy_row, bulk_row],
+            headers=["path", "wall_time_s", "peak_rss_mib", "rss_growth_mib", "notifications"],
+            tablefmt="grid",
+        )
+    )
+
+    assert bulk_created == legacy_created == BENCHMARK_VOTER_COUNT + 1
+    stored = await db_session.execute(
+        select(func.count(Notification.notification_id)).where(
+            Notification.topic_id == bulk_topic_id
+        )
+    )
+    assert stored.scalar_one() == bulk_created
+    assert float(bulk_row[1]) < float(legacy_row[1])
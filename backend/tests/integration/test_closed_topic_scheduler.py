@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import func, select
+
+from app.core.redis import script_sha
+from app.core.scheduler import (
+    DISPATCH_LOCK_NAME,
+    RELEASE_LOCK_SCRIPT,
+    ClosedTopicNotificationScheduler,
+)
+from app.db.models import Notification
+from app.db.schemas.notifications import ClosedTopicNotificationDispatchResponse
+from app.services import NotificationService
+from tests.factories import create_topic, create_user
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def evalsha(self, sha: str, numkeys: int, key: str, token: str) -> int:
+        assert sha == script_sha(RELEASE_LOCK_SCRIPT)
+        if self.values.get(key) != token:
+            return 0
+        del self.values[key]
+        return 1
+
+
+async def _create_closed_topics(db_session, count: int) -> None:
+    author = await create_user(db_session)
+    closed_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    for _ in range(count):
+        await create_topic(db_session, user_id=author.user_id, expires_at=closed_at)
+    await db_session.commit()
+
+
+def _scheduler(async_session_maker, test_engine, redis_client=None, **kwargs):
+    return ClosedTopicNotificationScheduler(
+        async_session_maker,
+        test_engine,
+        NotificationService.dispatch_closed_topic_notifications,
+        redis_client,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_once_dispatches_bounded_batch_and_exports_gauges(
+    db_session, async_session_maker, test_engine
+):
+    await _create_closed_topics(db_session, 3)
+    fake_redis = FakeRedis()
+    scheduler = _scheduler(async_session_maker, test_engine, fake_redis, topics_per_run=2)
+
+    result = await scheduler.run_once()
+
+    assert result.model_dump() == {"processed_topics": 2, "created_notifications": 2}
+    assert REGISTRY.get_sample_value("waggle_closed_topic_notification_backlog") == 1
+    assert REGISTRY.get_sample_value("waggle_closed_topic_notification_dispatch_seconds") > 0
+    assert fake_redis.values == {}
+
+
+@pytest.mark.asyncio
+async def test_run_once_skips_while_another_replica_holds_the_lock(
+    db_session, async_session_maker, test_engine
+):
+    await _create_closed_topics(db_session, 1)
+    fake_redis = FakeRedis()
+    fake_redis.values[DISPATCH_LOCK_NAME] = "other-replica"
+    scheduler = _scheduler(async_session_maker, test_engine, fake_redis)
+
+    assert await scheduler.run_once() is None
+
+    count = await db_session.execute(select(func.count(Notification.notification_id)))
+    assert count.scalar_one() == 0
+    assert fake_redis.values == {DISPATCH_LOCK_NAME: "other-replica"}
+
+
+def test_next_delay_backs_off_by_run_duration_while_backlog_remains(
+    async_session_maker, test_engine
+):
+    scheduler = _scheduler(
+        async_session_maker, test_engine, interval_seconds=60, topics_per_run=100
+    )
+    full = ClosedTopicNotificationDispatchResponse(processed_topics=100, created_notifications=5)
+    partial = ClosedTopicNotificationDispatchResponse(processed_topics=3, created_notifications=5)
+
+    assert scheduler.next_delay(full, 0.2) == 1.0
+    assert scheduler.next_delay(full, 12.5) == 12.5
+    assert scheduler.next_delay(full, 120) == 60
+    assert scheduler.next_delay(partial, 0.2) == 60
+    assert scheduler.next_delay(None, 0.2) == 60
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_in_background_until_stopped(
+    db_session, async_session_maker, test_engine
+):
+    await _create_closed_topics(db_session, 2)
+    scheduler = _scheduler(async_session_maker, test_engine, interval_seconds=0.01)
+
+    scheduler.start()
+    for _ in range(100):
+        count = await db_session.execute(select(func.count(Notification.notification_id)))
+        if count.scalar_one() == 2:
+            break
+        await asyncio.sleep(0.01)
+    await scheduler.stop()
+
+    count = await db_session.execute(select(func.count(Notification.notification_id)))
+    assert count.scalar_one() == 2
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
+from app.db.models import CommentLike, ReplyLike
+from app.db.schemas.replys import ReplyRead
+from app.services import ReplyService
 from tests.factories import create_comment, create_reply, create_topic, create_user
 
 
@@ -275,3 +280,170 @@ async def test_reply_delete_removes_soft_deleted_parent_when_last_child_removed(
     listed = await authenticated_client.get(f"/comments/by-topic/{topic.topic_id}")
     assert listed.status_code == 200
     assert listed.json() == []
+
+
+async def _seed_thread(db_session, topic_id: int, viewer_id: int, author_id: int) -> None:
+    comment = await create_comment(db_session, user_id=author_id, topic_id=topic_id)
+    root = await create_reply(db_session, user_id=viewer_id, comment_id=comment.comment_id)
+    child = await create_reply(
+        db_session,
+        user_id=author_id,
+        comment_id=comment.comment_id,
+        parent_reply_id=root.reply_id,
+    )
+    db_session.add_all(
+        [
+            CommentLike(user_id=viewer_id, comment_id=comment.comment_id),
+            CommentLike(user_id=author_id, comment_id=comment.comment_id),
+            ReplyLike(user_id=viewer_id, reply_id=child.reply_id),
+        ]
+    )
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_comment_list_query_count_does_not_grow_with_threads(
+    authenticated_client, db_session, auth_user
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    authors = [await create_user(db_session) for _ in range(4)]
+    await _seed_thread(db_session, topic.topic_id, auth_user.user_id, authors[0].user_id)
+    await db_session.commit()
+
+    small = await authenticated_client.get(
+        f"/comments/by-topic/{topic.topic_id}", headers={"X-Perf-Debug": "1"}
+    )
+    for index in range(12):
+        author_id = authors[index % len(authors)].user_id
+        await _seed_thread(db_session, topic.topic_id, auth_user.user_id, author_id)
+    await db_session.commit()
+    large = await authenticated_client.get(
+        f"/comments/by-topic/{topic.topic_id}", headers={"X-Perf-Debug": "1"}
+    )
+
+    assert len(small.json()) == 1
+    assert len(large.json()) == 13
+    assert large.headers["X-Perf-Query-Count"] == small.headers["X-Perf-Query-Count"]
+    for comment in large.json():
+        assert (comment["like_count"], comment["has_liked"]) == (2, True)
+        [root] = comment["replies"]
+        assert (root["like_count"], root["has_liked"]) == (0, False)
+        [child] = root["replies"]
+        assert (child["like_count"], child["has_liked"]) == (1, True)
+
+
+def _reply_read(reply_id: int, parent_reply_id: int | None = None) -> ReplyRead:
+    return ReplyRead(
+        reply_id=reply_id,
+        comment_id=1,
+        user_id=1,
+        content="reply",
+        parent_reply_id=parent_reply_id,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        username="user",
+        like_count=0,
+        has_liked=False,
+    )
+
+
+def test_reply_tree_handles_children_listed_before_their_parent():
+    built = [_reply_read(3, parent_reply_id=2), _reply_read(1), _reply_read(2), _reply_read(4, 99)]
+
+    roots = ReplyService._build_reply_tree(built)
+
+    assert [reply.reply_id for reply in roots] == [1, 2, 4]
+    assert [reply.reply_id for reply in roots[1].replies] == [3]
+
+
+async def _collect_pages(client, path: str, params: dict) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        response = await client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_comment_list_cursor_pagination_and_sorts(client, db_session, auth_user):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    likers = [await create_user(db_session) for _ in range(3)]
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    comments = []
+    for index in range(5):
+        comment = await create_comment(db_session, user_id=auth_user.user_id, topic_id=topic.topic_id)
+        comment.created_at = base + timedelta(minutes=index)
+        comments.append(comment)
+    for comment, like_count in zip(comments, [1, 3, 0, 3, 2]):
+        db_session.add_all(
+            CommentLike(user_id=liker.user_id, comment_id=comment.comment_id)
+            for liker in likers[:like_count]
+        )
+    await db_session.commit()
+    ids = [comment.comment_id for comment in comments]
+    path = f"/comments/by-topic/{topic.topic_id}"
+
+    oldest = await _collect_pages(client, path, {"limit": 2})
+    newest = await _collect_pages(client, path, {"limit": 2, "sort": "newest"})
+    most_liked = await _collect_pages(client, path, {"limit": 2, "sort": "like_count"})
+
+    assert [len(page) for page in oldest] == [2, 2, 1]
+    assert [item["comment_id"] for page in oldest for item in page] == ids
+    assert [item["comment_id"] for page in newest for item in page] == ids[::-1]
+    assert [item["comment_id"] for page in most_liked for item in page] == [
+        ids[3],
+        ids[1],
+        ids[4],
+        ids[0],
+        ids[2],
+    ]
+
+    first_page = await client.get(path, params={"limit": 2})
+    mismatched = await client.get(
+        path, params={"sort": "newest", "cursor": first_page.headers["X-Next-Cursor"]}
+    )
+    assert mismatched.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comment_carries_reply_preview_and_thread_pages(
+    client, db_session, auth_user
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    comment = await create_comment(db_session, user_id=auth_user.user_id, topic_id=topic.topic_id)
+    hidden = await create_comment(
+        db_session, user_id=auth_user.user_id, topic_id=topic.topic_id, is_hidden=True
+    )
+    replies = [
+        await create_reply(
+            db_session,
+            user_id=auth_user.user_id,
+            comment_id=comment.comment_id,
+            content=f"reply-{index}",
+        )
+        for index in range(5)
+    ]
+    for reply in replies:
+        # Same timestamp for every reply: pages must tie-break on reply_id.
+        reply.created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    await db_session.commit()
+    reply_ids = [reply.reply_id for reply in replies]
+
+    listed = await client.get(f"/comments/by-topic/{topic.topic_id}", params={"limit": 10})
+    [item] = listed.json()
+    full = await client.get(f"/comments/by-topic/{topic.topic_id}")
+    [full_item] = full.json()
+    thread = await _collect_pages(client, f"/comments/{comment.comment_id}/replies", {"limit": 2})
+    hidden_thread = await client.get(f"/comments/{hidden.comment_id}/replies")
+
+    assert item["reply_count"] == 5
+    assert [reply["reply_id"] for reply in item["replies"]] == reply_ids[:3]
+    assert full_item["reply_count"] == 5
+    assert [reply["reply_id"] for reply in full_item["replies"]] == reply_ids
+    assert "X-Next-Cursor" not in full.headers
+    assert [len(page) for page in thread] == [2, 2, 1]
+    assert [reply["reply_id"] for page in thread for reply in page] == reply_ids
+    assert hidden_thread.status_code == 404
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.settings import settings
+from app.db import database
+from app.db.database import create_pooled_engine
+
+POOL_NAME = "pool-test"
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": POOL_NAME}) or 0.0
+
+
+@pytest.fixture
+async def small_pool_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 1)
+    monkeypatch.setattr(settings, "db_max_overflow", 1)
+    monkeypatch.setattr(settings, "db_pool_timeout_seconds", 0.05)
+    engine = create_pooled_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", pool_name=POOL_NAME)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_uses_configured_sizing(small_pool_engine):
+    pool = small_pool_engine.sync_engine.pool
+
+    assert pool.size() == 1
+    assert pool._max_overflow == 1
+    assert pool._timeout == 0.05
+    assert _sample("waggle_db_pool_size") == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_checkouts_overflow_and_timeouts(small_pool_engine):
+    waits_before = _sample("waggle_db_pool_checkout_wait_seconds_count")
+    timeouts_before = _sample("waggle_db_pool_checkout_timeouts_total")
+
+    async with small_pool_engine.connect() as first:
+        await first.execute(text("SELECT 1"))
+        assert _sample("waggle_db_pool_checked_out") == 1
+        assert _sample("waggle_db_pool_overflow") == 0
+
+        async with small_pool_engine.connect() as second:
+            await second.execute(text("SELECT 1"))
+            assert _sample("waggle_db_pool_checked_out") == 2
+            assert _sample("waggle_db_pool_overflow") == 1
+
+            with pytest.raises(PoolTimeoutError):
+                async with small_pool_engine.connect():
+                    pass
+
+    assert _sample("waggle_db_pool_checked_out") == 0
+    assert _sample("waggle_db_pool_checkout_timeouts_total") == timeouts_before + 1
+    assert _sample("waggle_db_pool_checkout_wait_seconds_count") == waits_before + 3
+    assert _sample("waggle_db_pool_checkout_wait_seconds_sum") >= 0.05
+
+
+def test_sync_engine_is_not_created_on_import():
+    assert database.get_sync_engine.cache_info().currsize == 0
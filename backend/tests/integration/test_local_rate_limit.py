@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core.local_rate_limit import CircuitBreaker, LocalTokenBucketLimiter
+
+
+@pytest.fixture
+def monotonic(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("app.core.local_rate_limit.time.monotonic", lambda: clock["now"])
+    return clock
+
+
+def test_token_bucket_refills_at_limit_per_window(monotonic):
+    limiter = LocalTokenBucketLimiter(max_keys=10)
+
+    assert [limiter.hit("ip:1", 3, 60)[0] for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("ip:1", 3, 60) == (False, 20)
+
+    monotonic["now"] += 20
+    assert limiter.hit("ip:1", 3, 60) == (True, 0)
+    assert limiter.hit("ip:1", 3, 60)[0] is False
+
+
+def test_token_bucket_evicts_least_recently_used_identity(monotonic):
+    limiter = LocalTokenBucketLimiter(max_keys=2)
+    limiter.hit("ip:1", 1, 60)
+    limiter.hit("ip:2", 1, 60)
+    limiter.hit("ip:1", 1, 60)
+
+    limiter.hit("ip:3", 1, 60)
+
+    assert len(limiter) == 2
+    # ip:2 was evicted, so it starts again from a full bucket.
+    assert limiter.hit("ip:2", 1, 60) == (True, 0)
+    assert limiter.hit("ip:3", 1, 60)[0] is False
+
+
+def test_circuit_breaker_half_opens_after_cooldown(monotonic):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow_request()
+
+    monotonic["now"] += 30
+    assert breaker.allow_request()
+    # Only one probe per cooldown while the circuit is half-open.
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    monotonic["now"] += 30
+    assert breaker.allow_request()
+    assert breaker.record_success() is True
+    assert not breaker.is_open
+    assert breaker.record_success() is False
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+from tabulate import tabulate
+
+from app.middleware.csrf import CSRFMiddleware
+from app.middleware.performance import PerformanceMiddleware
+from app.middleware.prometheus import PrometheusMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.token_refresh import TokenRefreshMiddleware
+
+BENCHMARK_REQUESTS = int(os.getenv("MIDDLEWARE_BENCHMARK_REQUESTS", "5000"))
+WARMUP_REQUESTS = 200
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="set RUN_BENCHMARKS=1 to run the middleware stack benchmark",
+)
+
+
+class _PassThroughHTTPMiddleware(BaseHTTPMiddleware):
+    # Lower bound for the previous stack: BaseHTTPMiddleware cost without any dispatch work.
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def _build_app(middlewares) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    return app
+
+
+async def _measure(app: FastAPI) -> dict[str, float]:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(WARMUP_REQUESTS):
+            await client.get("/ping")
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(BENCHMARK_REQUESTS):
+            request_started = time.perf_counter()
+            response = await client.get("/ping")
+            latencies.append((time.perf_counter() - request_started) * 1000)
+            assert response.status_code == 200
+        elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50_ms": percentiles[49],
+        "p99_ms": percentiles[98],
+        "rps": BENCHMARK_REQUESTS / elapsed,
+    }
+
+
+@pytest.mark.asyncio
+async def test_middleware_stack_latency_and_throughput():
+    before = await _measure(_build_app([_PassThroughHTTPMiddleware] * 5))
+    after = await _measure(
+        _build_app(
+            [
+                PrometheusMiddleware,
+                PerformanceMiddleware,
+                RateLimitMiddleware,
+                CSRFMiddleware,
+                TokenRefreshMiddleware,
+            ]
+        )
+    )
+
+    print()
+    print(f"requests: {BENCHMARK_REQUESTS}")
+    print(
+        tabulate(
+            [
+                [label, f"{row['p50_ms']:.3f}", f"{row['p99_ms']:.3f}", f"{row['rps']:.0f}"]
+                for label, row in (
+                    ("before: 5 x BaseHTTPMiddleware", before),
+                    ("after: pure ASGI middleware", after),
+                )
+            ],
+            headers=["stack", "p50_ms", "p99_ms", "requests_per_second"],
+            tablefmt="grid",
+        )
+    )
+
+    assert after["p50_ms"] < before["p50_ms"]
+    assert after["rps"] > before["rps"]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.event_stream import RESET_EVENT, EventSubscription
+from app.core.notification_broker import (
+    EVENTS_CHANNEL,
+    NotificationBroker,
+    notification_broker,
+)
+from app.core.notification_effects import notification_effects
+from app.core.settings import settings
+from app.db.crud import NotificationCrud
+from app.db.schemas.notifications import NotificationCreate
+from tests.factories import create_user
+from tests.streaming import StreamConnection, parse_event
+
+
+@pytest.fixture
+def stream_settings():
+    previous = (
+        settings.notification_stream_heartbeat_seconds,
+        settings.notification_stream_max_connections_per_user,
+    )
+    yield settings
+    (
+        settings.notification_stream_heartbeat_seconds,
+        settings.notification_stream_max_connections_per_user,
+    ) = previous
+
+
+@pytest.mark.asyncio
+async def test_stream_pushes_committed_notifications_with_unread_count(
+    client: AsyncClient, db_session
+):
+    user = await create_user(db_session)
+    await db_session.commit()
+    user_id = user.user_id
+
+    async with StreamConnection("/notifications/stream", user_id=user_id) as stream:
+        start = await stream.start()
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in start["headers"]
+        assert await stream.next_chunk() == "retry: 5000\n\n"
+        assert parse_event(await stream.next_chunk()) == ("unread_count", {"count": 0})
+
+        notification = await NotificationCrud.create(
+            db_session,
+            NotificationCreate(
+                user_id=user_id,
+                type="topic_comment",
+                target_type="Comment",
+                target_id=7,
+                topic_id=3,
+                message="새 댓글이 달렸습니다.",
+                link="/topic/3",
+            ),
+        )
+        await db_session.rollback()
+        notification = await NotificationCrud.create(
+            db_session,
+            NotificationCreate(
+                user_id=user_id,
+                type="topic_comment",
+                target_type="Comment",
+                target_id=8,
+                topic_id=3,
+                message="두 번째 댓글입니다.",
+                link="/topic/3",
+            ),
+        )
+        notification_id = notification.notification_id
+        await db_session.commit()
+        await notification_effects.wait_pending()
+
+        event, data = parse_event(await stream.next_chunk())
+        assert event == "notification"
+        # The rolled-back notification was never pushed.
+        assert data["notification_id"] == notification_id
+        assert data["message"] == "두 번째 댓글입니다."
+        assert parse_event(await stream.next_chunk()) == ("unread_count", {"count": 1})
+
+    assert notification_broker.active is False
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_heartbeats_while_idle(client: AsyncClient, db_session, stream_settings):
+    user = await create_user(db_session)
+    await db_session.commit()
+    stream_settings.notification_stream_heartbeat_seconds = 0.01
+
+    async with StreamConnection("/notifications/stream", user_id=user.user_id) as stream:
+        await stream.start()
+        await stream.next_chunk()
+        await stream.next_chunk()
+
+        assert await stream.next_chunk() == ": ping\n\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_connections_are_capped_per_user(
+    client: AsyncClient, db_session, set_auth_cookies, stream_settings
+):
+    user = await create_user(db_session)
+    await db_session.commit()
+    stream_settings.notification_stream_max_connections_per_user = 2
+
+    path = "/notifications/stream"
+    async with (
+        StreamConnection(path, user_id=user.user_id) as first,
+        StreamConnection(path, user_id=user.user_id) as second,
+    ):
+        for stream in (first, second):
+            await stream.start()
+            await stream.next_chunk()
+            # Let the initial unread-count query finish before disconnecting.
+            await stream.next_chunk()
+        set_auth_cookies(client, user.user_id)
+
+        rejected = await client.get("/notifications/stream")
+
+        assert rejected.status_code == 429
+        assert rejected.json()["detail"] == "Too many notification streams"
+
+    assert notification_broker.subscribe(user.user_id) is not None
+
+
+def test_slow_subscriber_queue_is_bounded_and_reset():
+    subscription = EventSubscription(1, max_queue_size=2)
+
+    for index in range(3):
+        subscription.deliver({"event": "notification", "data": {"index": index}})
+
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait() == RESET_EVENT
+
+
+@pytest.mark.asyncio
+async def test_redis_broker_publishes_one_message_per_recipient_chunk():
+    class FakeRedis:
+        def __init__(self):
+            self.published: list[tuple[str, str]] = []
+
+        async def publish(self, channel: str, message: str) -> int:
+            self.published.append((channel, message))
+            return 1
+
+    broker = NotificationBroker()
+    broker.redis_client = FakeRedis()
+    subscription = broker.subscribe(2)
+    event = {"event": "notification", "data": {"type": "topic_closed_voter"}}
+
+    await broker.publish([1, 2, 3], event)
+
+    [(channel, message)] = broker.redis_client.published
+    assert channel == EVENTS_CHANNEL
+    assert json.loads(message) == {"user_ids": [1, 2, 3], "event": event}
+    # Delivery happens when the channel message comes back through the listener.
+    assert subscription.queue.empty()
+    broker.deliver(**json.loads(message))
+    assert subscription.queue.get_nowait() == event
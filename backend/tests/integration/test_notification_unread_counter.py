@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from redis.exceptions import NoScriptError
+
+from app.core.notification_counter import (
+    INCREMENT_EXISTING_SCRIPT,
+    UnreadNotificationCounter,
+    unread_notification_counter,
+)
+from app.core.notification_effects import notification_effects
+from app.core.redis import script_sha
+from app.db.crud import NotificationCrud
+from app.db.models import Notification, PinnedTopic
+from app.db.schemas.notifications import NotificationCreate
+from app.services import NotificationService
+from tests.factories import create_topic, create_user, create_vote
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.expirations: dict[str, int] = {}
+        self.loaded: set[str] = set()
+
+    async def get(self, key: str) -> str | None:
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def set(self, key: str, value: int, nx: bool = False, ex: int | None = None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = int(value)
+        if ex is not None:
+            self.expirations[key] = ex
+        return True
+
+    async def script_load(self, source: str) -> str:
+        self.loaded.add(script_sha(source))
+        return script_sha(source)
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args):
+        if sha not in self.loaded:
+            raise NoScriptError("No matching script. Please use EVAL.")
+        assert sha == script_sha(INCREMENT_EXISTING_SCRIPT)
+        keys, deltas = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        for key, delta in zip(keys, deltas):
+            if key in self.values:
+                self.values[key] += int(delta)
+                if self.values[key] < 0:
+                    del self.values[key]
+        return numkeys
+
+
+@pytest.fixture
+async def fake_redis(client: AsyncClient):
+    fake = FakeRedis()
+    unread_notification_counter.redis_client = fake
+    yield fake
+    await notification_effects.wait_pending()
+    unread_notification_counter.redis_client = None
+
+
+def _notification(user_id: int, **overrides) -> NotificationCreate:
+    values = {
+        "user_id": user_id,
+        "type": "topic_comment",
+        "actor_user_id": None,
+        "target_type": "Comment",
+        "target_id": 1,
+        "topic_id": 1,
+        "message": "새 댓글이 달렸습니다.",
+        "link": "/topic/1",
+    }
+    values.update(overrides)
+    return NotificationCreate(**values)
+
+
+async def _unread_count(client: AsyncClient) -> tuple[int, str]:
+    response = await client.get("/notifications/unread-count", headers={"X-Perf-Debug": "1"})
+    assert response.status_code == 200
+    return response.json()["count"], response.headers["X-Perf-Query-Count"]
+
+
+@pytest.mark.asyncio
+async def test_unread_count_is_served_from_redis_after_first_read(
+    client: AsyncClient, fake_redis, db_session, set_auth_cookies
+):
+    user = await create_user(db_session)
+    db_session.add(Notification(**_notification(user.user_id).model_dump()))
+    await db_session.commit()
+    set_auth_cookies(client, user.user_id)
+
+    first_count, first_queries = await _unread_count(client)
+    # Written directly, so only the database knows about it until reconciliation.
+    db_session.add(Notification(**_notification(user.user_id).model_dump()))
+    await db_session.commit()
+    second_count, second_queries = await _unread_count(client)
+
+    assert (first_count, second_count) == (1, 1)
+    assert first_queries == "1"
+    assert second_queries == "0"
+    key = UnreadNotificationCounter.key(user.user_id)
+    assert fake_redis.expirations[key] == 600
+
+
+@pytest.mark.asyncio
+async def test_counter_follows_create_read_and_read_all_after_commit(
+    client: AsyncClient, fake_redis, db_session, set_auth_cookies
+):
+    user = await create_user(db_session)
+    set_auth_cookies(client, user.user_id)
+    assert (await _unread_count(client))[0] == 0
+
+    first = await NotificationCrud.create(db_session, _notification(user.user_id))
+    await NotificationCrud.create(db_session, _notification(user.user_id))
+    await db_session.commit()
+    await notification_effects.wait_pending()
+    assert await _unread_count(client) == (2, "0")
+
+    read = await client.patch(f"/notifications/{first.notification_id}/read")
+    again = await client.patch(f"/notifications/{first.notification_id}/read")
+    await notification_effects.wait_pending()
+    assert read.status_code == again.status_code == 200
+    assert await _unread_count(client) == (1, "0")
+
+    await client.patch("/notifications/read-all")
+    await notification_effects.wait_pending()
+    assert await _unread_count(client) == (0, "0")
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_notifications_do_not_change_counter(
+    client: AsyncClient, fake_redis, db_session, set_auth_cookies
+):
+    user = await create_user(db_session)
+    await db_session.commit()
+    user_id = user.user_id
+    set_auth_cookies(client, user_id)
+    await _unread_count(client)
+
+    await NotificationCrud.create(db_session, _notification(user_id))
+    await db_session.rollback()
+    await notification_effects.wait_pending()
+
+    assert fake_redis.values[UnreadNotificationCounter.key(user_id)] == 0
+
+
+@pytest.mark.asyncio
+async def test_closed_topic_dispatch_increments_cached_recipients(
+    client: AsyncClient, fake_redis, db_session, set_auth_cookies
+):
+    author = await create_user(db_session)
+    voter = await create_user(db_session)
+    pinned_user = await create_user(db_session)
+    uncached_voter = await create_user(db_session)
+    topic = await create_topic(
+        db_session,
+        user_id=author.user_id,
+        expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+    await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    await create_vote(db_session, user_id=uncached_voter.user_id, topic_id=topic.topic_id)
+    db_session.add(PinnedTopic(user_id=pinned_user.user_id, topic_id=topic.topic_id))
+    await db_session.commit()
+    for user in (author, voter, pinned_user):
+        set_auth_cookies(client, user.user_id)
+        await _unread_count(client)
+
+    await NotificationService.dispatch_closed_topic_notifications(db_session)
+    await notification_effects.wait_pending()
+
+    assert {
+        user.user_id: fake_redis.values.get(UnreadNotificationCounter.key(user.user_id))
+        for user in (author, voter, pinned_user, uncached_voter)
+    } == {
+        author.user_id: 1,
+        voter.user_id: 1,
+        pinned_user.user_id: 1,
+        uncached_voter.user_id: None,
+    }
@@ -2,9 +2,10 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from app.db.models import Notification, PinnedTopic
+from app.services import NotificationService
 from tests.factories import (
     create_comment,
     create_inquiry,
@@ -335,3 +336,53 @@ async def test_admin_dispatch_closed_topic_notifications_deduplicates_users_and_
     assert len(notifications) == 1
     assert notifications[0].user_id == author.user_id
     assert notifications[0].type == "topic_closed_author"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_closed_topic_notifications_commits_per_batch_and_resumes(
+    db_session, monkeypatch
+):
+    author = await create_user(db_session)
+    voter = await create_user(db_session)
+    closed_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    topics = []
+    for offset in range(5):
+        topic = await create_topic(
+            db_session,
+            user_id=author.user_id,
+            expires_at=closed_at + timedelta(minutes=offset),
+        )
+        await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+        topics.append(topic)
+    await db_session.commit()
+    topic_ids = [topic.topic_id for topic in topics]
+
+    original = NotificationService._create_closed_topic_notifications
+
+    async def fail_on_fourth_topic(db, topic):
+        if topic.topic_id == topic_ids[3]:
+            raise RuntimeError("dispatch interrupted")
+        return await original(db, topic)
+
+    monkeypatch.setattr(
+        NotificationService,
+        "_create_closed_topic_notifications",
+        staticmethod(fail_on_fourth_topic),
+    )
+    with pytest.raises(RuntimeError):
+        await NotificationService.dispatch_closed_topic_notifications(db_session, batch_size=2)
+    monkeypatch.undo()
+
+    # The first batch committed; the failed batch rolled back entirely.
+    notified = await db_session.execute(
+        select(Notification.topic_id).distinct().order_by(Notification.topic_id)
+    )
+    assert notified.scalars().all() == topic_ids[:2]
+
+    resumed = await NotificationService.dispatch_closed_topic_notifications(
+        db_session, batch_size=2
+    )
+
+    assert resumed.model_dump() == {"processed_topics": 3, "created_notifications": 6}
+    count = await db_session.execute(select(func.count(Notification.notification_id)))
+    assert count.scalar_one() == 10
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from app.perf import QueryRecord, RequestPerfStats, duplicate_fingerprints, fingerprint_sql
+
+INNER_TEST = '''
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.perf import begin_request_capture, finish_request_capture, register_async_engine_perf_hooks
+
+
+async def _fake_request(statements):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    register_async_engine_perf_hooks(engine)
+    begin_request_capture("GET")
+    async with engine.connect() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+    finish_request_capture("/things/{thing_id}", store=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(3)
+async def test_n_plus_one():
+    await _fake_request(["SELECT 1"] + [f"SELECT {i} AS likes" for i in range(4)])
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(3)
+async def test_within_budget():
+    await _fake_request(["SELECT 1", "SELECT 2 AS likes"])
+
+
+@pytest.mark.query_budget(3)
+def test_without_requests():
+    pass
+'''
+
+
+def test_fingerprint_collapses_values_and_in_lists():
+    first = fingerprint_sql(
+        "SELECT * FROM likes\n WHERE reply_id IN (?, ?, ?) AND user_id = 7 AND kind = 'x'"
+    )
+    second = fingerprint_sql("SELECT * FROM likes WHERE reply_id IN (%s) AND user_id = %s AND kind = %s")
+
+    assert first == second == "SELECT * FROM likes WHERE reply_id IN (?) AND user_id = ? AND kind = ?"
+
+
+def test_duplicate_fingerprints_reports_repeats_most_frequent_first():
+    stats = RequestPerfStats(trace_id="t", started_at=0.0)
+    stats.queries = [
+        QueryRecord(statement=statement, parameters=(), duration_ms=0.1)
+        for statement in [
+            "SELECT * FROM users WHERE user_id = ?",
+            "SELECT count(*) FROM likes WHERE reply_id = ?",
+            "SELECT count(*) FROM likes WHERE reply_id = ?",
+            "SELECT count(*) FROM likes WHERE reply_id = ?",
+            "SELECT * FROM topics WHERE topic_id = 1",
+            "SELECT * FROM topics WHERE topic_id = 2",
+        ]
+    ]
+
+    assert duplicate_fingerprints(stats) == [
+        ("SELECT count(*) FROM likes WHERE reply_id = ?", 3),
+        ("SELECT * FROM topics WHERE topic_id = ?", 2),
+    ]
+
+
+def test_marker_fails_over_budget_requests_and_names_repeated_sql(pytester: pytest.Pytester):
+    pytester.makepyfile(INNER_TEST)
+
+    result = pytester.runpytest_inprocess("-p", "tests.query_budget")
+
+    result.assert_outcomes(passed=1, failed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*query budget exceeded*",
+            "*GET /things/{thing_id}: 5 queries (budget 3)*",
+            "*repeated statements (possible N+1):*",
+            "*4x SELECT ? AS likes*",
+            "*query_budget: no GET request was captured*",
+        ]
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.core.settings import settings
+from app.perf import fingerprint_id, fingerprint_sql, query_profiler
+from tests.factories import create_topic
+
+TOPIC_ROUTE = "/topics/{topic_id}"
+
+
+def _queries_per_request_count(path: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "waggle_db_queries_per_request_count", {"method": "GET", "path": path}
+        )
+        or 0.0
+    )
+
+
+def _slow_query_records(caplog) -> list[dict]:
+    return [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "app.perf.slow_query"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_record_route_query_counts_and_fingerprints(
+    client: AsyncClient, db_session, auth_user, monkeypatch
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+    monkeypatch.setattr(settings, "query_profile_sample_rate", 1.0)
+    before = _queries_per_request_count(TOPIC_ROUTE)
+
+    response = await client.get(f"/topics/{topic.topic_id}")
+
+    assert response.status_code == 200
+    assert _queries_per_request_count(TOPIC_ROUTE) == before + 1
+    route_fingerprints = {
+        sample.labels["fingerprint"]
+        for metric in REGISTRY.collect()
+        if metric.name == "waggle_db_query_duration_seconds"
+        for sample in metric.samples
+        if sample.name.endswith("_count") and sample.labels["path"] == TOPIC_ROUTE
+    }
+    statements = {
+        sample.labels["fingerprint"]: sample.labels["statement"]
+        for metric in REGISTRY.collect()
+        if metric.name == "waggle_db_query_fingerprint_info"
+        for sample in metric.samples
+    }
+    assert route_fingerprints
+    assert all(
+        fingerprint_id(statements[fingerprint]) == fingerprint
+        for fingerprint in route_fingerprints
+    )
+    assert any(
+        statements[fingerprint].startswith("SELECT topics.")
+        and "topics.topic_id = ?" in statements[fingerprint]
+        for fingerprint in route_fingerprints
+    )
+
+@pytest.mark.asyncio
+async def test_unsampled_requests_skip_the_profile(
+    client: AsyncClient, db_session, auth_user, monkeypatch
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+    monkeypatch.setattr(settings, "query_profile_sample_rate", 0.0)
+    before = _queries_per_request_count(TOPIC_ROUTE)
+
+    await client.get(f"/topics/{topic.topic_id}")
+
+    assert _queries_per_request_count(TOPIC_ROUTE) == before
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_with_route_trace_id_and_one_explain_per_fingerprint(
+    client: AsyncClient, db_session, auth_user, monkeypatch, caplog
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+    monkeypatch.setattr(settings, "performance_debug_enabled", True)
+    monkeypatch.setattr(settings, "query_profile_sample_rate", 0.0)
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0)
+    monkeypatch.setattr(query_profiler, "_explained_at", {})
+    caplog.set_level(logging.WARNING, logger="app.perf.slow_query")
+
+    first = await client.get(f"/topics/{topic.topic_id}", headers={"X-Perf-Debug": "1"})
+    await query_profiler.wait_pending()
+    first_records = _slow_query_records(caplog)
+    caplog.clear()
+    await client.get(f"/topics/{topic.topic_id}")
+    await query_profiler.wait_pending()
+    second_records = _slow_query_records(caplog)
+
+    assert first_records
+    assert {record["trace_id"] for record in first_records} == {
+        first.headers["X-Perf-Trace-Id"]
+    }
+    assert {record["route"] for record in first_records} == {TOPIC_ROUTE}
+    assert all(record["method"] == "GET" for record in first_records)
+    assert all(
+        record["fingerprint"] == fingerprint_id(fingerprint_sql(record["statement"]))
+        for record in first_records
+    )
+    selects = [record for record in first_records if record["statement"].startswith("SELECT")]
+    assert selects and all(record["plan"] for record in selects)
+    assert second_records
+    assert all(record["plan"] is None for record in second_records)
+
+
+@pytest.mark.asyncio
+async def test_fast_queries_are_not_logged(
+    client: AsyncClient, db_session, auth_user, monkeypatch, caplog
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 60_000)
+    caplog.set_level(logging.WARNING, logger="app.perf.slow_query")
+
+    await client.get(f"/topics/{topic.topic_id}")
+    await query_profiler.wait_pending()
+
+    assert _slow_query_records(caplog) == []
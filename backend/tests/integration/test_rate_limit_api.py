@@ -1,45 +1,101 @@
 from __future__ import annotations
 
+import hashlib
+import math
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from httpx import AsyncClient
+from prometheus_client import REGISTRY
 
+from redis.exceptions import NoScriptError
+
+from app.core.local_rate_limit import local_rate_limiter, redis_circuit_breaker
 from app.core.settings import settings
+from app.core.redis import script_sha
+from app.middleware.rate_limit import FIXED_WINDOW_SCRIPT, SLIDING_WINDOW_SCRIPT
 from main import app
 
 
 class FakeRedis:
+    """Executes the rate limit Lua scripts in Python, keyed by SHA like Redis does."""
+
     def __init__(self):
         self.values: dict[str, int] = {}
         self.ttls: dict[str, int] = {}
-        self.eval_calls: list[tuple[str, int, str, int]] = []
+        self.scripts: dict[str, str] = {}
+        self.evalsha_calls: list[tuple[str, tuple[str, ...], tuple[int, ...]]] = []
+        self.script_loads = 0
+
+    async def script_load(self, source: str) -> str:
+        self.script_loads += 1
+        sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        self.scripts[sha] = source
+        return sha
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args):
+        if sha not in self.scripts:
+            raise NoScriptError("No matching script. Please use EVAL.")
+        keys = tuple(keys_and_args[:numkeys])
+        args = tuple(int(arg) for arg in keys_and_args[numkeys:])
+        self.evalsha_calls.append((sha, keys, args))
+        if self.scripts[sha] == FIXED_WINDOW_SCRIPT:
+            return self._fixed_window(keys[0], args[0])
+        return self._sliding_window(keys[0], keys[1], *args)
 
-    async def eval(self, script: str, numkeys: int, key: str, seconds: int) -> int:
-        self.eval_calls.append((script, numkeys, key, seconds))
+    def _fixed_window(self, key: str, seconds: int) -> list[int]:
         self.values[key] = self.values.get(key, 0) + 1
         if self.values[key] == 1:
             self.ttls[key] = seconds
-        return self.values[key]
+        return [self.values[key], self.ttls.get(key, -1)]
 
-    async def ttl(self, key: str) -> int:
-        return self.ttls.get(key, -1)
+    def _sliding_window(
+        self, current_key: str, previous_key: str, window_ms: int, elapsed_ms: int, limit: int
+    ) -> list[int]:
+        current = self.values.get(current_key, 0)
+        previous = self.values.get(previous_key, 0)
+        remaining_ms = window_ms - elapsed_ms
+        count = math.floor(previous * remaining_ms / window_ms) + current + 1
+        if count > limit:
+            if current < limit:
+                retry_ms = remaining_ms - math.floor((limit - 1 - current) * window_ms / previous)
+            else:
+                retry_ms = remaining_ms + window_ms - math.floor((limit - 1) * window_ms / current)
+            return [count, math.ceil(max(retry_ms, 1) / 1000)]
+        self.values[current_key] = current + 1
+        if current == 0:
+            self.ttls[current_key] = window_ms * 2 // 1000
+        return [count, math.ceil(remaining_ms / 1000)]
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    clock = {"now_ms": 1_700_000_080_000}
+    monkeypatch.setattr("app.middleware.rate_limit._now_ms", lambda: clock["now_ms"])
+    return clock
 
 
 @pytest.fixture(autouse=True)
 def reset_rate_limit_state():
     previous_enabled = settings.rate_limit_enabled
     previous_fail_open = settings.rate_limit_fail_open
+    previous_fallback = settings.rate_limit_local_fallback_enabled
     previous_client = getattr(app.state, "redis_client", None)
     settings.rate_limit_enabled = True
+    settings.rate_limit_local_fallback_enabled = True
+    local_rate_limiter.clear()
+    redis_circuit_breaker.reset()
     yield
     settings.rate_limit_enabled = previous_enabled
     settings.rate_limit_fail_open = previous_fail_open
+    settings.rate_limit_local_fallback_enabled = previous_fallback
     app.state.redis_client = previous_client
+    local_rate_limiter.clear()
+    redis_circuit_breaker.reset()
 
 
 @pytest.mark.asyncio
-async def test_login_rate_limit_returns_429_after_limit(client: AsyncClient):
+async def test_login_rate_limit_returns_429_after_limit(client: AsyncClient, frozen_clock):
     fake_redis = FakeRedis()
     app.state.redis_client = fake_redis
     payload = {"email": "missing@example.com", "password": "wrong-password"}
@@ -52,20 +108,48 @@ async def test_login_rate_limit_returns_429_after_limit(client: AsyncClient):
 
     assert response.status_code == 429
     assert response.json()["detail"] == "Rate limit exceeded"
-    assert response.headers["Retry-After"] == "60"
+    # 40s into the current minute: the 5 counted requests roll into the previous window in 20s,
+    # and their weight has to decay below the limit after that.
+    assert response.headers["Retry-After"] == "32"
     key = next(iter(fake_redis.values))
     assert key.startswith("rate_limit:POST:users:login:ip:")
-    assert fake_redis.values[key] == 6
-    assert fake_redis.ttls[key] == 60
-    assert len(fake_redis.eval_calls) == 6
-    assert all(call[1:] == (1, key, 60) for call in fake_redis.eval_calls)
+    assert fake_redis.values[key] == 5
+    assert fake_redis.ttls[key] == 120
+    assert len(fake_redis.evalsha_calls) == 6
+    assert {call[0] for call in fake_redis.evalsha_calls} == {script_sha(SLIDING_WINDOW_SCRIPT)}
+    # NOSCRIPT on the first call loads the script once; later requests only send the SHA.
+    assert fake_redis.script_loads == 1
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_blocks_bursts_across_window_boundary(
+    client: AsyncClient, frozen_clock
+):
+    fake_redis = FakeRedis()
+    app.state.redis_client = fake_redis
+    payload = {"email": "missing@example.com", "password": "wrong-password"}
+    frozen_clock["now_ms"] = 1_700_000_099_000
+
+    for _ in range(5):
+        response = await client.post("/users/login", json=payload)
+        assert response.status_code != 429
+
+    # One second into the next fixed window a fixed counter would allow five more.
+    frozen_clock["now_ms"] += 2_000
+    allowed = await client.post("/users/login", json=payload)
+    blocked = await client.post("/users/login", json=payload)
+
+    assert allowed.status_code != 429
+    assert blocked.status_code == 429
+    assert blocked.json()["retry_after"] == 23
 
 
 @pytest.mark.asyncio
 async def test_topic_create_rate_limit_uses_authenticated_user(
     authenticated_client: AsyncClient,
 ):
-    app.state.redis_client = FakeRedis()
+    fake_redis = FakeRedis()
+    app.state.redis_client = fake_redis
     expires_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
 
     for index in range(10):
@@ -94,6 +178,8 @@ async def test_topic_create_rate_limit_uses_authenticated_user(
 
     assert response.status_code == 429
     assert response.json()["retry_after"] == 60
+    assert fake_redis.values == {next(iter(fake_redis.values)): 11}
+    assert {call[0] for call in fake_redis.evalsha_calls} == {script_sha(FIXED_WINDOW_SCRIPT)}
 
 
 @pytest.mark.asyncio
@@ -111,10 +197,11 @@ async def test_health_endpoint_is_excluded_from_rate_limit(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_rate_limit_script_failure_fails_open(client: AsyncClient):
     class FailingRedis(FakeRedis):
-        async def eval(self, script: str, numkeys: int, key: str, seconds: int) -> int:
+        async def evalsha(self, sha: str, numkeys: int, *keys_and_args):
             raise ConnectionError("redis unavailable")
 
     settings.rate_limit_fail_open = True
+    settings.rate_limit_local_fallback_enabled = False
     app.state.redis_client = FailingRedis()
 
     response = await client.post(
@@ -123,3 +210,89 @@ async def test_rate_limit_script_failure_fails_open(client: AsyncClient):
     )
 
     assert response.status_code != 429
+
+
+class FailingRedis(FakeRedis):
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args):
+        self.evalsha_calls.append((sha, tuple(keys_and_args[:numkeys]), ()))
+        raise ConnectionError("redis unavailable")
+
+
+def _fallback_sample(reason: str) -> float:
+    return REGISTRY.get_sample_value("waggle_rate_limit_fallback_total", {"reason": reason}) or 0.0
+
+
+async def _login(client: AsyncClient):
+    return await client.post(
+        "/users/login", json={"email": "missing@example.com", "password": "wrong-password"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_login_is_limited_locally_when_redis_is_missing(client: AsyncClient):
+    app.state.redis_client = None
+    unavailable_before = _fallback_sample("unavailable")
+
+    for _ in range(5):
+        assert (await _login(client)).status_code != 429
+    response = await _login(client)
+
+    assert response.status_code == 429
+    # Local token bucket refills one of five tokens every 12 seconds.
+    assert response.headers["Retry-After"] == "12"
+    assert _fallback_sample("unavailable") == unavailable_before + 6
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_stops_calling_failing_redis(client: AsyncClient):
+    failing_redis = FailingRedis()
+    app.state.redis_client = failing_redis
+    circuit_open_before = _fallback_sample("circuit_open")
+
+    for _ in range(5):
+        assert (await _login(client)).status_code != 429
+    response = await _login(client)
+
+    assert response.status_code == 429
+    assert len(failing_redis.evalsha_calls) == settings.rate_limit_breaker_failure_threshold
+    assert redis_circuit_breaker.is_open
+    assert REGISTRY.get_sample_value("waggle_rate_limit_circuit_open") == 1
+    assert _fallback_sample("circuit_open") == circuit_open_before + 3
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_open_when_local_fallback_is_disabled(client: AsyncClient):
+    settings.rate_limit_fail_open = True
+    settings.rate_limit_local_fallback_enabled = False
+    failing_redis = FailingRedis()
+    app.state.redis_client = failing_redis
+    circuit_open_before = _fallback_sample("circuit_open")
+
+    responses = [await _login(client) for _ in range(10)]
+
+    assert all(response.status_code != 429 for response in responses)
+    assert redis_circuit_breaker.is_open
+    assert len(failing_redis.evalsha_calls) == settings.rate_limit_breaker_failure_threshold
+    assert _fallback_sample("circuit_open") == circuit_open_before
+    assert len(local_rate_limiter) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_recovery_closes_circuit_and_resets_local_buckets(
+    client: AsyncClient, frozen_clock, monkeypatch
+):
+    app.state.redis_client = FailingRedis()
+    for _ in range(settings.rate_limit_breaker_failure_threshold):
+        await _login(client)
+    assert redis_circuit_breaker.is_open
+    assert len(local_rate_limiter) == 1
+
+    recovered_redis = FakeRedis()
+    app.state.redis_client = recovered_redis
+    monkeypatch.setattr(redis_circuit_breaker, "reset_seconds", 0)
+    response = await _login(client)
+
+    assert response.status_code != 429
+    assert len(recovered_redis.evalsha_calls) == 1
+    assert not redis_circuit_breaker.is_open
+    assert len(local_rate_limiter) == 0
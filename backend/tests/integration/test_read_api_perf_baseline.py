@@ -6,6 +6,7 @@ import pytest
 from tabulate import tabulate
 
 from app.perf import build_explain_rows, clear_captured_stats
+from app.services import TopicStatsService, VoteService
 from tests.factories import (
     create_comment,
     create_reply,
@@ -16,9 +17,10 @@ from tests.factories import (
 )
 
 READ_API_MAX_QUERY_COUNTS = {
-    "/topics": 2,
-    "/topics/{topic_id}": 8,
-    "/comments/by-topic/{topic_id}": 15,
+    "/topics": 6,
+    "/topics?status=all": 6,
+    "/topics/{topic_id}": 5,
+    "/comments/by-topic/{topic_id}": 7,
     "/votes/topic/{topic_id}?time_range=all&interval=1h": 4,
 }
 
@@ -106,6 +108,11 @@ async def test_read_api_perf_baseline(
     clear_captured_stats()
 
     topic = await create_topic(db_session, user_id=auth_user.user_id, title="perf-target")
+    # The active list hides topics the viewer voted on; keep these on the page.
+    unvoted_topics = [
+        await create_topic(db_session, user_id=auth_user.user_id, title=f"perf-unvoted-{idx}")
+        for idx in range(3)
+    ]
     commenters = [await create_user(db_session) for _ in range(3)]
     voters = [await create_user(db_session) for _ in range(4)]
     likers = [await create_user(db_session) for _ in range(4)]
@@ -152,6 +159,11 @@ async def test_read_api_perf_baseline(
         comment_id=comments[1].comment_id,
         content="reply-second-comment",
     )
+    # Factories bypass the write services; mirror the migration backfill.
+    await TopicStatsService.refresh(db_session, topic.topic_id)
+    for unvoted_topic in unvoted_topics:
+        await TopicStatsService.refresh(db_session, unvoted_topic.topic_id)
+    await VoteService.rebuild_buckets(db_session, topic.topic_id)
     await db_session.commit()
 
     topic_response = await authenticated_client.get(
@@ -163,6 +175,11 @@ async def test_read_api_perf_baseline(
         params={"limit": 10, "offset": 0},
         headers={"X-Perf-Debug": "1"},
     )
+    all_topics_response = await authenticated_client.get(
+        "/topics",
+        params={"status": "all", "limit": 10, "offset": 0},
+        headers={"X-Perf-Debug": "1"},
+    )
     comments_response = await authenticated_client.get(
         f"/comments/by-topic/{topic.topic_id}",
         headers={"X-Perf-Debug": "1"},
@@ -175,20 +192,25 @@ async def test_read_api_perf_baseline(
 
     assert topic_response.status_code == 200
     assert topics_response.status_code == 200
+    assert len(topics_response.json()) == len(unvoted_topics)
+    assert all_topics_response.status_code == 200
     assert comments_response.status_code == 200
     assert vote_stats_response.status_code == 200
 
     topic_trace_id = topic_response.headers["X-Perf-Trace-Id"]
     topics_trace_id = topics_response.headers["X-Perf-Trace-Id"]
+    all_topics_trace_id = all_topics_response.headers["X-Perf-Trace-Id"]
     comments_trace_id = comments_response.headers["X-Perf-Trace-Id"]
     vote_stats_trace_id = vote_stats_response.headers["X-Perf-Trace-Id"]
     topic_explain = await build_explain_rows(db_session, topic_trace_id)
     topics_explain = await build_explain_rows(db_session, topics_trace_id)
+    all_topics_explain = await build_explain_rows(db_session, all_topics_trace_id)
     comments_explain = await build_explain_rows(db_session, comments_trace_id)
     vote_stats_explain = await build_explain_rows(db_session, vote_stats_trace_id)
 
     baseline_rows = [
         _baseline_row("/topics", topics_response, topics_explain),
+        _baseline_row("/topics?status=all", all_topics_response, all_topics_explain),
         _baseline_row("/topics/{topic_id}", topic_response, topic_explain),
         _baseline_row(
             "/comments/by-topic/{topic_id}",
@@ -206,6 +228,7 @@ async def test_read_api_perf_baseline(
     print(_perf_table(baseline_rows))
     print()
     _print_explain("/topics", topics_explain)
+    _print_explain("/topics?status=all", all_topics_explain)
     _print_explain("/topics/{topic_id}", topic_explain)
     _print_explain("/comments/by-topic/{topic_id}", comments_explain)
     _print_explain("/votes/topic/{topic_id}", vote_stats_explain)
@@ -214,7 +237,47 @@ async def test_read_api_perf_baseline(
     assert baseline_rows[1]["query_count"] > 0
     assert baseline_rows[2]["query_count"] > 0
     assert baseline_rows[3]["query_count"] > 0
+    assert baseline_rows[4]["query_count"] > 0
     assert len(topics_explain) > 0
+    assert len(all_topics_explain) > 0
     assert len(topic_explain) > 0
     assert len(comments_explain) > 0
     assert len(vote_stats_explain) > 0
+
+
+async def _authenticated_list_query_count(client, db_session, owner_id: int, topic_count: int) -> int:
+    voter = await create_user(db_session)
+    for idx in range(topic_count):
+        topic = await create_topic(db_session, user_id=owner_id, title=f"viewer-state-{idx}")
+        if idx % 2:
+            await create_vote(db_session, user_id=owner_id, topic_id=topic.topic_id)
+        if idx % 3:
+            await create_topic_like(db_session, user_id=owner_id, topic_id=topic.topic_id)
+        await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+        await TopicStatsService.refresh(db_session, topic.topic_id)
+    await db_session.commit()
+
+    response = await client.get(
+        "/topics",
+        params={"status": "all", "limit": 50},
+        headers={"X-Perf-Debug": "1"},
+    )
+    assert response.status_code == 200
+    return int(response.headers["X-Perf-Query-Count"])
+
+
+@pytest.mark.asyncio
+async def test_authenticated_topic_list_query_count_is_constant(
+    authenticated_client,
+    db_session,
+    auth_user,
+):
+    small_page = await _authenticated_list_query_count(
+        authenticated_client, db_session, auth_user.user_id, 2
+    )
+    large_page = await _authenticated_list_query_count(
+        authenticated_client, db_session, auth_user.user_id, 20
+    )
+
+    assert large_page == small_page
+    assert large_page <= READ_API_MAX_QUERY_COUNTS["/topics?status=all"]
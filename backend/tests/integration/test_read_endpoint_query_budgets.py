@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+from app.db.models import AdminActionLog, CommentLike, Notification, Report, ReplyLike
+from app.services import TopicStatsService, UserStatsService
+from main import app
+from tests.factories import (
+    create_comment,
+    create_inquiry,
+    create_reply,
+    create_topic,
+    create_topic_like,
+    create_user,
+    create_vote,
+)
+
+SEED_ROWS = 3
+
+# Not request/response reads: SSE streams never finish, and OAuth routes redirect to
+# or call out to the identity providers.
+UNBUDGETED_READ_ROUTES = {
+    "/votes/topic/{topic_id}/stream",
+    "/notifications/stream",
+    "/auth/google/login",
+    "/auth/google/callback",
+    "/auth/naver/login",
+    "/auth/naver/callback",
+    "/auth/kakao/login",
+    "/auth/kakao/callback",
+}
+
+
+def _budget(route: str, max_queries: int, params: dict | None = None):
+    return pytest.param(
+        route, params or {}, marks=pytest.mark.query_budget(max_queries), id=route
+    )
+
+
+READ_ENDPOINT_BUDGETS = [
+    _budget("/users/me", 1),
+    _budget("/users/stats", 1),
+    _budget("/users/activity", 1),
+    _budget("/users/content-status", 2),
+    _budget("/topics", 6),
+    _budget("/topics/count", 1),
+    _budget("/topics/{topic_id}", 5),
+    _budget("/votes/me", 1),
+    _budget("/votes/topic/{topic_id}", 4, {"time_range": "all", "interval": "1h"}),
+    _budget("/comments/by-topic/{topic_id}", 7),
+    _budget("/comments/{comment_id}/replies", 6),
+    _budget("/inquiries/me", 2),
+    _budget("/manage-api/me", 1),
+    _budget("/manage-api/users", 3),
+    _budget("/manage-api/logs", 2),
+    _budget("/manage-api/inquiries", 3),
+    _budget("/manage-api/inquiries/{inquiry_id}", 2),
+    _budget("/manage-api/topics", 3),
+    _budget("/manage-api/comments", 3),
+    _budget("/manage-api/reports", 5),
+    _budget("/notifications", 1),
+    _budget("/notifications/unread-count", 1),
+]
+
+
+@pytest.fixture
+async def seeded_ids(db_session, set_auth_cookies, client: AsyncClient) -> dict[str, int]:
+    """Several rows of everything a read endpoint can touch, viewed by an admin."""
+    viewer = await create_user(db_session, is_admin=True)
+    others = [await create_user(db_session) for _ in range(SEED_ROWS)]
+    topics = []
+    for author in [viewer, *others]:
+        topic = await create_topic(db_session, user_id=author.user_id)
+        topics.append(topic)
+        # The viewer votes only on their own topic: the active /topics list hides
+        # voted topics, and the budget must be measured on a populated page.
+        for voter in [*others, viewer] if author is viewer else others:
+            await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+        await create_topic_like(db_session, user_id=viewer.user_id, topic_id=topic.topic_id)
+        for commenter in [viewer, *others]:
+            comment = await create_comment(
+                db_session, user_id=commenter.user_id, topic_id=topic.topic_id
+            )
+            parent = None
+            for replier in [viewer, *others]:
+                parent = await create_reply(
+                    db_session,
+                    user_id=replier.user_id,
+                    comment_id=comment.comment_id,
+                    parent_reply_id=parent.reply_id if parent else None,
+                )
+                db_session.add(ReplyLike(user_id=viewer.user_id, reply_id=parent.reply_id))
+            db_session.add(CommentLike(user_id=viewer.user_id, comment_id=comment.comment_id))
+            db_session.add(
+                Report(
+                    reporter_user_id=viewer.user_id,
+                    target_type="comment",
+                    target_id=comment.comment_id,
+                    reason="spam",
+                    target_snapshot={"content": comment.content},
+                    topic_id=topic.topic_id,
+                    comment_id=comment.comment_id,
+                )
+            )
+        db_session.add(
+            Notification(
+                user_id=viewer.user_id,
+                type="topic_comment",
+                actor_user_id=author.user_id,
+                target_type="Topic",
+                target_id=topic.topic_id,
+                topic_id=topic.topic_id,
+                message="message",
+                link=f"/topic/{topic.topic_id}",
+            )
+        )
+        db_session.add(
+            AdminActionLog(
+                admin_user_id=viewer.user_id,
+                action="HIDE_TOPIC",
+                target_type="Topic",
+                target_id=topic.topic_id,
+                before_value={},
+                after_value={},
+                reason="reason",
+            )
+        )
+        inquiry = await create_inquiry(db_session, user_id=viewer.user_id)
+        await create_comment(
+            db_session, user_id=viewer.user_id, topic_id=topic.topic_id, is_hidden=True
+        )
+        await db_session.flush()
+        await TopicStatsService.refresh(db_session, topic.topic_id)
+    await UserStatsService.refresh(db_session, [viewer.user_id, *(user.user_id for user in others)])
+    await db_session.commit()
+    set_auth_cookies(client, viewer.user_id)
+    return {
+        "topic_id": topics[0].topic_id,
+        "comment_id": comment.comment_id,
+        "inquiry_id": inquiry.inquiry_id,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("route", "params"), READ_ENDPOINT_BUDGETS)
+async def test_read_endpoint_stays_within_query_budget(
+    client: AsyncClient, seeded_ids: dict[str, int], route: str, params: dict
+):
+    response = await client.get(route.format(**seeded_ids), params=params)
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    # A budget measured on an empty result would not catch per-row queries.
+    if isinstance(body, dict) and "items" in body:
+        body = body["items"]
+    if isinstance(body, list):
+        assert body, f"{route} returned no rows"
+
+
+def test_every_read_endpoint_has_a_query_budget():
+    read_routes = {
+        route.path
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and "GET" in route.methods
+        and route.endpoint.__module__.startswith("app.routers.")
+    }
+    budgeted = {param.values[0] for param in READ_ENDPOINT_BUDGETS}
+
+    assert read_routes - UNBUDGETED_READ_ROUTES == budgeted
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+import main as main_module
+from app.db import replicas
+from main import app
+from app.db.database import Base
+from app.db.replicas import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER, ReplicaRouter
+from tests.factories import create_topic
+
+
+def _routing_sample(pool: str, reason: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "waggle_db_read_routing_total", {"pool": pool, "reason": reason}
+        )
+        or 0.0
+    )
+
+
+async def _create_router(*urls: str) -> ReplicaRouter:
+    router = ReplicaRouter(list(urls), health_check_interval_seconds=3600)
+    for replica in router.replicas:
+        if "missing-dir" not in str(replica.engine.url):
+            async with replica.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+    return router
+
+
+@pytest.fixture
+async def empty_replica(tmp_path, monkeypatch):
+    """One lagging replica: it has the schema but none of the primary's rows."""
+    router = await _create_router(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.setattr(replicas, "replica_router", router)
+    monkeypatch.setattr(main_module, "replica_router", router)
+    yield router
+    await router.stop()
+
+
+@pytest.mark.asyncio
+async def test_read_endpoints_are_served_by_the_replica(
+    client: AsyncClient, empty_replica, db_session, auth_user, set_auth_cookies
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, title="primary-only")
+    await db_session.commit()
+    routed_before = _routing_sample("replica-1", "round_robin")
+
+    assert (await client.get("/topics")).json() == []
+    assert (await client.get("/topics/count")).json() == 0
+    assert (await client.get(f"/topics/{topic.topic_id}")).status_code == 404
+    assert (await client.get(f"/comments/by-topic/{topic.topic_id}")).status_code == 404
+    assert (await client.get(f"/votes/topic/{topic.topic_id}")).status_code == 404
+    set_auth_cookies(client, auth_user.user_id)
+    assert (await client.get("/notifications")).json() == []
+    # Writes and endpoints not opted in keep using the primary.
+    assert (await client.get("/votes/me")).status_code == 200
+
+    assert _routing_sample("replica-1", "round_robin") == routed_before + 6
+
+
+@pytest.mark.asyncio
+async def test_client_reads_its_own_writes_from_the_primary(
+    authenticated_client: AsyncClient, empty_replica, db_session, auth_user
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, title="pinned")
+    await db_session.commit()
+
+    pinned = await authenticated_client.post(f"/topics/{topic.topic_id}/pin")
+    assert pinned.status_code == 200
+    assert READ_PRIMARY_COOKIE in pinned.headers["set-cookie"]
+    assert "Max-Age=5" in pinned.headers["set-cookie"]
+
+    after_write = await authenticated_client.get(f"/topics/{topic.topic_id}")
+    assert after_write.status_code == 200
+
+    authenticated_client.cookies.delete(READ_PRIMARY_COOKIE)
+    authenticated_client.cookies.set(READ_PRIMARY_COOKIE, str(int(time.time()) - 1))
+    assert (await authenticated_client.get(f"/topics/{topic.topic_id}")).status_code == 404
+
+    forced = await authenticated_client.get(
+        f"/topics/{topic.topic_id}", headers={READ_PRIMARY_HEADER: "1"}
+    )
+    assert forced.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_and_reads_do_not_pin_to_primary(
+    authenticated_client: AsyncClient, empty_replica
+):
+    failed = await authenticated_client.post("/topics/999999/pin")
+    read = await authenticated_client.get("/topics")
+
+    assert failed.status_code == 404
+    assert READ_PRIMARY_COOKIE not in failed.headers.get("set-cookie", "")
+    assert READ_PRIMARY_COOKIE not in read.headers.get("set-cookie", "")
+
+
+@pytest.mark.asyncio
+async def test_router_round_robins_and_skips_unhealthy_replicas(tmp_path):
+    router = await _create_router(
+        f"sqlite+aiosqlite:///{tmp_path / 'a.db'}",
+        f"sqlite+aiosqlite:///{tmp_path / 'missing-dir' / 'b.db'}",
+        f"sqlite+aiosqlite:///{tmp_path / 'c.db'}",
+    )
+    try:
+        assert [router.choose().name for _ in range(3)] == ["replica-1", "replica-2", "replica-3"]
+
+        await router.check_health()
+        assert [replica.healthy for replica in router.replicas] == [True, False, True]
+        assert REGISTRY.get_sample_value("waggle_db_replica_healthy", {"pool": "replica-2"}) == 0
+        assert {router.choose().name for _ in range(4)} == {"replica-1", "replica-3"}
+
+        for replica in router.replicas:
+            replica.set_healthy(False)
+        assert router.choose() is None
+    finally:
+        await router.stop()
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_without_healthy_replica(
+    client: AsyncClient, empty_replica, db_session, auth_user
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, title="fallback")
+    await db_session.commit()
+    empty_replica.replicas[0].set_healthy(False)
+    fallback_before = _routing_sample("primary", "no_healthy_replica")
+
+    response = await client.get(f"/topics/{topic.topic_id}")
+
+    assert response.status_code == 200
+    assert _routing_sample("primary", "no_healthy_replica") == fallback_before + 1
+
+
+class _DictRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.values[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+
+@pytest.mark.asyncio
+async def test_replica_reads_never_fill_the_topic_cache(
+    client: AsyncClient, empty_replica, db_session, auth_user
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, title="fresh")
+    await db_session.commit()
+    previous_client = app.state.redis_client
+    app.state.redis_client = fake = _DictRedis()
+    try:
+        from_replica = await client.get("/topics")
+        count_from_replica = await client.get("/topics/count")
+        assert from_replica.json() == []
+        assert count_from_replica.json() == 0
+        assert not [key for key in fake.values if ":version:" not in key]
+
+        primary_headers = {READ_PRIMARY_HEADER: "1"}
+        await client.get("/topics", headers=primary_headers)
+        await client.get("/topics/count", headers=primary_headers)
+        cached = await client.get("/topics")
+        cached_count = await client.get("/topics/count")
+    finally:
+        app.state.redis_client = previous_client
+
+    assert [item["topic_id"] for item in cached.json()] == [topic.topic_id]
+    assert cached_count.json() == 1
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from sqlalchemy import insert, select
+from tabulate import tabulate
+
+from app.db.crud.report import ReportCrud
+from app.db.models import Report, User
+from app.services.report import ReportService
+from tests.factories import create_comment, create_topic, create_user
+
+BENCHMARK_REPORT_COUNT = int(os.getenv("REPORT_BENCHMARK_SIZE", "50000"))
+INSERT_BATCH_SIZE = 5000
+RELATED_REPORTS_PER_TARGET = 5
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="set RUN_BENCHMARKS=1 to run the 50k-pending-report resolution benchmark",
+)
+
+
+async def _seed_reporters(db_session, count: int) -> list[int]:
+    user_id_start = (
+        await db_session.execute(select(User.user_id).order_by(User.user_id.desc()).limit(1))
+    ).scalar_one() + 1
+    await db_session.execute(
+        insert(User),
+        [
+            {
+                "user_id": user_id_start + idx,
+                "username": f"reporter{idx}",
+                "username_normalized": f"reporter{idx}",
+                "email": f"reporter{idx}@example.com",
+                "password": "hashed-password",
+            }
+            for idx in range(count)
+        ],
+    )
+    return [user_id_start + idx for idx in range(count)]
+
+
+async def _seed_backlog(db_session, reporter_id: int, report_count: int) -> None:
+    # Pending comment reports on other topics: the moderation backlog every resolve used to scan.
+    for offset in range(0, report_count, INSERT_BATCH_SIZE):
+        indexes = range(offset, min(offset + INSERT_BATCH_SIZE, report_count))
+        await db_session.execute(
+            insert(Report),
+            [
+                {
+                    "reporter_user_id": reporter_id,
+                    "target_type": "comment",
+                    "target_id": 1_000_000 + idx,
+                    "reason": "spam",
+                    "status": "pending",
+                    "target_snapshot": {"topic_id": 1_000_000 + idx // 10},
+                    "topic_id": 1_000_000 + idx // 10,
+                    "comment_id": 1_000_000 + idx,
+                }
+                for idx in indexes
+            ],
+        )
+    await db_session.commit()
+
+
+async def _legacy_related_reports(db_session, report) -> list[int]:
+    # Pre-change implementation: load every pending report and filter snapshots in Python.
+    pending, _ = await ReportCrud.get_all_for_admin(db_session, status="pending")
+    return sorted(
+        item.report_id
+        for item in pending
+        if item.target_id == report.target_id and item.target_type == "comment"
+        or item.target_type == "reply" and item.target_snapshot.get("comment_id") == report.target_id
+    )
+
+
+async def _related_reports(db_session, report) -> list[int]:
+    related = await ReportService._get_related_pending_reports(db_session, report)
+    return sorted(item.report_id for item in related)
+
+
+async def _measure(db_session, label: str, func, report) -> tuple[dict, list[int]]:
+    db_session.expunge_all()
+    report = await db_session.get(Report, report.report_id)
+    started = time.perf_counter()
+    value = await func(db_session, report)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return {"path": label, "lookup_time_ms": elapsed_ms}, value
+
+
+@pytest.mark.asyncio
+async def test_related_report_lookup_benchmark(db_session):
+    owner = await create_user(db_session)
+    topic = await create_topic(db_session, user_id=owner.user_id)
+    comment = await create_comment(db_session, user_id=owner.user_id, topic_id=topic.topic_id)
+    await db_session.commit()
+    reporter_ids = await _seed_reporters(db_session, RELATED_REPORTS_PER_TARGET)
+    await _seed_backlog(db_session, reporter_ids[0], BENCHMARK_REPORT_COUNT)
+    for reporter_id in reporter_ids:
+        db_session.add(
+            Report(
+                reporter_user_id=reporter_id,
+                target_type="comment",
+                target_id=comment.comment_id,
+                reason="spam",
+                target_snapshot={"topic_id": topic.topic_id},
+                topic_id=topic.topic_id,
+                comment_id=comment.comment_id,
+            )
+        )
+    await db_session.commit()
+    report = (
+        await db_session.execute(
+            select(Report).where(Report.comment_id == comment.comment_id).limit(1)
+        )
+    ).scalar_one()
+
+    legacy_row, legacy_ids = await _measure(
+        db_session, "related reports (before: all pending)", _legacy_related_reports, report
+    )
+    indexed_row, indexed_ids = await _measure(
+        db_session, "related reports (after: status+comment_id index)", _related_reports, report
+    )
+
+    print()
+    print(f"pending reports seeded: {BENCHMARK_REPORT_COUNT}")
+    print(
+        tabulate(
+            [[row["path"], f"{row['lookup_time_ms']:.3f}"] for row in [legacy_row, indexed_row]],
+            headers=["path", "lookup_time_ms"],
+            tablefmt="grid",
+        )
+    )
+
+    assert indexed_ids == legacy_ids
+    assert len(indexed_ids) == RELATED_REPORTS_PER_TARGET
+    assert indexed_row["lookup_time_ms"] < legacy_row["lookup_time_ms"]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from app.core import auth as auth_module
+from app.core import jwt_handler
+from app.core.jwt_handler import TokenClaimsCache, create_access_token, decode_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_claims_cache():
+    jwt_handler.token_claims_cache.clear()
+    yield
+    jwt_handler.token_claims_cache.clear()
+
+
+def test_token_claims_cache_evicts_least_recently_used_entry():
+    cache = TokenClaimsCache(max_size=2)
+    expires_at = time.time() + 60
+    cache.set("token-a", {"uid": 1, "exp": expires_at})
+    cache.set("token-b", {"uid": 2, "exp": expires_at})
+
+    assert cache.get("token-a") == {"uid": 1, "exp": expires_at}
+    cache.set("token-c", {"uid": 3, "exp": expires_at})
+
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") is not None
+    assert cache.get("token-c") is not None
+
+
+def test_token_claims_cache_drops_expired_entries():
+    cache = TokenClaimsCache(max_size=10)
+    cache.set("expired", {"uid": 1, "exp": time.time() - 1})
+    cache.set("no-exp", {"uid": 2})
+
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+    assert len(cache) == 0
+
+
+def test_decode_token_reuses_verified_claims(monkeypatch):
+    token = create_access_token(7)
+    calls = {"count": 0}
+    original_decode = jwt_handler.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls["count"] += 1
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_handler.jwt, "decode", counting_decode)
+
+    assert decode_token(token)["uid"] == 7
+    assert decode_token(token)["uid"] == 7
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_access_token_is_verified_once_per_request(
+    authenticated_client, auth_user, monkeypatch
+):
+    calls = {"count": 0}
+    original_verify = auth_module.verify_token
+
+    def counting_verify(token: str):
+        calls["count"] += 1
+        return original_verify(token)
+
+    monkeypatch.setattr(auth_module, "verify_token", counting_verify)
+
+    response = await authenticated_client.get("/topics", params={"status": "voted"})
+
+    assert response.status_code == 200
+    assert calls["count"] == 1
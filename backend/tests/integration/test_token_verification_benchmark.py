@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from tabulate import tabulate
+
+from app.core.auth import resolve_access_identity
+from app.core.jwt_handler import create_access_token, token_claims_cache
+from app.core.settings import settings
+
+BENCHMARK_REQUESTS = int(os.getenv("TOKEN_BENCHMARK_REQUESTS", "20000"))
+# TokenRefreshMiddleware, RateLimitMiddleware and get_user_id each checked the token.
+VERIFICATIONS_PER_REQUEST = 3
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="set RUN_BENCHMARKS=1 to run the token verification microbenchmark",
+)
+
+
+def _uncached_request(token: str) -> None:
+    for _ in range(VERIFICATIONS_PER_REQUEST):
+        jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
+
+
+def _cached_request(token: str) -> None:
+    request = SimpleNamespace(state=SimpleNamespace(), cookies={"access_token": token})
+    for _ in range(VERIFICATIONS_PER_REQUEST):
+        resolve_access_identity(request)
+
+
+def _cpu_us_per_request(func, token: str) -> float:
+    started = time.process_time()
+    for _ in range(BENCHMARK_REQUESTS):
+        func(token)
+    return (time.process_time() - started) / BENCHMARK_REQUESTS * 1_000_000
+
+
+def test_token_verification_cpu_per_request():
+    token = create_access_token(1)
+    token_claims_cache.clear()
+
+    before = _cpu_us_per_request(_uncached_request, token)
+    after = _cpu_us_per_request(_cached_request, token)
+
+    print()
+    print(f"requests: {BENCHMARK_REQUESTS}")
+    print(
+        tabulate(
+            [
+                ["before: verify_token per caller", f"{before:.2f}"],
+                ["after: request.state + claims LRU", f"{after:.2f}"],
+            ],
+            headers=["path", "cpu_us_per_request"],
+            tablefmt="grid",
+        )
+    )
+
+    assert after < before
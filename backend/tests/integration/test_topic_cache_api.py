@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.core.topic_cache import TopicListCache
+from app.db.crud.topic import TopicCrud
+from main import app
+from tests.factories import create_topic
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.expirations: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.values[key] = value
+        if ex is not None:
+            self.expirations[key] = ex
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+
+@pytest.fixture
+async def fake_redis(client: AsyncClient):
+    previous_client = getattr(app.state, "redis_client", None)
+    fake = FakeRedis()
+    app.state.redis_client = fake
+    yield fake
+    app.state.redis_client = previous_client
+
+
+def _cache_sample(name: str, cache: str) -> float:
+    return REGISTRY.get_sample_value(name, {"cache": cache}) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_anonymous_topic_list_is_served_from_cache_until_vote_invalidates(
+    client: AsyncClient, fake_redis, db_session, auth_user, set_auth_cookies
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, title="cached-topic")
+    await db_session.commit()
+    hits_before = _cache_sample("waggle_topic_cache_hits_total", "list")
+    misses_before = _cache_sample("waggle_topic_cache_misses_total", "list")
+
+    first = await client.get("/topics")
+    # Written directly to the database, so nothing bumps the cache version.
+    await create_topic(db_session, user_id=auth_user.user_id, title="uncached-topic")
+    await db_session.commit()
+    second = await client.get("/topics")
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert [item["topic_id"] for item in second.json()] == [topic.topic_id]
+    assert _cache_sample("waggle_topic_cache_misses_total", "list") == misses_before + 1
+    assert _cache_sample("waggle_topic_cache_hits_total", "list") == hits_before + 1
+    assert set(fake_redis.expirations.values()) == {30}
+
+    set_auth_cookies(client, auth_user.user_id)
+    vote = await client.post("/votes", json={"topic_id": topic.topic_id, "vote_index": 0})
+    assert vote.status_code == 200
+    client.cookies.clear()
+
+    refreshed = await client.get("/topics")
+    refreshed_by_id = {item["topic_id"]: item for item in refreshed.json()}
+    assert len(refreshed_by_id) == 2
+    assert refreshed_by_id[topic.topic_id]["total_vote"] == 1
+
+
+@pytest.mark.asyncio
+async def test_topic_count_cache_survives_votes_and_resets_on_topic_delete(
+    client: AsyncClient, fake_redis, db_session, auth_user, set_auth_cookies
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, title="count-topic")
+    await db_session.commit()
+
+    assert (await client.get("/topics/count")).json() == 1
+    await create_topic(db_session, user_id=auth_user.user_id, title="count-topic-2")
+    await create_topic(db_session, user_id=auth_user.user_id, title="count-topic-3")
+    await db_session.commit()
+
+    set_auth_cookies(client, auth_user.user_id)
+    await client.post("/votes", json={"topic_id": topic.topic_id, "vote_index": 1})
+    client.cookies.clear()
+    assert (await client.get("/topics/count")).json() == 1
+
+    set_auth_cookies(client, auth_user.user_id)
+    deleted = await client.delete(f"/topics/{topic.topic_id}")
+    assert deleted.status_code == 200
+    client.cookies.clear()
+    assert (await client.get("/topics/count")).json() == 2
+
+
+@pytest.mark.asyncio
+async def test_topic_write_during_a_cache_miss_orphans_the_page_being_built(
+    client: AsyncClient, fake_redis, db_session, auth_user, monkeypatch
+):
+    await create_topic(db_session, user_id=auth_user.user_id, title="before-write")
+    await db_session.commit()
+    original_read = TopicCrud.get_all_with_filters
+
+    async def read_then_write(*args, **kwargs):
+        db_topics = await original_read(*args, **kwargs)
+        # A write commits and bumps the version after the page was read.
+        await create_topic(db_session, user_id=auth_user.user_id, title="after-read")
+        await db_session.commit()
+        await TopicListCache.invalidate(fake_redis, topics=True)
+        return db_topics
+
+    monkeypatch.setattr(TopicCrud, "get_all_with_filters", staticmethod(read_then_write))
+    stale = await client.get("/topics")
+    monkeypatch.setattr(TopicCrud, "get_all_with_filters", original_read)
+    fresh = await client.get("/topics")
+
+    assert [item["title"] for item in stale.json()] == ["before-write"]
+    assert {item["title"] for item in fresh.json()} == {"before-write", "after-read"}
+
+
+@pytest.mark.asyncio
+async def test_authenticated_topic_list_bypasses_cache(
+    authenticated_client: AsyncClient, fake_redis, db_session, auth_user
+):
+    await create_topic(db_session, user_id=auth_user.user_id, title="personal-topic")
+    await db_session.commit()
+
+    response = await authenticated_client.get("/topics")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert fake_redis.values == {}
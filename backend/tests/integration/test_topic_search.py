@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.dialects import mysql
+
+from app.db.search import topic_search_filter
+from tests.factories import create_topic, create_user
+
+
+class _DialectSession:
+    def __init__(self, dialect_name: str):
+        self._bind = SimpleNamespace(dialect=SimpleNamespace(name=dialect_name))
+
+    def get_bind(self):
+        return self._bind
+
+
+def _compile_mysql(clause) -> tuple[str, dict]:
+    compiled = clause.compile(dialect=mysql.dialect())
+    return str(compiled), compiled.params
+
+
+def test_mysql_search_uses_fulltext_boolean_mode():
+    sql, params = _compile_mysql(topic_search_filter(_DialectSession("mysql"), ' 점심 +menu" '))
+
+    assert sql == "MATCH (topics.title, topics.description) AGAINST (%s IN BOOLEAN MODE)"
+    assert list(params.values()) == ['+"점심" +"menu"']
+
+
+def test_mysql_search_falls_back_to_like_for_terms_below_ngram_size():
+    sql, params = _compile_mysql(topic_search_filter(_DialectSession("mysql"), "밥 lunch"))
+
+    assert "MATCH" not in sql
+    assert "LIKE" in sql
+    assert set(params.values()) == {"%밥 lunch%"}
+
+
+@pytest.mark.asyncio
+async def test_public_and_admin_topic_search_share_fallback_path(
+    client: AsyncClient, db_session, auth_user, set_auth_cookies
+):
+    matched = await create_topic(
+        db_session, user_id=auth_user.user_id, title="오늘 점심 메뉴", description="desc"
+    )
+    described = await create_topic(
+        db_session, user_id=auth_user.user_id, title="other", description="점심 투표"
+    )
+    await create_topic(db_session, user_id=auth_user.user_id, title="저녁 메뉴")
+    admin = await create_user(db_session, is_admin=True)
+    await db_session.commit()
+
+    public = await client.get("/topics", params={"search": "점심"})
+    count = await client.get("/topics/count", params={"search": "점심"})
+    set_auth_cookies(client, admin.user_id)
+    admin_list = await client.get("/manage-api/topics", params={"search": " 점심 "})
+
+    expected = {matched.topic_id, described.topic_id}
+    assert {item["topic_id"] for item in public.json()} == expected
+    assert count.json() == 2
+    assert {item["topic_id"] for item in admin_list.json()["items"]} == expected
@@ -353,6 +353,74 @@ async def test_topics_list_validation_errors(authenticated_client):
     assert invalid_sort.status_code == 422
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", ["created_at", "like_count"])
+@pytest.mark.parametrize("status", ["active", "all"])
+async def test_topics_cursor_pages_match_offset_order(
+    authenticated_client, db_session, auth_user, sort, status
+):
+    from tests.factories import create_topic_like, create_user
+
+    now = datetime.now(timezone.utc)
+    shared_created_at = now - timedelta(minutes=30)
+    topics = []
+    for idx in range(7):
+        topics.append(
+            await create_topic(
+                db_session,
+                user_id=auth_user.user_id,
+                title=f"cursor-{idx}",
+                # Share a timestamp across several topics to exercise the topic_id tiebreak.
+                created_at=shared_created_at if idx % 2 else now - timedelta(minutes=idx),
+                expires_at=now - timedelta(minutes=1) if idx in (2, 5) else None,
+            )
+        )
+    liker = await create_user(db_session)
+    for topic in topics[:3]:
+        await create_topic_like(db_session, user_id=liker.user_id, topic_id=topic.topic_id)
+    await db_session.commit()
+
+    params = {"sort": sort, "status": status}
+    full = await authenticated_client.get("/topics", params={**params, "limit": 50})
+    assert full.status_code == 200
+    expected_ids = [item["topic_id"] for item in full.json()]
+
+    seen_ids: list[int] = []
+    cursor = None
+    while True:
+        page_params = {**params, "limit": 2}
+        if cursor:
+            page_params["cursor"] = cursor
+        response = await authenticated_client.get("/topics", params=page_params)
+        assert response.status_code == 200
+        seen_ids.extend(item["topic_id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen_ids == expected_ids
+
+
+@pytest.mark.asyncio
+async def test_topics_cursor_rejects_invalid_or_mismatched_cursor(
+    authenticated_client, db_session, auth_user
+):
+    for idx in range(3):
+        await create_topic(db_session, user_id=auth_user.user_id, title=f"cursor-check-{idx}")
+    await db_session.commit()
+
+    first_page = await authenticated_client.get("/topics", params={"limit": 2})
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    malformed = await authenticated_client.get("/topics", params={"cursor": "not-a-cursor"})
+    mismatched = await authenticated_client.get(
+        "/topics", params={"cursor": cursor, "sort": "like_count"}
+    )
+
+    assert malformed.status_code == 400
+    assert mismatched.status_code == 400
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize('path', ['/topics', '/topics/count'])
 async def test_topic_search_length_boundary(authenticated_client, path):
@@ -361,3 +429,47 @@ async def test_topic_search_length_boundary(authenticated_client, path):
 
     assert accepted.status_code == 200
     assert rejected.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_topic_stats_follow_vote_like_comment_and_reply_writes(
+    authenticated_client, db_session
+):
+    created = await authenticated_client.post(
+        "/topics",
+        json={
+            "title": "stats-topic",
+            "description": "desc",
+            "category": "general",
+            "vote_options": ["A", "B"],
+            "expires_at": future_expiration(),
+        },
+    )
+    topic_id = created.json()["topic_id"]
+
+    await authenticated_client.post("/votes", json={"topic_id": topic_id, "vote_index": 1})
+    await authenticated_client.put(f"/likes/topic/{topic_id}")
+    comment = await authenticated_client.post(
+        "/comments", json={"topic_id": topic_id, "content": "first"}
+    )
+    await authenticated_client.post(
+        "/replies",
+        json={"comment_id": comment.json()["comment_id"], "content": "reply"},
+    )
+
+    response = await authenticated_client.get(f"/topics/{topic_id}")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["vote_results"] == [0, 1]
+    assert payload["total_vote"] == 1
+    assert payload["like_count"] == 1
+    assert payload["comment_count"] == 2
+
+    await authenticated_client.put(f"/likes/topic/{topic_id}")
+    await authenticated_client.delete(f"/comments/{comment.json()['comment_id']}")
+
+    response = await authenticated_client.get(f"/topics/{topic_id}")
+
+    assert response.json()["like_count"] == 0
+    assert response.json()["comment_count"] == 1
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.db.models import UserStatsRollup
+from app.services import UserStatsService
+from tests.factories import (
+    create_comment,
+    create_reply,
+    create_topic,
+    create_topic_like,
+    create_user,
+    create_vote,
+)
+
+
+async def _stats(client: AsyncClient, set_auth_cookies, user_id: int) -> dict:
+    set_auth_cookies(client, user_id)
+    response = await client.get("/users/stats")
+    assert response.status_code == 200
+    return response.json()
+
+
+async def _rollup(db_session, user_id: int) -> tuple[int, int, int] | None:
+    stats = await db_session.get(UserStatsRollup, user_id, populate_existing=True)
+    if stats is None:
+        return None
+    return stats.topic_count, stats.vote_count, stats.likes_received
+
+
+async def _tracked_users(db_session, count: int):
+    users = [await create_user(db_session) for _ in range(count)]
+    await UserStatsService.refresh(db_session, [user.user_id for user in users])
+    await db_session.commit()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_write_paths_keep_the_rollup_in_step(
+    client: AsyncClient, db_session, set_auth_cookies
+):
+    author, fan = await _tracked_users(db_session, 2)
+    expires_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+
+    set_auth_cookies(client, author.user_id)
+    created = await client.post(
+        "/topics",
+        json={
+            "title": "rollup-topic",
+            "category": "general",
+            "vote_options": ["A", "B"],
+            "description": "rollup",
+            "expires_at": expires_at,
+        },
+    )
+    topic_id = created.json()["topic_id"]
+    comment = await client.post("/comments", json={"topic_id": topic_id, "content": "c"})
+    comment_id = comment.json()["comment_id"]
+    reply = await client.post("/replies", json={"comment_id": comment_id, "content": "r"})
+    set_auth_cookies(client, fan.user_id)
+    await client.post("/votes", json={"topic_id": topic_id, "vote_index": 0})
+    await client.put(f"/likes/topic/{topic_id}")
+    await client.put(f"/likes/comment/{comment_id}")
+    await client.put(f"/likes/reply/{reply.json()['reply_id']}")
+    await client.put(f"/likes/comment/{comment_id}")
+
+    assert await _stats(client, set_auth_cookies, author.user_id) == {
+        "topics": 1,
+        "votes": 0,
+        "likes": 2,
+    }
+    assert await _stats(client, set_auth_cookies, fan.user_id) == {
+        "topics": 0,
+        "votes": 1,
+        "likes": 0,
+    }
+    assert await _rollup(db_session, author.user_id) == (1, 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_topic_delete_takes_back_votes_and_likes_of_everyone_involved(
+    client: AsyncClient, db_session, set_auth_cookies
+):
+    author, voter, commenter = await _tracked_users(db_session, 3)
+    topic = await create_topic(db_session, user_id=author.user_id)
+    other_topic = await create_topic(db_session, user_id=author.user_id)
+    await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    await create_vote(db_session, user_id=voter.user_id, topic_id=other_topic.topic_id)
+    comment = await create_comment(db_session, user_id=commenter.user_id, topic_id=topic.topic_id)
+    await create_topic_like(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    await db_session.flush()
+    await UserStatsService.refresh(
+        db_session, [author.user_id, voter.user_id, commenter.user_id]
+    )
+    await db_session.commit()
+    set_auth_cookies(client, voter.user_id)
+    await client.put(f"/likes/comment/{comment.comment_id}")
+
+    set_auth_cookies(client, author.user_id)
+    response = await client.delete(f"/topics/{topic.topic_id}")
+
+    assert response.status_code == 200
+    assert await _rollup(db_session, author.user_id) == (1, 0, 0)
+    assert await _rollup(db_session, voter.user_id) == (0, 1, 0)
+    assert await _rollup(db_session, commenter.user_id) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_reply_thread_refreshes_every_replier(
+    client: AsyncClient, db_session, set_auth_cookies
+):
+    author, replier, fan = await _tracked_users(db_session, 3)
+    topic = await create_topic(db_session, user_id=author.user_id)
+    comment = await create_comment(db_session, user_id=author.user_id, topic_id=topic.topic_id)
+    parent = await create_reply(db_session, user_id=author.user_id, comment_id=comment.comment_id)
+    child = await create_reply(
+        db_session,
+        user_id=replier.user_id,
+        comment_id=comment.comment_id,
+        parent_reply_id=parent.reply_id,
+    )
+    await db_session.commit()
+    set_auth_cookies(client, fan.user_id)
+    await client.put(f"/likes/reply/{parent.reply_id}")
+    await client.put(f"/likes/reply/{child.reply_id}")
+    assert await _rollup(db_session, replier.user_id) == (0, 0, 1)
+
+    set_auth_cookies(client, author.user_id)
+    response = await client.delete(f"/replies/{parent.reply_id}")
+
+    assert response.status_code == 200
+    assert await _rollup(db_session, author.user_id) == (1, 0, 0)
+    assert await _rollup(db_session, replier.user_id) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_stats_read_is_a_single_query_and_untracked_users_fall_back_to_live_counts(
+    client: AsyncClient, db_session, set_auth_cookies
+):
+    tracked, untracked = await _tracked_users(db_session, 1) + [await create_user(db_session)]
+    await create_topic(db_session, user_id=untracked.user_id)
+    await db_session.commit()
+
+    set_auth_cookies(client, tracked.user_id)
+    response = await client.get("/users/stats", headers={"X-Perf-Debug": "1"})
+
+    assert response.headers["X-Perf-Query-Count"] == "1"
+    assert await _stats(client, set_auth_cookies, untracked.user_id) == {
+        "topics": 1,
+        "votes": 0,
+        "likes": 0,
+    }
+    assert await _rollup(db_session, untracked.user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_signup_creates_an_empty_rollup(client: AsyncClient, db_session, monkeypatch):
+    async def fake_validate_email(email: str) -> str:
+        return email
+
+    monkeypatch.setattr(
+        "app.services.user.UserService._validate_email", staticmethod(fake_validate_email)
+    )
+
+    response = await client.post(
+        "/users/signup",
+        json={"email": "rollup@example.com", "username": "rollup", "password": "password123"},
+    )
+
+    assert await _rollup(db_session, response.json()["user_id"]) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_admin_user_stats_recount_repairs_drift(
+    client: AsyncClient, db_session, set_auth_cookies
+):
+    admin = await create_user(db_session, is_admin=True)
+    drifted = await create_user(db_session)
+    voter = await create_user(db_session)
+    topic = await create_topic(db_session, user_id=drifted.user_id)
+    await create_vote(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    await create_topic_like(db_session, user_id=voter.user_id, topic_id=topic.topic_id)
+    db_session.add(
+        UserStatsRollup(user_id=drifted.user_id, topic_count=9, vote_count=9, likes_received=9)
+    )
+    await db_session.commit()
+
+    set_auth_cookies(client, voter.user_id)
+    assert (await client.post("/manage-api/users/stats/recount")).status_code == 403
+    set_auth_cookies(client, admin.user_id)
+    response = await client.post("/manage-api/users/stats/recount", params={"batch_size": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"processed_users": 3, "repaired_users": 3}
+    assert await _rollup(db_session, drifted.user_id) == (1, 0, 1)
+    assert await _rollup(db_session, voter.user_id) == (0, 1, 0)
+
+    second = await client.post("/manage-api/users/stats/recount")
+
+    assert second.json() == {"processed_users": 3, "repaired_users": 0}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, select
+from tabulate import tabulate
+
+from app.db.crud import VoteCrud
+from app.db.models import User, Vote
+from tests.factories import create_topic
+
+BENCHMARK_VOTE_COUNT = int(os.getenv("VOTE_BENCHMARK_SIZE", "100000"))
+INSERT_BATCH_SIZE = 5000
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="set RUN_BENCHMARKS=1 to run the 100k-vote statistics benchmark",
+)
+
+
+async def _seed_votes(db_session, topic_id: int, vote_count: int) -> None:
+    start = datetime.now(timezone.utc) - timedelta(days=7)
+    step = timedelta(days=7) / vote_count
+    user_id_start = (
+        await db_session.execute(select(User.user_id).order_by(User.user_id.desc()).limit(1))
+    ).scalar_one() + 1
+
+    for offset in range(0, vote_count, INSERT_BATCH_SIZE):
+        indexes = range(offset, min(offset + INSERT_BATCH_SIZE, vote_count))
+        await db_session.execute(
+            insert(User),
+            [
+                {
+                    "user_id": user_id_start + idx,
+                    "username": f"bench{idx}",
+                    "username_normalized": f"bench{idx}",
+                    "email": f"bench{idx}@example.com",
+                    "password": "hashed-password",
+                }
+                for idx in indexes
+            ],
+        )
+        await db_session.execute(
+            insert(Vote),
+            [
+                {
+                    "user_id": user_id_start + idx,
+                    "topic_id": topic_id,
+                    "vote_index": idx % 3,
+                    "created_at": start + step * idx,
+                }
+                for idx in indexes
+            ],
+        )
+    await db_session.commit()
+
+
+async def _legacy_aggregated(db_session, topic_id: int) -> dict[int, int]:
+    # Pre-change implementation: materialize every Vote entity and count in Python.
+    result = await db_session.execute(select(Vote).where(Vote.topic_id == topic_id))
+    counts = {i: 0 for i in range(3)}
+    for vote in result.scalars().all():
+        counts[vote.vote_index] += 1
+    return counts
+
+
+async def _legacy_time_series_source(db_session, topic_id: int) -> int:
+    result = await db_session.execute(
+        select(Vote).where(Vote.topic_id == topic_id).order_by(Vote.created_at)
+    )
+    return len(result.scalars().all())
+
+
+async def _aggregated(db_session, topic_id: int) -> dict[int, int]:
+    return await VoteCrud.count_by_vote_index_in_range(db_session, topic_id, None)
+
+
+async def _time_series_source(db_session, topic_id: int) -> int:
+    streamed = 0
+    async for _ in VoteCrud.stream_times_by_topic_id(db_session, topic_id):
+        streamed += 1
+    return streamed
+
+
+async def _measure(db_session, label: str, func, topic_id: int) -> tuple[dict, object]:
+    db_session.expunge_all()
+    tracemalloc.start()
+    started = time.perf_counter()
+    value = await func(db_session, topic_id)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db_session.expunge_all()
+    return {"path": label, "query_time_ms": elapsed_ms, "peak_memory_kib": peak / 1024}, value
+
+
+@pytest.mark.asyncio
+async def test_vote_statistics_benchmark(db_session, auth_user):
+    topic = await create_topic(
+        db_session, user_id=auth_user.user_id, vote_options=["A", "B", "C"]
+    )
+    await db_session.commit()
+    await _seed_votes(db_session, topic.topic_id, BENCHMARK_VOTE_COUNT)
+
+    rows = []
+    legacy_row, legacy_counts = await _measure(
+        db_session, "aggregated (before: ORM rows)", _legacy_aggregated, topic.topic_id
+    )
+    grouped_row, grouped_counts = await _measure(
+        db_session, "aggregated (after: GROUP BY)", _aggregated, topic.topic_id
+    )
+    legacy_series_row, legacy_series_count = await _measure(
+        db_session,
+        "time series source (before: ORM rows)",
+        _legacy_time_series_source,
+        topic.topic_id,
+    )
+    streamed_row, streamed_count = await _measure(
+        db_session,
+        "time series source (after: streamed tuples)",
+        _time_series_source,
+        topic.topic_id,
+    )
+    rows.extend([legacy_row, grouped_row, legacy_series_row, streamed_row])
+
+    print()
+    print(f"votes seeded: {BENCHMARK_VOTE_COUNT}")
+    print(
+        tabulate(
+            [
+                [row["path"], f"{row['query_time_ms']:.3f}", f"{row['peak_memory_kib']:.1f}"]
+                for row in rows
+            ],
+            headers=["path", "query_time_ms", "peak_memory_kib"],
+            tablefmt="grid",
+        )
+    )
+
+    assert grouped_counts == legacy_counts
+    assert sum(grouped_counts.values()) == BENCHMARK_VOTE_COUNT
+    assert streamed_count == legacy_series_count == BENCHMARK_VOTE_COUNT
+    assert grouped_row["peak_memory_kib"] < legacy_row["peak_memory_kib"]
+    assert streamed_row["peak_memory_kib"] < legacy_series_row["peak_memory_kib"]
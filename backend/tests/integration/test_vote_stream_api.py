@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.settings import settings
+from app.core.vote_stream import DELTAS_CHANNEL, VoteStreamHub, vote_stream_hub
+from app.services import VoteService
+from tests.factories import create_topic, create_user, create_vote
+from tests.streaming import StreamConnection, parse_event
+
+
+@pytest.fixture
+def vote_stream_settings():
+    previous = (
+        settings.vote_stream_flush_interval_seconds,
+        settings.vote_stream_max_subscribers,
+    )
+    settings.vote_stream_flush_interval_seconds = 0.05
+    yield settings
+    (
+        settings.vote_stream_flush_interval_seconds,
+        settings.vote_stream_max_subscribers,
+    ) = previous
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_snapshot_then_one_coalesced_delta(
+    client: AsyncClient, db_session, auth_user, set_auth_cookies, vote_stream_settings
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, vote_options=["A", "B"])
+    await create_vote(db_session, user_id=auth_user.user_id, topic_id=topic.topic_id, vote_index=0)
+    voters = [await create_user(db_session) for _ in range(3)]
+    await db_session.commit()
+    topic_id = topic.topic_id
+    voter_ids = [voter.user_id for voter in voters]
+    # Flushed by hand below so the three votes always land in one window.
+    vote_stream_settings.vote_stream_flush_interval_seconds = 60
+
+    async with StreamConnection(f"/votes/topic/{topic_id}/stream") as stream:
+        start = await stream.start()
+        assert start["status"] == 200
+        assert await stream.next_chunk() == "retry: 5000\n\n"
+        event, snapshot = parse_event(await stream.next_chunk())
+        assert event == "votes"
+        assert snapshot == {
+            "topic_id": topic_id,
+            "counts": {"0": {"count": 1, "percent": 100.0}, "1": {"count": 0, "percent": 0}},
+        }
+
+        for voter_id, vote_index in zip(voter_ids, (1, 1, 0)):
+            set_auth_cookies(client, voter_id)
+            response = await client.post(
+                "/votes", json={"topic_id": topic_id, "vote_index": vote_index}
+            )
+            assert response.status_code == 200
+
+        await vote_stream_hub.flush()
+        event, delta = parse_event(await stream.next_chunk())
+
+    assert event == "vote_delta"
+    assert delta == {"topic_id": topic_id, "deltas": {"0": 1, "1": 2}}
+    assert vote_stream_hub.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_unknown_topic_and_subscriber_overflow(
+    client: AsyncClient, db_session, auth_user, vote_stream_settings
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+
+    missing = await client.get("/votes/topic/999999/stream")
+    vote_stream_settings.vote_stream_max_subscribers = 0
+    full = await client.get(f"/votes/topic/{topic.topic_id}/stream")
+
+    assert missing.status_code == 404
+    assert vote_stream_hub.subscriber_count == 0
+    assert full.status_code == 503
+    assert full.json()["detail"] == "Too many vote result streams"
+
+
+@pytest.mark.asyncio
+async def test_vote_committed_while_the_snapshot_loads_is_streamed(
+    client: AsyncClient, db_session, auth_user, vote_stream_settings, monkeypatch
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, vote_options=["A", "B"])
+    await db_session.commit()
+    topic_id = topic.topic_id
+    vote_stream_settings.vote_stream_flush_interval_seconds = 60
+    get_live_counts = VoteService.get_live_counts
+
+    async def _snapshot_racing_a_vote(db, requested_topic_id):
+        snapshot = await get_live_counts(db, requested_topic_id)
+        vote_stream_hub.record(requested_topic_id, 1)
+        return snapshot
+
+    monkeypatch.setattr(VoteService, "get_live_counts", _snapshot_racing_a_vote)
+
+    async with StreamConnection(f"/votes/topic/{topic_id}/stream") as stream:
+        assert (await stream.start())["status"] == 200
+        await stream.next_chunk()
+        await stream.next_chunk()
+        await vote_stream_hub.flush()
+        event, delta = parse_event(await stream.next_chunk())
+
+    assert event == "vote_delta"
+    assert delta == {"topic_id": topic_id, "deltas": {"1": 1}}
+
+
+@pytest.mark.asyncio
+async def test_pending_deltas_flush_after_the_interval(vote_stream_settings):
+    hub = VoteStreamHub()
+    viewer = hub.subscribe(5)
+
+    hub.record(5, 1)
+    hub.record(5, 1)
+    assert viewer.queue.empty()
+    await asyncio.sleep(0.2)
+
+    assert viewer.queue.get_nowait() == {
+        "event": "vote_delta",
+        "data": {"topic_id": 5, "deltas": {"1": 2}},
+    }
+    assert viewer.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_votes_without_viewers_are_not_buffered():
+    hub = VoteStreamHub()
+
+    hub.record(1, 0)
+
+    assert hub._pending == {}
+    assert hub._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_flush_publishes_all_topics_in_one_redis_message():
+    class FakeRedis:
+        def __init__(self):
+            self.published: list[tuple[str, str]] = []
+
+        async def publish(self, channel: str, message: str) -> int:
+            self.published.append((channel, message))
+            return 1
+
+    fake_redis = FakeRedis()
+    hub = VoteStreamHub()
+    hub.redis_client = fake_redis
+    viewer = hub.subscribe(1)
+    for topic_id, vote_index in [(1, 0), (2, 1), (1, 0), (1, 2)]:
+        hub.record(topic_id, vote_index)
+
+    # Shutdown flushes whatever is still waiting for the timer.
+    await hub.stop()
+
+    [(channel, message)] = fake_redis.published
+    assert channel == DELTAS_CHANNEL
+    events = json.loads(message)
+    assert events == [
+        {"topic_id": 1, "deltas": {"0": 2, "2": 1}},
+        {"topic_id": 2, "deltas": {"1": 1}},
+    ]
+    # Subscribers are fed by the pub/sub listener, not by the publishing replica.
+    assert viewer.queue.empty()
+    hub.deliver(events)
+    assert viewer.queue.get_nowait() == {"event": "vote_delta", "data": events[0]}
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+from httpx import AsyncClient
+from tabulate import tabulate
+
+from app.core.settings import settings
+from app.core.vote_stream import vote_stream_hub
+from tests.factories import create_topic, create_user
+from tests.streaming import StreamConnection, parse_event
+
+SUBSCRIBERS = int(os.getenv("VOTE_STREAM_LOAD_SUBSCRIBERS", "1000"))
+VOTES = int(os.getenv("VOTE_STREAM_LOAD_VOTES", "50"))
+# Subscribers are connected in batches so each snapshot read competes with a bounded
+# number of others, whatever SUBSCRIBERS is.
+CONNECT_BATCH = int(os.getenv("VOTE_STREAM_LOAD_CONNECT_BATCH", "50"))
+STREAM_TIMEOUT_SECONDS = 10
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS") != "1",
+    reason="set RUN_BENCHMARKS=1 to run the live vote stream load harness",
+)
+
+
+async def _poll_round(client: AsyncClient, topic_id: int) -> tuple[float, int]:
+    # Pre-change behaviour: every viewer refreshes the aggregate to see new votes.
+    started = time.perf_counter()
+    responses = await asyncio.gather(
+        *(
+            client.get(
+                f"/votes/topic/{topic_id}",
+                params={"time_range": "all"},
+                headers={"X-Perf-Debug": "1"},
+            )
+            for _ in range(SUBSCRIBERS)
+        )
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return elapsed_ms, sum(int(response.headers["X-Perf-Query-Count"]) for response in responses)
+
+
+async def _connect(stream: StreamConnection) -> None:
+    await stream.__aenter__()
+    await stream.start()
+    await stream.next_chunk()
+    await stream.next_chunk()
+
+
+async def _drain_deltas(stream: StreamConnection, expected_votes: int) -> int:
+    received_votes = 0
+    events = 0
+    while received_votes < expected_votes:
+        chunk = await asyncio.wait_for(stream.next_chunk(), timeout=30)
+        if chunk.startswith(":"):
+            continue
+        event, data = parse_event(chunk)
+        assert event == "vote_delta"
+        received_votes += sum(data["deltas"].values())
+        events += 1
+    return events
+
+
+@pytest.mark.asyncio
+async def test_vote_stream_fan_out_load(client: AsyncClient, db_session, auth_user, set_auth_cookies):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, vote_options=["A", "B", "C"])
+    voters = [await create_user(db_session) for _ in range(VOTES)]
+    await db_session.commit()
+    topic_id = topic.topic_id
+    voter_ids = [voter.user_id for voter in voters]
+
+    poll_ms, poll_queries = await _poll_round(client, topic_id)
+
+    streams = [
+        StreamConnection(f"/votes/topic/{topic_id}/stream", timeout=STREAM_TIMEOUT_SECONDS)
+        for _ in range(SUBSCRIBERS)
+    ]
+    connect_started = time.perf_counter()
+    for batch_start in range(0, SUBSCRIBERS, CONNECT_BATCH):
+        await asyncio.gather(
+            *(_connect(stream) for stream in streams[batch_start : batch_start + CONNECT_BATCH])
+        )
+    connect_ms = (time.perf_counter() - connect_started) * 1000
+    assert vote_stream_hub.subscriber_count == SUBSCRIBERS
+
+    try:
+        started = time.perf_counter()
+        for index, voter_id in enumerate(voter_ids):
+            set_auth_cookies(client, voter_id)
+            response = await client.post(
+                "/votes", json={"topic_id": topic_id, "vote_index": index % 3}
+            )
+            assert response.status_code == 200
+        client.cookies.clear()
+        event_counts = await asyncio.gather(
+            *(_drain_deltas(stream, len(voter_ids)) for stream in streams)
+        )
+        fan_out_ms = (time.perf_counter() - started) * 1000
+    finally:
+        for stream in streams:
+            await stream.__aexit__(None, None, None)
+
+    print()
+    print(
+        f"subscribers: {SUBSCRIBERS}, votes: {VOTES}, "
+        f"flush interval: {settings.vote_stream_flush_interval_seconds}s"
+    )
+    print(
+        tabulate(
+            [
+                ["poll (before): one refresh by every viewer", f"{poll_ms:.1f}", poll_queries, "-"],
+                ["stream: open connections + snapshot", f"{connect_ms:.1f}", "-", "-"],
+                [
+                    f"stream (after): {VOTES} votes cast and fanned out",
+                    f"{fan_out_ms:.1f}",
+                    0,
+                    max(event_counts),
+                ],
+            ],
+            headers=["path", "elapsed_ms", "db_queries", "events_per_viewer"],
+            tablefmt="grid",
+        )
+    )
+
+    assert poll_queries >= SUBSCRIBERS
+    # Coalescing: each viewer gets far fewer events than there were votes.
+    assert max(event_counts) < VOTES
+    assert vote_stream_hub.subscriber_count == 0
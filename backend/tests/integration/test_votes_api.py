@@ -5,8 +5,12 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from sqlalchemy.exc import IntegrityError
 
-from app.db.crud import VoteCrud
-from tests.factories import create_topic
+from sqlalchemy import select
+
+from app.db.crud import VoteBucketCrud, VoteCrud
+from app.db.models import VoteBucket
+from app.services import VoteService
+from tests.factories import create_topic, create_user, create_vote
 
 
 @pytest.mark.asyncio
@@ -126,3 +130,125 @@ async def test_vote_duplicate_integrity_error_returns_400(
 
     assert response.status_code == 400
     assert response.json()["detail"] == "이미 투표한 토픽입니다."
+
+
+@pytest.mark.asyncio
+async def test_vote_time_series_reads_minute_buckets(
+    authenticated_client, db_session, auth_user
+):
+    topic = await create_topic(
+        db_session,
+        user_id=auth_user.user_id,
+        vote_options=["A", "B"],
+        created_at=datetime.now(timezone.utc) - timedelta(hours=3),
+    )
+    earlier_voter = await create_user(db_session)
+    await create_vote(
+        db_session,
+        user_id=earlier_voter.user_id,
+        topic_id=topic.topic_id,
+        vote_index=1,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=2),
+    )
+    await VoteService.rebuild_buckets(db_session, topic.topic_id)
+    await db_session.commit()
+
+    response = await authenticated_client.post(
+        "/votes",
+        json={"topic_id": topic.topic_id, "vote_index": 0},
+    )
+    assert response.status_code == 200
+
+    buckets = (
+        await db_session.execute(
+            select(VoteBucket).where(VoteBucket.topic_id == topic.topic_id)
+        )
+    ).scalars().all()
+    assert sorted((bucket.vote_index, bucket.vote_count) for bucket in buckets) == [(0, 1), (1, 1)]
+
+    all_time = await authenticated_client.get(
+        f"/votes/topic/{topic.topic_id}",
+        params={"time_range": "all", "interval": "30m"},
+    )
+    last_hour = await authenticated_client.get(
+        f"/votes/topic/{topic.topic_id}",
+        params={"time_range": "1h", "interval": "5m"},
+    )
+
+    assert all_time.status_code == 200
+    all_time_points = list(all_time.json().values())
+    assert all_time_points[0]["1"]["count"] == 0
+    assert all_time_points[-1]["0"]["count"] == 1
+    assert all_time_points[-1]["1"]["count"] == 1
+
+    assert last_hour.status_code == 200
+    last_hour_points = list(last_hour.json().values())
+    assert last_hour_points[-1]["0"]["count"] == 1
+    assert last_hour_points[-1]["1"]["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_vote_sub_minute_series_and_aggregated_range_use_raw_votes(
+    authenticated_client, db_session, auth_user
+):
+    topic = await create_topic(db_session, user_id=auth_user.user_id, vote_options=["A", "B"])
+    recent_voter = await create_user(db_session)
+    old_voter = await create_user(db_session)
+    await create_vote(
+        db_session,
+        user_id=recent_voter.user_id,
+        topic_id=topic.topic_id,
+        vote_index=1,
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=2),
+    )
+    await create_vote(
+        db_session,
+        user_id=old_voter.user_id,
+        topic_id=topic.topic_id,
+        vote_index=0,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=2),
+    )
+    await db_session.commit()
+
+    series = await authenticated_client.get(
+        f"/votes/topic/{topic.topic_id}",
+        params={"time_range": "5m", "interval": "30s"},
+    )
+    aggregated = await authenticated_client.get(
+        f"/votes/topic/{topic.topic_id}",
+        params={"time_range": "1h"},
+    )
+
+    assert series.status_code == 200
+    points = list(series.json().values())
+    assert len(points) == 10
+    assert points[0]["1"]["count"] == 0
+    assert points[-1]["1"]["count"] == 1
+    assert points[-1]["0"]["count"] == 0
+
+    assert aggregated.status_code == 200
+    assert aggregated.json() == {
+        "0": {"count": 0, "percent": 0},
+        "1": {"count": 1, "percent": 100.0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_vote_bucket_increment_without_native_upsert(db_session, auth_user):
+    topic = await create_topic(db_session, user_id=auth_user.user_id)
+    await db_session.commit()
+    bucket_start = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    values = {
+        "topic_id": topic.topic_id,
+        "bucket_start": bucket_start,
+        "vote_index": 1,
+        "vote_count": 1,
+    }
+
+    for _ in range(3):
+        await VoteBucketCrud._increment_portable(db_session, values)
+    await db_session.commit()
+
+    assert await VoteBucketCrud.get_counts_by_topic_id(db_session, topic.topic_id) == [
+        (bucket_start.replace(tzinfo=None), 1, 3)
+    ]
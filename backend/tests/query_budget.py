@@ -0,0 +1,65 @@
+"""``@pytest.mark.query_budget(n)``: fail a test when one of its requests runs more than n SQL statements.
+
+Requests are captured through ``app.perf``'s engine hooks, so no ``X-Perf-Debug``
+header is needed. Only ``GET`` requests are checked unless ``methods=`` is given,
+which keeps setup writes made through the client out of a read endpoint's budget.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.perf import (
+    RequestPerfStats,
+    add_request_observer,
+    duplicate_fingerprints,
+    remove_request_observer,
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries, methods=('GET',)): "
+        "fail when a request made by the test runs more than max_queries SQL statements",
+    )
+
+
+def _format_request(stats: RequestPerfStats, max_queries: int) -> str:
+    lines = [f"{stats.method} {stats.route}: {stats.query_count} queries (budget {max_queries})"]
+    duplicates = duplicate_fingerprints(stats)
+    if duplicates:
+        lines.append("  repeated statements (possible N+1):")
+        lines.extend(f"    {count}x {fingerprint}" for fingerprint, count in duplicates)
+    return "\n".join(lines)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    max_queries = marker.args[0] if marker.args else marker.kwargs["max_queries"]
+    methods = set(marker.kwargs.get("methods", ("GET",)))
+    captured: list[RequestPerfStats] = []
+    observer = captured.append
+    add_request_observer(observer)
+    try:
+        result = yield
+    finally:
+        remove_request_observer(observer)
+
+    checked = [stats for stats in captured if stats.method in methods]
+    if not checked:
+        pytest.fail(
+            f"query_budget: no {'/'.join(sorted(methods))} request was captured", pytrace=False
+        )
+    over_budget = [stats for stats in checked if stats.query_count > max_queries]
+    if over_budget:
+        pytest.fail(
+            "query budget exceeded\n"
+            + "\n".join(_format_request(stats, max_queries) for stats in over_budget),
+            pytrace=False,
+        )
+    return result
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from app.core.jwt_handler import create_access_token
+from main import app
+
+
+class StreamConnection:
+    """Drives the ASGI app directly; httpx's ASGITransport buffers whole responses."""
+
+    def __init__(self, path: str, *, user_id: int | None = None, timeout: float = 2):
+        self.path = path
+        self.user_id = user_id
+        self.timeout = timeout
+        self.messages: asyncio.Queue[dict] = asyncio.Queue()
+        self._disconnected = asyncio.Event()
+        self._request_sent = False
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "StreamConnection":
+        headers = [(b"host", b"testserver")]
+        if self.user_id is not None:
+            token = create_access_token(self.user_id)
+            headers.append((b"cookie", f"access_token={token}".encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": self.path,
+            "raw_path": self.path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        self._task = asyncio.create_task(app(scope, self._receive, self.messages.put))
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._disconnected.set()
+        await asyncio.wait_for(self._task, timeout=self.timeout)
+
+    async def _receive(self) -> dict:
+        if not self._request_sent:
+            self._request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self._disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def start(self) -> dict:
+        return await asyncio.wait_for(self.messages.get(), timeout=self.timeout)
+
+    async def next_chunk(self) -> str:
+        message = await asyncio.wait_for(self.messages.get(), timeout=self.timeout)
+        return message["body"].decode()
+
+
+def parse_event(chunk: str) -> tuple[str, dict]:
+    lines = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    return lines["event"], json.loads(lines["data"])
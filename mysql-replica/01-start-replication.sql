@@ -0,0 +1,10 @@
+-- Runs once when the db-replica volume is first initialised.
+CHANGE REPLICATION SOURCE TO
+  SOURCE_HOST = 'db',
+  SOURCE_PORT = 3306,
+  SOURCE_USER = 'root',
+  SOURCE_PASSWORD = 'root_password',
+  SOURCE_AUTO_POSITION = 1,
+  SOURCE_CONNECT_RETRY = 5,
+  GET_SOURCE_PUBLIC_KEY = 1;
+START REPLICA;